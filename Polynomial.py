@@ -3,17 +3,102 @@
 # Version: 2.4 - integer tick increments & continuous plot
 import re
 import math
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+
+PARSE_CACHE_SIZE = 65536  # distinct formulas remembered by the parser
+
+# One polynomial term: optional sign, then either [coef] x [^ or ** exp] or a
+# constant. Numbers are plain decimals with an optional unsigned exponent,
+# i.e. exactly what the original parser accepts once it has split on +/-.
+_NUM = r'(?:\d+\.?\d*|\.\d+)(?:[eE]\d+)?'
+_TERM_RE = re.compile(
+    r'(\s*([+-]?)\s*(?:(' + _NUM + r')?\s*[xX](?:\s*(?:\^|\*\*)\s*(\d+))?|(' + _NUM + r'))\s*)'
+)
+
 
 def _parse_polynomial_input(s: str):
     """Parse a user-friendly polynomial string into a list of coefficients
     highest-degree first.
 
     Supports multiple occurrences of the same power (they are summed).
-    Returns a list of floats [a_n, ..., a_0].
+    Returns a list of floats [a_n, ..., a_0]. Results are memoized in an
+    LRU cache of `PARSE_CACHE_SIZE` formulas; each call gets its own list.
     """
     if not isinstance(s, str):
         raise TypeError("Input must be a string")
+    return list(_parse_polynomial_cached(s))
+
+
+def parse_polynomials(formulas):
+    """Lazily parse an iterable of formula strings, yielding coefficient lists."""
+    for s in formulas:
+        yield _parse_polynomial_input(s)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_polynomial_cached(s):
+    return tuple(_parse_polynomial_uncached(s))
 
+
+def _parse_polynomial_uncached(s):
+    coeffs = _scan_polynomial(s)
+    if coeffs is None:
+        coeffs = _parse_polynomial_legacy(s)
+    return coeffs
+
+
+def _scan_polynomial(s):
+    """Single-pass tokenizer for well-formed formulas.
+
+    Returns the coefficient list, or None when `s` is not a plain formula
+    (coefficient lists, odd spacing or anything invalid); those inputs go
+    through `_parse_polynomial_legacy` so results and errors stay the same.
+    """
+    terms = _scan_terms(s)
+    if terms is None:
+        return None
+    max_exp = max(terms)
+    while max_exp > 0 and abs(terms.get(max_exp, 0.0)) < 1e-12:
+        max_exp -= 1
+    return [terms.get(e, 0.0) for e in range(max_exp, -1, -1)]
+
+
+def _scan_terms(s, number=float):
+    """Tokenize `s` into an {exponent: coefficient} dict, or None (see above).
+
+    Coefficients are built with `number` (float, or Fraction for exact use).
+    """
+    if 'x' not in s and 'X' not in s:
+        return None
+    found = _TERM_RE.findall(s)
+    # non-overlapping matches whose lengths add up to len(s) cover all of it
+    if sum(len(t[0]) for t in found) != len(s):
+        return None
+    zero, one = number(0), number(1)
+    terms = {}
+    for i, (_, sign, coef, exp, const) in enumerate(found):
+        if not sign and i:
+            return None  # terms must be joined by + or -
+        if const:
+            e = 0
+            c = number(sign + const)
+        else:
+            e = int(exp) if exp else 1
+            if coef:
+                c = number(sign + coef)
+            else:
+                c = -one if sign == '-' else one
+        terms[e] = terms.get(e, zero) + c
+    return terms
+
+
+def _parse_polynomial_legacy(s: str):
+    """Original multi-pass parser; handles everything `_scan_polynomial`
+    declines, including plain coefficient lists and all error reporting.
+    """
     s = s.strip()
     if not s:
         raise ValueError("Empty input")
@@ -88,10 +173,452 @@ def _parse_polynomial_input(s: str):
     return coeffs
 
 
-def polynomial_grapher(coefficient):
+def _ipow(x, n):
+    """Return x**n for an integer n >= 0 by exponentiation by squaring.
+
+    Works for floats, Fractions and numpy arrays alike.
+    """
+    result = None
+    base = x
+    while n:
+        if n & 1:
+            result = base if result is None else result * base
+        n >>= 1
+        if n:
+            base = base * base
+    return x ** 0 if result is None else result
+
+
+class SparsePolynomial:
+    """Polynomial stored as (exponent, coefficient) pairs, highest exponent first.
+
+    Only nonzero terms are kept, so `x^100000 + 1` is two pairs instead of
+    100001 floats. Instances are callable on floats and numpy arrays.
+    """
+
+    __slots__ = ("terms",)
+
+    def __init__(self, terms):
+        merged = {}
+        for e, c in (terms.items() if isinstance(terms, dict) else terms):
+            e = int(e)
+            if e < 0:
+                raise ValueError("Exponents must be non-negative integers")
+            merged[e] = merged.get(e, 0.0) + float(c)
+        pairs = [(e, c) for e, c in sorted(merged.items(), reverse=True) if c != 0.0]
+        # same rule as the dense parser: drop negligible leading terms
+        while pairs and abs(pairs[0][1]) < 1e-12:
+            pairs.pop(0)
+        self.terms = tuple(pairs)
+
+    @classmethod
+    def from_dense(cls, coeffs):
+        """Build from a dense coefficient list (highest-degree first)."""
+        degree = len(coeffs) - 1
+        return cls((degree - i, c) for i, c in enumerate(coeffs) if c != 0)
+
+    def to_dense(self):
+        """Return the dense coefficient list (highest-degree first)."""
+        coeffs = [0.0] * (self.degree + 1)
+        for e, c in self.terms:
+            coeffs[self.degree - e] = c
+        return coeffs
+
+    @property
+    def degree(self):
+        return self.terms[0][0] if self.terms else 0
+
+    @property
+    def leading(self):
+        return self.terms[0][1] if self.terms else 0.0
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __eq__(self, other):
+        if not isinstance(other, SparsePolynomial):
+            return NotImplemented
+        return self.terms == other.terms
+
+    def __hash__(self):
+        return hash(self.terms)
+
+    def __repr__(self):
+        return f"SparsePolynomial({list(self.terms)!r})"
+
+    def __call__(self, x):
+        """Evaluate with a sparse Horner scheme: x**gap per term, by squaring."""
+        terms = self.terms
+        if not terms:
+            return 0.0 * x
+        e_prev, acc = terms[0]
+        acc = acc * _ipow(x, 0)  # broadcast to the shape of x
+        for e, c in terms[1:]:
+            acc = acc * _ipow(x, e_prev - e) + c
+            e_prev = e
+        if e_prev:
+            acc = acc * _ipow(x, e_prev)
+        return acc
+
+    def deriv(self):
+        return SparsePolynomial((e - 1, c * e) for e, c in self.terms if e > 0)
+
+    def real_roots(self, lo=-math.inf, hi=math.inf):
+        """Return the sorted distinct real roots in [lo, hi], working on the
+        reduced sparse form.
+
+        A factor x**k is split off (root 0) and the remaining exponents are
+        divided by their gcd g, so `x^100000 - 2` becomes degree 1. A
+        reduced form that is still sparse is solved on its terms by
+        `poly_roots.sparse_real_roots`, whose cost grows with the number of
+        terms rather than the degree; only one that fills at least a
+        quarter of its dense list goes to `poly_roots.real_roots`.
+        """
+        terms = self.terms
+        if not terms:
+            return []
+        low = terms[-1][0]
+        roots = [0.0] if low > 0 else []
+        g = 0
+        for e, _ in terms:
+            g = math.gcd(g, e - low)
+        if g == 0:
+            return [r for r in roots if lo <= r <= hi]
+        reduced = SparsePolynomial(((e - low) // g, c) for e, c in terms)
+        if g == 1:
+            roots.extend(reduced._solve(lo, hi))
+        else:
+            for y in reduced._solve():
+                if g % 2:
+                    roots.append(math.copysign(abs(y) ** (1.0 / g), y))
+                elif y > 0:
+                    r = y ** (1.0 / g)
+                    roots.extend((r, -r))
+        return sorted(r for r in roots if lo <= r <= hi)
+
+    def _solve(self, lo=-math.inf, hi=math.inf):
+        from poly_roots import real_roots, sparse_real_roots
+
+        if 4 * len(self.terms) <= self.degree + 1:
+            return sparse_real_roots(self.terms, lo, hi)
+        return real_roots(self.to_dense(), lo, hi)
+
+
+def parse_sparse(s: str):
+    """Parse a formula or coefficient string into a `SparsePolynomial`.
+
+    Well-formed formulas never go through a dense list, so `x^100000 + 1`
+    stays two terms. Results are memoized like `_parse_polynomial_input`.
+    """
+    if not isinstance(s, str):
+        raise TypeError("Input must be a string")
+    return _parse_sparse_cached(s)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_sparse_cached(s):
+    terms = _scan_terms(s)
+    if terms is None:
+        return SparsePolynomial.from_dense(_parse_polynomial_input(s))
+    return SparsePolynomial(terms)
+
+
+def _adaptive_sample(f, xmin, xmax, px_per_x, px_per_y, y_view=None,
+                     pixel_tol=0.5, init_pts=33, max_depth=14):
+    """Sample `f` on [xmin, xmax] densely only where a straight line would be off.
+
+    Starts from `init_pts` evenly spaced points and repeatedly bisects the
+    segments whose midpoint deviates from the chord by more than `pixel_tol`
+    screen pixels (`px_per_x` / `px_per_y` convert data units to pixels).
+    If `y_view` = (ymin, ymax) is given, values far outside the view are
+    clipped before measuring so off-screen parts are not refined.
+    Returns (x, y) numpy arrays sorted by x.
+    """
+    import numpy as np
+
+    x = np.linspace(xmin, xmax, max(2, int(init_pts)))
+    y = np.asarray(f(x), dtype=float)
+    if y_view is not None:
+        span = y_view[1] - y_view[0]
+        lo, hi = y_view[0] - span, y_view[1] + span
+    active = np.ones(len(x) - 1, dtype=bool)
+
+    for _ in range(max_depth):
+        seg = np.nonzero(active)[0]
+        if seg.size == 0:
+            break
+        # segments already narrower than the tolerance cannot improve visually
+        seg = seg[(x[seg + 1] - x[seg]) * px_per_x > pixel_tol]
+        if seg.size == 0:
+            break
+        xm = 0.5 * (x[seg] + x[seg + 1])
+        ym = np.asarray(f(xm), dtype=float)
+        y0, y1, yc = y[seg], y[seg + 1], ym
+        if y_view is not None:
+            y0, y1, yc = np.clip(y0, lo, hi), np.clip(y1, lo, hi), np.clip(yc, lo, hi)
+        err = np.abs(yc - 0.5 * (y0 + y1)) * px_per_y
+        refine = ~(err <= pixel_tol)  # also refines around non-finite values
+        if not refine.any():
+            break
+        seg, xm, ym = seg[refine], xm[refine], ym[refine]
+
+        # both halves of a refined segment stay active for the next pass
+        counts = np.ones(len(x) - 1, dtype=np.intp)
+        counts[seg] = 2
+        flags = np.zeros(len(x) - 1, dtype=bool)
+        flags[seg] = True
+        active = np.repeat(flags, counts)
+        x = np.insert(x, seg + 1, xm)
+        y = np.insert(y, seg + 1, ym)
+    return x, y
+
+
+def _pixel_scales(ax):
+    """Return (pixels per x unit, pixels per y unit) for the current view of `ax`."""
+    bbox = ax.get_window_extent()
+    xm, xM = ax.get_xlim()
+    ym, yM = ax.get_ylim()
+    px_x = bbox.width / (xM - xm) if xM != xm else 1.0
+    px_y = bbox.height / (yM - ym) if yM != ym else 1.0
+    return abs(px_x), abs(px_y)
+
+
+class SampleCache:
+    """LRU cache of curve samples split into fixed-width tiles per zoom level.
+
+    A view [xmin, xmax] maps to zoom level floor(log2(span / tiles_per_view))
+    and is covered by tiles of width 2**level, keyed by (level, tile index).
+    Tiles are produced by `sampler(x0, x1, view_span)`, where `view_span`
+    is the narrowest view that can use that level, so samples taken once
+    stay accurate for every view at the same level.
+    """
+
+    def __init__(self, sampler, tiles_per_view=4, max_tiles=256):
+        if tiles_per_view < 1 or max_tiles < 1:
+            raise ValueError("tiles_per_view and max_tiles must be positive")
+        self._sampler = sampler
+        self._tiles = OrderedDict()
+        self.tiles_per_view = int(tiles_per_view)
+        self.max_tiles = int(max_tiles)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._tiles)
+
+    def info(self):
+        """Return a dict with hit/miss counters and the current tile count."""
+        return {"hits": self.hits, "misses": self.misses,
+                "tiles": len(self._tiles), "max_tiles": self.max_tiles}
+
+    def clear(self):
+        self._tiles.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _tile(self, level, index):
+        key = (level, index)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self.hits += 1
+            self._tiles.move_to_end(key)
+            return tile
+        self.misses += 1
+        width = 2.0 ** level
+        tile = self._sampler(index * width, (index + 1) * width,
+                             self.tiles_per_view * width)
+        self._tiles[key] = tile
+        while len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def sample(self, xmin, xmax):
+        """Return (x, y) samples covering at least [xmin, xmax]."""
+        import numpy as np
+
+        span = xmax - xmin
+        if not span > 0:
+            raise ValueError("xmax must be greater than xmin")
+        level = math.floor(math.log2(span / self.tiles_per_view))
+        width = 2.0 ** level
+        first = math.floor(xmin / width)
+        last = math.floor(xmax / width)
+        xs, ys = [], []
+        for i in range(first, last + 1):
+            tx, ty = self._tile(level, i)
+            # neighbouring tiles share their boundary sample
+            start = 1 if xs else 0
+            xs.append(tx[start:])
+            ys.append(ty[start:])
+        return np.concatenate(xs), np.concatenate(ys)
+
+
+class _Debouncer:
+    """Coalesce a burst of calls into a single `callback()` once the canvas
+    has been quiet for `delay_ms`. With `delay_ms <= 0` calls run at once.
+    """
+
+    def __init__(self, canvas, delay_ms, callback):
+        self._callback = callback
+        self._timer = None
+        self.pending = False
+        if delay_ms > 0:
+            self._timer = canvas.new_timer(interval=int(delay_ms))
+            self._timer.single_shot = True
+            self._timer.add_callback(self._fire)
+
+    def __call__(self):
+        if self._timer is None:
+            self._callback()
+            return
+        self.pending = True
+        self._timer.stop()
+        self._timer.start()
+
+    def _fire(self):
+        if self.pending:
+            self.pending = False
+            self._callback()
+
+    def flush(self):
+        """Run a pending call now instead of waiting for the timer."""
+        if self._timer is not None:
+            self._timer.stop()
+        self._fire()
+
+
+class _RateLimiter:
+    """Call `callback(arg)` at most `fps` times per second.
+
+    Calls arriving too early are not dropped: the latest argument is kept
+    and delivered by a canvas timer when the interval is over. With
+    `fps <= 0` every call goes straight through.
+    """
+
+    def __init__(self, canvas, fps, callback):
+        self._callback = callback
+        self._interval = 1.0 / fps if fps > 0 else 0.0
+        self._last = float("-inf")
+        self._arg = None
+        self.pending = False
+        self._timer = None
+        if self._interval > 0:
+            self._timer = canvas.new_timer(interval=max(1, int(1000 * self._interval)))
+            self._timer.single_shot = True
+            self._timer.add_callback(self._fire)
+
+    def __call__(self, arg):
+        now = time.perf_counter()
+        if self._timer is None or now - self._last >= self._interval:
+            if self._timer is not None:
+                self._timer.stop()
+            self.pending = False
+            self._last = now
+            self._callback(arg)
+            return
+        self._arg = arg
+        if not self.pending:
+            self.pending = True
+            self._timer.start()
+
+    def _fire(self):
+        if self.pending:
+            self.pending = False
+            self._last = time.perf_counter()
+            arg, self._arg = self._arg, None
+            self._callback(arg)
+
+
+def _as_sparse(coefficient):
+    """Return `coefficient` (list/tuple, formula string or SparsePolynomial) as a SparsePolynomial."""
+    if isinstance(coefficient, SparsePolynomial):
+        return coefficient
+    if isinstance(coefficient, str):
+        return parse_sparse(coefficient)
+    if isinstance(coefficient, (list, tuple)):
+        if len(coefficient) == 0:
+            raise ValueError("Empty coefficient list")
+        return SparsePolynomial.from_dense([float(c) for c in coefficient])
+    raise TypeError("coefficient must be a list/tuple/str of numbers or formula")
+
+
+def _view_ylim(p, x_min, x_max, crit):
+    """Y limits showing all of `p` over [x_min, x_max], with a margin.
+
+    A polynomial's extremes on an interval are at the ends or at critical
+    points, so evaluating `p` there gives the exact min and max without
+    sampling. `crit` is the sorted list of real critical points; only the
+    ones inside the window are evaluated, found by bisection, so this is
+    cheap enough to call on every zoom. Values that overflow are ignored.
+    """
+    lo = bisect_left(crit, x_min)
+    hi = bisect_right(crit, x_max)
+    values = [p(x) for x in (x_min, x_max, *crit[lo:hi])]
+    finite = [float(v) for v in values if math.isfinite(v)]
+    if not finite:
+        raise RuntimeError("Polynomial evaluation produced no finite values in the plotting window.")
+    y_low, y_high = min(finite), max(finite)
+    y_margin = max(1.0, 0.12 * (y_high - y_low)) if y_high != y_low else 1.0
+    y_min = y_low - y_margin
+    y_max = y_high + y_margin
+    if abs(y_max - y_min) < 1e-3:
+        y_min -= 1.0
+        y_max += 1.0
+    return y_min, y_max
+
+
+class _AxisArrows:
+    """Arrowheads at both ends of the x axis (y=0) and the y axis (x=0).
+
+    The four annotation artists are created once; `update()` moves them to
+    the current view limits instead of adding new artists on every zoom.
+    """
+
+    def __init__(self, ax, size=12, color='k'):
+        self.ax = ax
+        self.arrows = [
+            ax.annotate('', xy=(0, 0), xytext=(0, 0),
+                        arrowprops=dict(arrowstyle='-|>', mutation_scale=size, color=color))
+            for _ in range(4)
+        ]
+        self.update()
+
+    def update(self):
+        xm, xM = self.ax.get_xlim()
+        ym, yM = self.ax.get_ylim()
+        dx = 0.02 * (xM - xm)
+        dy = 0.02 * (yM - ym)
+        ends = [
+            ((xM + dx, 0), (xM, 0)),  # right end of x-axis
+            ((xm - dx, 0), (xm, 0)),  # left end
+            ((0, yM + dy), (0, yM)),  # top of y-axis
+            ((0, ym - dy), (0, ym)),  # bottom
+        ]
+        for arrow, (head, tail) in zip(self.arrows, ends):
+            arrow.xy = head
+            arrow.xyann = tail
+
+
+def polynomial_grapher(coefficient, pixel_tol=0.5, cache_tiles=256,
+                       scroll_debounce_ms=60, hover_fps=60, autoscale_y=False):
     """Plot a polynomial with Desmos-like visuals, centered on x-intercepts.
     Continuous curve and integer tick increments on both axes.
     Starts with a 10-unit range view and supports mouse-wheel zooming.
+
+    The curve is sampled adaptively: segments are bisected only until the
+    drawn polyline is within `pixel_tol` screen pixels of the polynomial.
+    Samples are kept in a `SampleCache` of at most `cache_tiles` tiles so
+    zooming back into an already viewed area reuses them; it is available
+    as `fig.sample_cache` on the returned figure.
+
+    Bursts of wheel ticks only move the view; the curve is recomputed once
+    the wheel has been idle for `scroll_debounce_ms`. The hover readout is
+    refreshed at most `hover_fps` times per second and blitted on its own
+    instead of redrawing the whole canvas.
+
+    The y limits fit the curve exactly, from its values at the window ends
+    and at the critical points inside it. With `autoscale_y` every zoom
+    refits them the same way instead of scaling y around the pointer.
     """
     try:
         import numpy as np
@@ -99,32 +626,19 @@ def polynomial_grapher(coefficient):
     except Exception as exc:
         raise RuntimeError("This function requires numpy and matplotlib") from exc
 
-    # Normalize input to a list of floats (highest-degree first)
-    if isinstance(coefficient, str):
-        coeffs = _parse_polynomial_input(coefficient)
-    elif isinstance(coefficient, (list, tuple)):
-        coeffs = [float(c) for c in coefficient]
-    else:
-        raise TypeError("coefficient must be a list/tuple/str of numbers or formula")
-
-    if len(coeffs) == 0:
-        raise ValueError("Empty coefficient list")
+    # Normalize input to a sparse polynomial (only nonzero terms are kept)
+    p = _as_sparse(coefficient)
 
-    # Build polynomial object
-    p = np.poly1d(coeffs)
-    degree = p.order
-    leading = coeffs[0]
+    degree = p.degree
+    leading = p.leading
 
     # Find real roots
-    roots = np.roots(coeffs)
-    real_roots = sorted([r.real for r in roots if abs(r.imag) < 1e-9 and np.isfinite(r.real)])
+    real_roots = p.real_roots()
 
     # Find real critical points (derivative roots)
     real_crit = []
     if degree >= 1:
-        dp = p.deriv()
-        crit = np.roots(dp)
-        real_crit = sorted([c.real for c in crit if abs(c.imag) < 1e-9 and np.isfinite(c.real)])
+        real_crit = p.deriv().real_roots()
 
     # Determine center_x (but we'll still start at origin)
     if real_roots:
@@ -139,23 +653,7 @@ def polynomial_grapher(coefficient):
     x_min = -initial_half_span
     x_max = initial_half_span
     
-    # Create dense sampling for high-quality curve
-    num_pts = 8000 if degree >= 3 else 4000
-    x = np.linspace(x_min, x_max, num_pts)
-    y = p(x)
-
-    # Calculate y limits based on this view
-    finite = np.isfinite(y)
-    if not finite.any():
-        raise RuntimeError("Polynomial evaluation produced no finite values on the plotting grid.")
-    y_finite = y[finite]
-    y_low, y_high = np.percentile(y_finite, [1, 99])
-    y_margin = max(1.0, 0.12 * (y_high - y_low)) if y_high != y_low else 1.0
-    y_min = y_low - y_margin
-    y_max = y_high + y_margin
-    if abs(y_max - y_min) < 1e-3:
-        y_min -= 1.0
-        y_max += 1.0
+    y_min, y_max = _view_ylim(p, x_min, x_max, real_crit)
 
     # Use a locator that forces integer ticks but limits the total number of ticks
     import matplotlib.ticker as mticker
@@ -167,6 +665,29 @@ def polynomial_grapher(coefficient):
     fig, ax = plt.subplots(figsize=(10, 6))
     fig.patch.set_facecolor("white")
     ax.set_facecolor("white")
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(y_min, y_max)
+
+    # Sample only as densely as the current view needs, tile by tile
+    tiles_per_view = 4
+    # a polynomial with t terms has at most 2t - 1 real roots, so sparse
+    # high-degree inputs need no more initial points than dense low ones
+    wiggles = min(degree, 2 * len(p))
+    init_pts = max(9, (4 * wiggles + 1) // tiles_per_view)
+
+    def _sample_tile(x0, x1, view_span):
+        # use the pixel scale of the narrowest view sharing this zoom level
+        bbox = ax.get_window_extent()
+        px_x, px_y = _pixel_scales(ax)
+        px_x_tile = bbox.width / view_span
+        return _adaptive_sample(p, x0, x1, px_x_tile, px_y * px_x_tile / px_x,
+                                pixel_tol=pixel_tol, init_pts=init_pts)
+
+    cache = SampleCache(_sample_tile, tiles_per_view=tiles_per_view, max_tiles=cache_tiles)
+    fig.sample_cache = cache
+    _sample_view = cache.sample
+
+    x, y = _sample_view(x_min, x_max)
 
     # Glow effect: multiple plotted lines with increasing linewidth and lower alpha
     base_color = (0.0, 0.4, 0.8)  # blue
@@ -187,25 +708,8 @@ def polynomial_grapher(coefficient):
     ax.set_xlim(x_min, x_max)
     ax.set_ylim(y_min, y_max)
 
-    # Draw arrowheads on axes
-    def _draw_axis_arrow(ax, axis='x', size=12, color='k'):
-        xm, xM = ax.get_xlim()
-        ym, yM = ax.get_ylim()
-        if axis == 'x':
-            # arrow at right end of x-axis (y=0)
-            ax.annotate('', xy=(xM + 0.02*(xM-xm), 0), xytext=(xM, 0),
-                        arrowprops=dict(arrowstyle='-|>', mutation_scale=size, color=color))
-            # arrow at left end
-            ax.annotate('', xy=(xm - 0.02*(xM-xm), 0), xytext=(xm, 0),
-                        arrowprops=dict(arrowstyle='-|>', mutation_scale=size, color=color))
-        else:
-            # vertical arrows up and down at x=0
-            ax.annotate('', xy=(0, yM + 0.02*(yM-ym)), xytext=(0, yM),
-                        arrowprops=dict(arrowstyle='-|>', mutation_scale=size, color=color))
-            ax.annotate('', xy=(0, ym - 0.02*(yM-ym)), xytext=(0, ym),
-                        arrowprops=dict(arrowstyle='-|>', mutation_scale=size, color=color))
-    _draw_axis_arrow(ax, 'x')
-    _draw_axis_arrow(ax, 'y')
+    # Draw arrowheads on axes (created once, moved on every zoom)
+    axis_arrows = _AxisArrows(ax)
 
     # Apply integer locators with a sensible cap on number of ticks
     ax.xaxis.set_major_locator(x_locator)
@@ -222,13 +726,11 @@ def polynomial_grapher(coefficient):
         """Update the plot with new x limits and recalculate the curve."""
         # Update the x and y range for the plot
         margin = 0.05 * (xmax - xmin)
-        x_range = np.linspace(xmin - margin, xmax + margin, num_pts)
-        y_range = p(x_range)
+        x_range, y_range = _sample_view(xmin - margin, xmax + margin)
         main_line.set_data(x_range, y_range)
         
         # Update arrows
-        _draw_axis_arrow(ax, 'x')
-        _draw_axis_arrow(ax, 'y')
+        axis_arrows.update()
         
         # Update the tick formatters
         ax.xaxis.set_major_locator(x_locator)
@@ -261,16 +763,26 @@ def polynomial_grapher(coefficient):
         
         new_xmin = xcenter - factor * (xcenter - xmin)
         new_xmax = xcenter + factor * (xmax - xcenter)
-        new_ymin = ycenter - factor * (ycenter - ymin)
-        new_ymax = ycenter + factor * (ymax - ycenter)
+        if autoscale_y:
+            new_ymin, new_ymax = _view_ylim(p, new_xmin, new_xmax, real_crit)
+        else:
+            new_ymin = ycenter - factor * (ycenter - ymin)
+            new_ymax = ycenter + factor * (ymax - ycenter)
         
         # Update axes limits
         ax.set_xlim(new_xmin, new_xmax)
         ax.set_ylim(new_ymin, new_ymax)
         
-        # Update the view
-        _update_view_for_zoom(new_xmin, new_xmax)
-    
+        # Recompute the curve once the burst of wheel ticks is over
+        if scroll_debounce_ms > 0:
+            fig.canvas.draw_idle()
+        scroll_debouncer()
+
+    def _recompute_view():
+        _update_view_for_zoom(*ax.get_xlim())
+
+    scroll_debouncer = _Debouncer(fig.canvas, scroll_debounce_ms, _recompute_view)
+
     # Connect scroll event for zooming
     fig.canvas.mpl_connect('scroll_event', _on_scroll)
 
@@ -293,18 +805,42 @@ def polynomial_grapher(coefficient):
     ax.set_title(f"p(x) = polynomial — {lead_str}", fontsize=12)
 
     # Add formatted polynomial label (small)
-    ax.legend([_format_poly_label(coeffs)], loc='upper left', fontsize='small', frameon=False)
+    ax.legend([_format_poly_label(p)], loc='upper left', fontsize='small', frameon=False)
 
     # Hover cursor: show (x, p(x)) near cursor like Desmos coordinate readout
     annot = ax.annotate("", xy=(0,0), xytext=(10,10), textcoords="offset points",
                         bbox=dict(boxstyle="round", fc="w"), fontsize=9)
     annot.set_visible(False)
+    # Keep the readout out of full redraws so it can be blitted on its own
+    annot.set_animated(True)
+    blit_state = {"background": None}
 
-    def _on_move(event):
+    def _on_draw(event):
+        canvas = fig.canvas
+        if canvas.supports_blit:
+            blit_state["background"] = canvas.copy_from_bbox(fig.bbox)
+        if annot.get_visible():
+            ax.draw_artist(annot)
+
+    def _refresh_annot():
+        canvas = fig.canvas
+        background = blit_state["background"]
+        if background is None or not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(background)
+        if annot.get_visible():
+            ax.draw_artist(annot)
+        canvas.blit(fig.bbox)
+
+    def _hide_annot():
+        if annot.get_visible():
+            annot.set_visible(False)
+            _refresh_annot()
+
+    def _update_hover(event):
         if event.inaxes != ax:
-            if annot.get_visible():
-                annot.set_visible(False)
-                fig.canvas.draw_idle()
+            _hide_annot()
             return
         xm = event.xdata
         if xm is None:
@@ -312,33 +848,169 @@ def polynomial_grapher(coefficient):
         try:
             ym = float(p(xm))
         except Exception:
-            if annot.get_visible():
-                annot.set_visible(False)
-                fig.canvas.draw_idle()
+            _hide_annot()
             return
         if not np.isfinite(ym):
-            if annot.get_visible():
-                annot.set_visible(False)
-                fig.canvas.draw_idle()
+            _hide_annot()
             return
         annot.xy = (xm, ym)
         annot.set_text(f"x={xm:.4g}\ny={ym:.4g}")
         annot.get_bbox_patch().set_alpha(0.9)
         annot.set_visible(True)
-        fig.canvas.draw_idle()
+        _refresh_annot()
+
+    hover_limiter = _RateLimiter(fig.canvas, hover_fps, _update_hover)
 
-    fig.canvas.mpl_connect("motion_notify_event", _on_move)
+    fig.canvas.mpl_connect("draw_event", _on_draw)
+    fig.canvas.mpl_connect("motion_notify_event", hover_limiter)
 
     plt.tight_layout()
     plt.show()
+    return fig
+
+
+def benchmark_zoom(coefficient="x^5 - 4x^3 + 2x - 1", scrolls=1000, window=100,
+                   max_time_growth=1.5, max_mem_growth_kb=512):
+    """Regression benchmark: scroll the grapher `scrolls` times headlessly.
+
+    Alternates zoom in / zoom out so the view keeps returning to the same
+    limits, renders every tick on the Agg backend and asserts that
+    the artist count stays constant, that the mean redraw time of the last
+    `window` ticks is within `max_time_growth` of the first `window`, and
+    that memory traced over `window` more ticks grows by less than
+    `max_mem_growth_kb`.
+    Returns a dict with the measurements.
+    """
+    import tracemalloc
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.backend_bases import MouseEvent
+
+    show = plt.show
+    plt.show = lambda *args, **kwargs: None
+    try:
+        fig = polynomial_grapher(coefficient, scroll_debounce_ms=0)
+    finally:
+        plt.show = show
+    ax = fig.axes[0]
+    canvas = fig.canvas
+    canvas.draw()
+    n_artists = len(ax.get_children())
+
+    def _scroll(i):
+        event = MouseEvent('scroll_event', canvas, 0, 0,
+                           button='up' if i % 2 == 0 else 'down')
+        event.inaxes, event.xdata, event.ydata = ax, 0.5, 0.5
+        # Agg has no event loop: draw_idle() in the handler renders at once
+        canvas.callbacks.process('scroll_event', event)
+
+    try:
+        times = []
+        for i in range(scrolls):
+            t0 = time.perf_counter()
+            _scroll(i)
+            times.append(time.perf_counter() - t0)
+        # Tracing slows drawing down, so memory is checked on extra ticks.
+        # An even number of alternating ticks returns to the same view, so
+        # whatever is still allocated afterwards has leaked.
+        tracemalloc.start()
+        _scroll(0)
+        _scroll(1)
+        mem_start = tracemalloc.get_traced_memory()[0]
+        for i in range(window):
+            _scroll(i)
+        mem_end = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+        plt.close(fig)
+
+    first = sum(times[:window]) / window
+    last = sum(times[-window:]) / window
+    result = {
+        "artists_before": n_artists,
+        "artists_after": len(ax.get_children()),
+        "first_ms": 1000 * first,
+        "last_ms": 1000 * last,
+        "mem_growth_kb": (mem_end - mem_start) / 1024,
+    }
+    print(f"{scrolls} scrolls: redraw {result['first_ms']:.2f} ms -> {result['last_ms']:.2f} ms, "
+          f"artists {n_artists} -> {result['artists_after']}, "
+          f"memory +{result['mem_growth_kb']:.1f} KiB")
+    assert result["artists_after"] == n_artists, "axis artists accumulate on zoom"
+    assert last <= max_time_growth * first, "redraw time grows with the number of zooms"
+    assert result["mem_growth_kb"] <= max_mem_growth_kb, "memory grows with the number of zooms"
+    return result
+
+
+def _random_formula(rng, max_terms=6, max_exp=12):
+    """Return a random formula string in the styles users actually type."""
+    parts = []
+    for i in range(rng.randint(1, max_terms)):
+        exp = rng.randint(1 if i == 0 else 0, max_exp)  # at least one x term
+        coef = rng.choice(["", str(rng.randint(1, 20)), str(round(rng.uniform(0.1, 10.0), 2))])
+        if exp == 0:
+            term = coef or "1"
+        elif exp == 1:
+            term = f"{coef}x"
+        else:
+            term = f"{coef}x{rng.choice(['^', '**'])}{exp}"
+        sign = rng.choice(["+", "-"])
+        if i == 0:
+            parts.append(term if sign == "+" else "-" + term)
+        else:
+            parts.append(rng.choice([f" {sign} ", sign]) + term)
+    return "".join(parts)
+
+
+def benchmark_parser(n=1_000_000, distinct=10_000, seed=0):
+    """Measure parser throughput (formulas/sec) on a generated corpus.
+
+    The corpus has `n` formulas drawn from `distinct` unique ones, like a
+    feed that repeats the same formulas. Compares the original multi-pass
+    parser, the single-pass tokenizer and the memoized `parse_polynomials`.
+    """
+    import random
+
+    rng = random.Random(seed)
+    pool = [_random_formula(rng) for _ in range(distinct)]
+    corpus = [rng.choice(pool) for _ in range(n)]
+
+    def _legacy():
+        for s in corpus:
+            _parse_polynomial_legacy(s)
+
+    def _tokenizer():
+        for s in corpus:
+            _parse_polynomial_uncached(s)
+
+    def _memoized():
+        _parse_polynomial_cached.cache_clear()
+        for _ in parse_polynomials(corpus):
+            pass
+
+    results = {}
+    print(f"{n} formulas ({distinct} distinct)")
+    for name, fn in (("legacy", _legacy), ("tokenizer", _tokenizer), ("memoized", _memoized)):
+        t0 = time.perf_counter()
+        fn()
+        rate = n / (time.perf_counter() - t0)
+        results[name] = rate
+        print(f"  {name:<10}: {rate:,.0f} formulas/s")
+    return results
 
 
 def _format_poly_label(coeffs):
-    """Return a human-friendly polynomial string from coeffs (highest-degree first)."""
-    degree = len(coeffs) - 1
+    """Return a human-friendly polynomial string from coeffs (highest-degree
+    first) or from a `SparsePolynomial`, whose terms are used directly.
+    """
+    if isinstance(coeffs, SparsePolynomial):
+        pairs = coeffs.terms
+    else:
+        degree = len(coeffs) - 1
+        pairs = ((degree - i, a) for i, a in enumerate(coeffs))
     parts = []
-    for i, a in enumerate(coeffs):
-        exp = degree - i
+    for exp, a in pairs:
         if abs(a) < 1e-12:
             continue
         sign = "-" if a < 0 else "+"
@@ -367,12 +1039,137 @@ def _format_poly_label(coeffs):
     return f"p(x) = {expr}"
 
 
-if __name__ == "__main__":
+def benchmark_import(commands=None, repeat=3, python=None):
+    """Measure CLI startup with `python -X importtime`, for CI to track.
+
+    Runs each subcommand `repeat` times and reports the best total import
+    time (sum of the top-level modules' cumulative times, in microseconds)
+    and wall time. Asserts that `parse` and `eval` never import numpy or
+    matplotlib and that only `plot` imports matplotlib.
+    Returns {command: {"import_us", "wall_s", "numpy", "matplotlib"}}.
+    """
+    import os
+    import subprocess
+    import sys
+
+    python = python or sys.executable
+    script = os.path.abspath(__file__)
+    commands = commands or {
+        "parse": ["parse", "3x^5 - 4x^3 + 2x - 1"],
+        "eval": ["eval", "3x^5 - 4x^3 + 2x - 1", "0.5", "2"],
+        "roots": ["roots", "3x^5 - 4x^3 + 2x - 1"],
+        "plot": ["plot", "3x^5 - 4x^3 + 2x - 1", "--out", os.devnull, "--format", "png"],
+    }
+    results = {}
+    for name, args in commands.items():
+        best = None
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            proc = subprocess.run([python, "-X", "importtime", script, *args],
+                                  capture_output=True, text=True)
+            wall = time.perf_counter() - t0
+            if proc.returncode != 0:
+                raise RuntimeError(f"{name} failed: {proc.stdout}{proc.stderr}")
+            total = 0
+            modules = set()
+            for line in proc.stderr.splitlines():
+                if not line.startswith("import time:") or "|" not in line:
+                    continue
+                _, cumulative, module = line.split("|")
+                if not cumulative.strip().isdigit():
+                    continue  # the column header
+                modules.add(module.strip())
+                if len(module) - len(module.lstrip()) == 1:  # top level
+                    total += int(cumulative)
+            run = {
+                "import_us": total,
+                "wall_s": wall,
+                "numpy": "numpy" in modules,
+                "matplotlib": "matplotlib" in modules,
+            }
+            if best is None or run["import_us"] < best["import_us"]:
+                best = run
+        results[name] = best
+        print(f"{name:<6} imports {best['import_us'] / 1000:8.1f} ms  wall {best['wall_s']:.3f} s  "
+              f"numpy={best['numpy']} matplotlib={best['matplotlib']}")
+
+    for name in ("parse", "eval"):
+        if name in results:
+            assert not results[name]["numpy"], f"`{name}` imports numpy"
+            assert not results[name]["matplotlib"], f"`{name}` imports matplotlib"
+    for name, res in results.items():
+        if name != "plot":
+            assert not res["matplotlib"], f"`{name}` imports matplotlib"
+    return results
+
+
+def main(argv=None):
+    """Command-line entry point: `parse`, `roots`, `eval` or `plot` a polynomial.
+
+    Only `plot` loads matplotlib, and only `roots` and `plot` load numpy,
+    so parsing and evaluating start up as fast as plain Python. With no
+    arguments it asks for a polynomial and plots it, as it always did.
+    """
     import sys
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        try:
+            print("Enter a polynomial formula (e.g. 2x^2 - 3x + 1) OR coefficients (e.g. 2 -3 1).")
+            raw = input("> ").strip()
+            polynomial_grapher(raw)
+        except Exception as e:
+            print(f"Error: {e}")
+            return 1
+        return 0
+
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="Polynomial.py", description="Parse, solve, evaluate or plot a polynomial.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_parse = sub.add_parser("parse", help="print the parsed polynomial and its coefficients")
+    p_parse.add_argument("formula", help="formula (e.g. '2x^2 - 3x + 1') or coefficients (e.g. '2 -3 1')")
+    p_roots = sub.add_parser("roots", help="print the real roots, one per line")
+    p_roots.add_argument("formula")
+    p_roots.add_argument("--lo", type=float, default=-math.inf, help="lower end of the search interval")
+    p_roots.add_argument("--hi", type=float, default=math.inf, help="upper end of the search interval")
+    p_eval = sub.add_parser("eval", help="print p(x) for each x")
+    p_eval.add_argument("formula")
+    p_eval.add_argument("x", type=float, nargs="+")
+    p_plot = sub.add_parser("plot", help="open the interactive grapher, or save an image with --out")
+    p_plot.add_argument("formula")
+    p_plot.add_argument("--out", help="write the graph to this file instead of showing it")
+    p_plot.add_argument("--format", choices=("png", "svg"), help="image format (default: from --out)")
+    args = parser.parse_args(argv)
+
     try:
-        print("Enter a polynomial formula (e.g. 2x^2 - 3x + 1) OR coefficients (e.g. 2 -3 1).")
-        raw = input("> ").strip()
-        polynomial_grapher(raw)
+        p = _as_sparse(args.formula)
+        if args.command == "parse":
+            print(_format_poly_label(p))
+            if p.degree <= 64:
+                print("coefficients:", " ".join(f"{c:.17g}" for c in p.to_dense()))
+            else:
+                print("terms:", " ".join(f"{c:.17g}x^{e}" for e, c in p.terms))
+        elif args.command == "roots":
+            for r in p.real_roots(args.lo, args.hi):
+                print(f"{r:.17g}")
+        elif args.command == "eval":
+            for x in args.x:
+                print(f"{x:.17g}\t{p(x):.17g}")
+        elif args.out:
+            import os
+            from poly_render import PolyRenderer
+            fmt = args.format or os.path.splitext(args.out)[1].lstrip(".").lower() or "png"
+            PolyRenderer().render(args.formula, args.out, fmt=fmt)
+        else:
+            polynomial_grapher(p)
     except Exception as e:
         print(f"Error: {e}")
-        sys.exit(1)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
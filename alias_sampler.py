@@ -0,0 +1,155 @@
+# Elias Daniel Macero Gutierrez
+# Walker alias sampler for weighted move tables
+# Date 10/18/2026
+# Version 1.0.0
+import random
+import time
+from fractions import Fraction
+from typing import Dict, Any, List, Sequence
+
+
+class AliasSampler:
+    """Draws from a fixed weighted table in O(1) per draw (Walker's alias method).
+
+    The table is split into n equal slots; slot i keeps its own value with
+    probability `prob[i]` and otherwise gives the value `alias[i]`. One
+    uniform number picks the slot (integer part) and decides between the
+    two (fractional part). The table is built once with exact fractions,
+    so zero weights are never drawn and integer weights are matched
+    exactly up to the float rounding of each threshold.
+    """
+
+    def __init__(self, values: Sequence[Any], weights: Sequence[float]):
+        values = list(values)
+        if not values:
+            raise ValueError("move list is empty")
+        if len(values) != len(weights):
+            raise ValueError("values and weights must have the same length")
+        weights = [Fraction(w) for w in weights]
+        if any(w < 0 for w in weights) or sum(weights) <= 0:
+            raise ValueError("move probabilities must be non-negative and not all zero")
+        n = len(values)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        prob = [Fraction(1)] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s = small.pop()
+            g = large[-1]
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] -= 1 - scaled[s]
+            if scaled[g] < 1:
+                small.append(large.pop())
+        # exact arithmetic leaves nothing over, so any remaining slot is full
+
+        self.values = values
+        self.weights = [float(w) for w in weights]
+        self.n = n
+        self.prob = [float(p) for p in prob]
+        self.alias = [values[a] for a in alias]
+        # a uniform just below 1 times n may round up to n; slot n repeats a full slot
+        full = next(i for i in range(n) if weights[i] > 0)
+        self._prob = self.prob + [1.0]
+        self._keep = values + [values[full]]
+        self._alias = self.alias + [values[full]]
+        self._arrays = {}  # numpy tables per dtype, built on first use
+
+    @classmethod
+    def from_moves(cls, moves: List[Dict[str, Any]]) -> "AliasSampler":
+        """Sampler over the `move` fields of a move list, weighted by `prob`."""
+        return cls([m['move'] for m in moves], [m['prob'] for m in moves])
+
+    def draw(self, uniform=random.random):
+        """One value; `uniform` is the source of floats in [0, 1), e.g. `random.Random(seed).random`."""
+        u = uniform() * self.n
+        i = int(u)
+        return self._keep[i] if u - i < self._prob[i] else self._alias[i]
+
+    def draw_many(self, k: int, uniform=random.random) -> list:
+        """A list of `k` values."""
+        n, keep, prob, alias = self.n, self._keep, self._prob, self._alias
+        us = [uniform() * n for _ in range(k)]
+        return [keep[i] if u - i < prob[i] else alias[i] for u in us for i in (int(u),)]
+
+    def draw_array(self, rng, shape, dtype=None):
+        """A numpy array of values with shape `shape`, drawn with Generator `rng`."""
+        import numpy as np
+
+        key = np.dtype(dtype).str if dtype is not None else None
+        if key not in self._arrays:
+            # slot i keeps entry i and takes its alias from entry i + n + 1
+            self._arrays[key] = (np.array(self._keep + self._alias, dtype=dtype), np.array(self._prob))
+        table, prob = self._arrays[key]
+        u = rng.random(shape)
+        u *= self.n
+        idx = u.astype(np.intp)
+        u -= idx
+        idx += (u >= prob.take(idx)) * (self.n + 1)
+        return table.take(idx)
+
+
+def benchmark(draws=1_000_000, k=100, values=None, seed=0):
+    """Time single and bulk draws against `random.choices` on the hare's move table.
+
+    Also prints the observed share of each move next to its weight share.
+    """
+    if values is None:
+        from rab_hare import DEFAULT_VALUES as values
+
+    moves = values['hare_moves']
+    steps = [m['move'] for m in moves]
+    weights = [m['prob'] for m in moves]
+    sampler = AliasSampler.from_moves(moves)
+    rnd = random.Random(seed)
+    choices = rnd.choices
+    uniform = rnd.random
+    rounds = draws // k
+
+    timings = {}
+    t0 = time.perf_counter()
+    for _ in range(draws):
+        choices(steps, weights=weights, k=1)[0]
+    timings["random.choices k=1"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    draw = sampler.draw
+    for _ in range(draws):
+        draw(uniform)
+    timings["alias draw"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        choices(steps, weights=weights, k=k)
+    timings[f"random.choices k={k}"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    sample = []
+    for _ in range(rounds):
+        sample += sampler.draw_many(k, uniform)
+    timings[f"alias draw_many k={k}"] = time.perf_counter() - t0
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        t0 = time.perf_counter()
+        sampler.draw_array(rng, draws)
+        timings["alias draw_array"] = time.perf_counter() - t0
+
+    base = timings["random.choices k=1"]
+    print(f"{draws:,} draws from {len(steps)} moves")
+    for name, seconds in timings.items():
+        print(f"  {name:<24}: {draws / seconds:14,.0f} draws/s ({base / seconds:.1f}x)")
+    total = sum(weights)
+    counts = {s: 0 for s in steps}
+    for s in sample:
+        counts[s] += 1
+    for s in dict.fromkeys(steps):
+        share = sum(w for v, w in zip(steps, weights) if v == s) / total
+        print(f"  move {s:>4}: {counts[s] / len(sample):.4f} drawn, {share:.4f} expected")
+    return timings
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -2,8 +2,93 @@
 # Coin Toss Counter
 # Date 10/12/2025
 # Version 1.4.15
-import random
+import argparse
+import io
 import sys
+from itertools import accumulate, chain
+from typing import Dict, Any
+
+from coin_walk import WalkStats, toss_blocks
+
+MODES = ("none", "summary", "sampled", "full")
+# Tosses formatted and written per block in 'sampled' and 'full' modes.
+BLOCK_TOSSES = 1 << 16
+
+# per byte value: its 8 tosses (least significant bit first) as result letters and counter steps
+_LETTERS = ["".join("H" if b >> j & 1 else "T" for j in range(8)) for b in range(256)]
+_STEPS = [tuple(1 if b >> j & 1 else -1 for j in range(8)) for b in range(256)]
+
+
+def _writer(out):
+    """A function writing bytes to `out` (sys.stdout by default), a text or binary stream."""
+    out = out or sys.stdout
+    if isinstance(out, io.TextIOBase):
+        out.flush()  # keep anything already printed in front of our rows
+        if hasattr(out, "buffer"):
+            return out.buffer.write, out.buffer.flush
+        return (lambda b: out.write(b.decode())), out.flush
+    return out.write, out.flush
+
+
+def _table_block(data, n, start, counter, every):
+    """Format the table rows of one block of `n` packed tosses after toss `start`.
+
+    Only rows whose toss number is a multiple of `every` are kept.
+    Returns (encoded rows, counter after the block).
+    """
+    letters = "".join([_LETTERS[b] for b in data])[:n]
+    counters = list(accumulate(chain.from_iterable([_STEPS[b] for b in data]), initial=counter))[1:n + 1]
+    first = (-start - 1) % every  # index of the first toss whose number is a multiple of `every`
+    rows = map("{}\t{}\t{}\n".format, range(start + first + 1, start + n + 1, every),
+               letters[first::every], counters[first::every])
+    return "".join(rows).encode(), counters[-1]
+
+
+def flip_coins(flips: int, mode: str = "full", every: int = 1000, seed=None, out=None) -> Dict[str, Any]:
+    """Toss `flips` coins and write them out according to `mode`.
+
+    'none' writes nothing, 'summary' only the summary, 'sampled' the table
+    rows of every `every`-th toss and 'full' every row, as the interactive
+    game does. Table rows are formatted a block of tosses at a time and
+    each block is written with a single call. `out` is a text or binary
+    stream (sys.stdout by default). Returns the `WalkStats` summary.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode!r}; use one of {', '.join(MODES)}")
+    if flips <= 0:
+        raise ValueError("flips must be a positive integer")
+    if every < 1:
+        raise ValueError("every must be a positive integer")
+    if mode == "full":
+        every = 1
+    stats = WalkStats()
+    table = mode in ("sampled", "full")
+    if mode != "none":
+        write, flush = _writer(out)
+    if table:
+        write(b"\nToss\tResult\tCounter\n")
+    counter = 0
+    start = 0
+    for data, n in toss_blocks(flips, seed, BLOCK_TOSSES):
+        stats.update(data, n)
+        if table:
+            rows, counter = _table_block(data, n, start, counter, every)
+            write(rows)
+        start += n
+    summary = stats.summary()
+    if mode != "none":
+        write(_summary_text(summary).encode())
+        flush()
+    return summary
+
+
+def _summary_text(summary: Dict[str, Any]) -> str:
+    return ("\nSummary:\n"
+            f"Total tosses: {summary['tosses']}\n"
+            f"Heads: {summary['heads']}\n"
+            f"Tails: {summary['tails']}\n"
+            f"Final counter: {summary['counter']}\n")
+
 
 def coin_flipper():
     """Interactive coin toss game that prints counter vs toss number."""
@@ -24,35 +109,42 @@ def coin_flipper():
         except ValueError:
             print("Invalid input. Please enter a positive integer.")
 
-    counter = 0      # counter increments for heads, decrements for tails
-    heads = 0
-    tails = 0
-
-    # Print a small table header
-    print("\nToss\tResult\tCounter")
-    # Simulate tosses and update/print the counter after each toss
-    for i in range(1, flips + 1):
-        # Randomly choose head or tail
-        result = "H" if random.choice([True, False]) else "T"
-        if result == "H":
-            heads += 1
-            counter += 1
-        else:
-            tails += 1
-            counter -= 1
-        # Show toss number, result, and current counter value
-        print(f"{i}\t{result}\t{counter}")
-
-    # Summary
-    print("\nSummary:")
-    print(f"Total tosses: {flips}")
-    print(f"Heads: {heads}")
-    print(f"Tails: {tails}")
-    print(f"Final counter: {counter}")
+    # Print the toss number, result and counter after each toss, then a summary
+    flip_coins(flips, "full")
+
+
+def main(argv=None):
+    """Command line: `coin_flipper.py -n FLIPS [--mode MODE] [--every K] [--seed S] [--out PATH]`.
+
+    Without arguments the interactive game runs instead.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        coin_flipper()
+        return 0
+    parser = argparse.ArgumentParser(description="Toss coins and track heads minus tails.")
+    parser.add_argument("-n", "--flips", type=int, required=True, help="number of tosses")
+    parser.add_argument("--mode", choices=MODES, default="full",
+                        help="what to print: nothing, the summary, every K-th row, or every row (default)")
+    parser.add_argument("--every", type=int, default=1000, metavar="K", help="row interval for --mode sampled")
+    parser.add_argument("--seed", type=int, help="seed for reproducible tosses")
+    parser.add_argument("--out", help="write to this file instead of standard output")
+    args = parser.parse_args(argv)
+    if args.flips <= 0:
+        parser.error("--flips must be a positive integer")
+    if args.every < 1:
+        parser.error("--every must be a positive integer")
+    if args.out:
+        with open(args.out, "wb") as f:
+            flip_coins(args.flips, args.mode, args.every, args.seed, f)
+    else:
+        flip_coins(args.flips, args.mode, args.every, args.seed)
+    return 0
+
 
 if __name__ == "__main__":
     try:
-        coin_flipper()
+        sys.exit(main())
     except KeyboardInterrupt:
         print("\nInterrupted. Exiting.")
-        sys.exit(0)
\ No newline at end of file
+        sys.exit(0)
@@ -0,0 +1,226 @@
+# Elias Daniel Macero Gutierrez
+# Bulk coin tosses and random-walk statistics
+# Date 10/18/2026
+# Version 1.0.0
+import random
+import sys
+import time
+from typing import Dict, Any, Iterator, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # the pure-Python path below is used instead
+    np = None
+
+# Tosses handled per block; bounds memory whatever the number of tosses.
+CHUNK_TOSSES = 1 << 22
+
+
+def _byte_table():
+    """Per byte value: (net change, highest prefix, lowest prefix, last step) of its 8 tosses."""
+    table = []
+    for b in range(256):
+        c, hi, lo = 0, -8, 8
+        for j in range(8):
+            c += 1 if b >> j & 1 else -1
+            hi, lo = max(hi, c), min(lo, c)
+        table.append((c, hi, lo, 1 if b >> 7 & 1 else -1))
+    return table
+
+
+_BYTES = _byte_table()
+
+
+class WalkStats:
+    """Streaming statistics of the coin-toss counter (+1 heads, -1 tails).
+
+    Tosses are fed in order as packed bits: bit j of byte k (least
+    significant first) is toss 8k + j, 1 for heads. Only O(1) state is
+    kept between blocks. `zeros` counts tosses after which the counter is
+    0; `crossings` counts the zeros where it changes sign, i.e. the
+    counter goes from +1 through 0 to -1 or back. To continue a walk part
+    way through, pass the `counter` reached and the one before it (`prev`).
+    """
+
+    def __init__(self, counter: int = 0, prev: int | None = None):
+        self.tosses = 0
+        self.heads = 0
+        self.counter = counter
+        self.max = counter
+        self.min = counter
+        self.zeros = 0
+        self.crossings = 0
+        self._prev = counter if prev is None else prev  # counter one toss before `counter`
+
+    def update(self, data: bytes, nbits: int | None = None) -> None:
+        """Add the first `nbits` tosses packed in `data` (all of them by default)."""
+        nbits = len(data) * 8 if nbits is None else nbits
+        if not 0 <= nbits <= len(data) * 8:
+            raise ValueError("nbits does not fit in data")
+        if nbits == 0:
+            return
+        if np is not None:
+            bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=nbits, bitorder="little")
+            self._update_numpy(bits)
+        else:
+            self._update_python(data, nbits)
+
+    def _update_numpy(self, bits):
+        n = len(bits)
+        steps = bits.view(np.int8) * np.int8(2)
+        steps -= 1
+        walk = np.cumsum(steps, dtype=np.int32)  # relative to `counter`; |walk| <= n
+        base = self.counter
+        self.heads += int(np.count_nonzero(bits))
+        self.max = max(self.max, base + int(walk.max()))
+        self.min = min(self.min, base + int(walk.min()))
+        if abs(base) <= n:
+            # a toss t ends on 0 and crosses when the counters before and after it are opposite
+            ext = np.empty(n + 2, dtype=np.int32)
+            ext[0] = self._prev - base
+            ext[1] = 0
+            ext[2:] = walk
+            at_zero = ext[1:] == -base
+            self.zeros += int(np.count_nonzero(at_zero[1:]))
+            mid = at_zero[:-1]
+            before, after = ext[:-2][mid] + base, ext[2:][mid] + base
+            self.crossings += int(np.count_nonzero((before != 0) & (before == -after)))
+        self._prev = base + int(walk[-2]) if n > 1 else base
+        self.counter = base + int(walk[-1])
+        self.tosses += n
+
+    def _update_python(self, data, nbits):
+        full, rest = divmod(nbits, 8)
+        c, prev = self.counter, self._prev
+        hi, lo, zeros, crossings = self.max, self.min, self.zeros, self.crossings
+        heads = 0
+        table = _BYTES
+        for k in range(full + (1 if rest else 0)):
+            b = data[k]
+            width = 8 if k < full else rest
+            if width == 8 and (c > 8 or c < -8):
+                # far from 0: the whole byte from the table
+                net, up, down, last = table[b]
+                heads += (net + 8) >> 1
+                hi, lo = max(hi, c + up), min(lo, c + down)
+                c += net
+                prev = c - last
+                continue
+            for j in range(width):
+                new = c + 1 if b >> j & 1 else c - 1
+                if new > c:
+                    heads += 1
+                if c == 0 and prev != 0 and prev == -new:
+                    crossings += 1
+                if new == 0:
+                    zeros += 1
+                prev, c = c, new
+                if c > hi:
+                    hi = c
+                elif c < lo:
+                    lo = c
+        self.counter, self._prev = c, prev
+        self.max, self.min, self.zeros, self.crossings = hi, lo, zeros, crossings
+        self.heads += heads
+        self.tosses += nbits
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "tosses": self.tosses,
+            "heads": self.heads,
+            "tails": self.tosses - self.heads,
+            "counter": self.counter,
+            "max": self.max,
+            "min": self.min,
+            "max_excursion": max(self.max, -self.min),
+            "zeros": self.zeros,
+            "crossings": self.crossings,
+        }
+
+
+def toss_blocks(flips: int, seed=None, chunk: int = CHUNK_TOSSES, engine: str | None = None
+                ) -> Iterator[Tuple[bytes, int]]:
+    """Yield (packed bytes, number of tosses) blocks covering `flips` fair tosses.
+
+    `engine` is 'numpy' (Generator.bytes) or 'bits' (random.getrandbits);
+    by default numpy when it is installed.
+    """
+    if flips < 0:
+        raise ValueError("flips must be non-negative")
+    if chunk < 8 or chunk % 8:
+        raise ValueError("chunk must be a positive multiple of 8")
+    engine = engine or ("numpy" if np is not None else "bits")
+    if engine == "numpy":
+        if np is None:
+            raise RuntimeError("engine 'numpy' requires numpy")
+        gen = np.random.default_rng(seed).bytes
+    elif engine == "bits":
+        rnd = random.Random(seed)
+
+        def gen(n):
+            return rnd.getrandbits(8 * n).to_bytes(n, "little")
+    else:
+        raise ValueError(f"Unknown engine {engine!r}; use 'numpy' or 'bits'")
+    for start in range(0, flips, chunk):
+        n = min(chunk, flips - start)
+        yield gen((n + 7) // 8), n
+
+
+def simulate_walk(flips: int, seed=None, chunk: int = CHUNK_TOSSES, engine: str | None = None) -> Dict[str, Any]:
+    """Toss `flips` coins in blocks and return `WalkStats.summary()`.
+
+    Memory stays at a few times `chunk` bytes however large `flips` is.
+    """
+    stats = WalkStats()
+    for data, n in toss_blocks(flips, seed, chunk, engine):
+        stats.update(data, n)
+    return stats.summary()
+
+
+def _reference_walk(data: bytes, nbits: int) -> Dict[str, Any]:
+    """The `coin_flipper` loop over the same tosses, for checking `WalkStats`."""
+    counter = prev = heads = zeros = crossings = hi = lo = 0
+    for i in range(nbits):
+        new = counter + 1 if data[i >> 3] >> (i & 7) & 1 else counter - 1
+        heads += new > counter
+        if counter == 0 and prev != 0 and prev == -new:
+            crossings += 1
+        zeros += new == 0
+        prev, counter = counter, new
+        hi, lo = max(hi, counter), min(lo, counter)
+    return {"tosses": nbits, "heads": heads, "tails": nbits - heads, "counter": counter, "max": hi,
+            "min": lo, "max_excursion": max(hi, -lo), "zeros": zeros, "crossings": crossings}
+
+
+def benchmark(flips=100_000_000, seed=0, check=200_000):
+    """Time both engines and check them against the per-toss loop."""
+    data = random.Random(seed).getrandbits(8 * check).to_bytes(check, "little")
+    ref = _reference_walk(data, check * 8 - 3)
+    for small in (13, 1000):  # odd block sizes exercise the carries between blocks
+        stats = WalkStats()
+        for k in range(0, check, small):
+            stats.update(data[k:k + small], min(small, check - k) * 8 - (3 if k + small >= check else 0))
+        assert stats.summary() == ref, (stats.summary(), ref)
+    print(f"block updates match the per-toss loop on {check * 8 - 3:,} tosses")
+
+    engines = ["bits"] + (["numpy"] if np is not None else [])
+    for engine in engines:
+        n = flips if engine == "numpy" else min(flips, 10_000_000)
+        t0 = time.perf_counter()
+        s = simulate_walk(n, seed, engine=engine)
+        elapsed = time.perf_counter() - t0
+        print(f"{engine:>5}: {n:,} tosses in {elapsed:.2f} s ({n / elapsed:,.0f}/s)  "
+              f"heads {s['heads']:,}  counter {s['counter']}  max excursion {s['max_excursion']}  "
+              f"zeros {s['zeros']}  crossings {s['crossings']}")
+
+
+if __name__ == "__main__":
+    # python coin_walk.py [FLIPS] [SEED] [ENGINE]
+    args = sys.argv[1:]
+    if not args:
+        benchmark()
+    else:
+        result = simulate_walk(int(args[0]), int(args[1]) if len(args) > 1 else None,
+                               engine=args[2] if len(args) > 2 else None)
+        for k, v in result.items():
+            print(f"{k}: {v}")
@@ -0,0 +1,51 @@
+# Elias Daniel Macero Gutierrez
+# Bounded process-pool helpers shared by the batch tools
+# Date 10/18/2026
+# Version 1.0.0
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield lists of `size` consecutive items (the last may be shorter), reading lazily."""
+    if size < 1:
+        raise ValueError("chunksize must be positive")
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def imap_unordered(fn: Callable[..., Any], tasks: Iterable[Tuple], max_workers: int | None = None,
+                   initializer=None, initargs=()) -> Iterator[Any]:
+    """Yield `fn(*task)` for every task, in the order they finish.
+
+    `tasks` may be a lazy generator: it is read only as work is handed
+    out, and at most two tasks per worker are in flight, so memory stays
+    bounded however many tasks there are. `max_workers=1` runs every task
+    in this process, in order, without a pool (`initializer` then runs
+    here once); `None` uses one worker per CPU. `fn`, the tasks and the
+    results must be picklable otherwise.
+    """
+    if max_workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for task in tasks:
+            yield fn(*task)
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+    tasks = iter(tasks)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs) as pool:
+        pending = {pool.submit(fn, *task) for task in islice(tasks, 2 * max_workers)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield fut.result()
+                task = next(tasks, None)
+                if task is not None:
+                    pending.add(pool.submit(fn, *task))
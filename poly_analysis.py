@@ -0,0 +1,77 @@
+# Elias Daniel Macero Gutierrez
+# Batch root / critical-point analysis across processes
+# Date 10/18/2026
+# Version 1.0.0
+import sys
+import json
+
+from Polynomial import _as_sparse
+from parallel import chunked, imap_unordered
+
+
+def analyze_polynomial(item):
+    """Return roots, critical points and extrema of one polynomial.
+
+    `item` may be a formula string, a coefficient list (highest-degree
+    first) or a `SparsePolynomial`. Each extremum is a dict with `x`, `y`
+    and `kind`: 'min', 'max', or 'saddle' when p' does not change sign.
+    """
+    p = _as_sparse(item)
+    dp = p.deriv()
+    roots = p.real_roots()
+    crit = dp.real_roots() if p.degree >= 1 else []
+
+    # p' keeps its sign between consecutive critical points, so one sample
+    # in each gap tells which way the curve is going
+    probes = [crit[0] - 1.0] if crit else []
+    probes += [0.5 * (a + b) for a, b in zip(crit, crit[1:])]
+    probes += [crit[-1] + 1.0] if crit else []
+    signs = [dp(x) > 0 for x in probes]
+    extrema = []
+    for i, c in enumerate(crit):
+        before, after = signs[i], signs[i + 1]
+        if before == after:
+            kind = "saddle"
+        else:
+            kind = "min" if after else "max"
+        extrema.append({"x": c, "y": float(p(c)), "kind": kind})
+
+    return {
+        "degree": p.degree,
+        "roots": roots,
+        "critical_points": crit,
+        "extrema": extrema,
+    }
+
+
+def _analyze_chunk(chunk):
+    """Worker entry: analyze (index, item) pairs, turning failures into errors."""
+    out = []
+    for index, item in chunk:
+        try:
+            out.append((index, analyze_polynomial(item)))
+        except Exception as exc:
+            out.append((index, {"error": f"{type(exc).__name__}: {exc}"}))
+    return out
+
+
+def analyze_polynomials(polys, max_workers=None, chunksize=256):
+    """Analyze many polynomials in parallel, yielding (index, result) pairs.
+
+    `polys` may be any iterable, including a lazy generator: it is read
+    `chunksize` items at a time and at most two chunks per worker are in
+    flight, so memory stays bounded. Results are yielded as soon as their
+    chunk finishes, so they are not in input order; `index` is the item's
+    position in `polys`. Invalid inputs give {"error": ...} instead of
+    stopping the batch. `max_workers=1` runs everything in this process.
+    """
+    chunks = chunked(enumerate(polys), chunksize)
+    for results in imap_unordered(_analyze_chunk, ((chunk,) for chunk in chunks), max_workers):
+        yield from results
+
+
+if __name__ == "__main__":
+    # One formula per line on stdin, one JSON result per line on stdout
+    lines = (line.strip() for line in sys.stdin)
+    for index, result in analyze_polynomials(line for line in lines if line):
+        print(json.dumps({"index": index, **result}))
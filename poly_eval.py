@@ -0,0 +1,123 @@
+# Elias Daniel Macero Gutierrez
+# Headless batch polynomial evaluation
+# Date 10/18/2026
+# Version 1.0.0
+import time
+
+try:
+    import numpy as np
+except Exception as exc:
+    raise RuntimeError("poly_eval requires numpy") from exc
+
+from Polynomial import _parse_polynomial_input
+
+
+class PolyBatch:
+    """A stack of polynomials evaluated together with Horner's scheme.
+
+    Coefficients are stored as one contiguous (m, d+1) float matrix, highest
+    degree first, exactly like the lists returned by `_parse_polynomial_input`.
+    Shorter polynomials are padded with leading zeros so every row shares the
+    same Horner loop.
+    """
+
+    __slots__ = ("coeffs",)
+
+    def __init__(self, coeff_rows):
+        rows = [[float(c) for c in row] for row in coeff_rows]
+        if not rows:
+            raise ValueError("Empty coefficient list")
+        if any(len(row) == 0 for row in rows):
+            raise ValueError("Empty coefficient list")
+        width = max(len(row) for row in rows)
+        mat = np.zeros((len(rows), width), dtype=np.float64)
+        for i, row in enumerate(rows):
+            mat[i, width - len(row):] = row
+        self.coeffs = mat
+
+    @classmethod
+    def from_formulas(cls, formulas):
+        """Build a batch from formula / coefficient strings."""
+        return cls(_parse_polynomial_input(s) for s in formulas)
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """Wrap an existing 2-D coefficient matrix without re-parsing rows."""
+        mat = np.ascontiguousarray(matrix, dtype=np.float64)
+        if mat.ndim == 1:
+            mat = mat[None, :]
+        if mat.ndim != 2 or mat.shape[1] == 0:
+            raise ValueError("Coefficient matrix must be 2-D and non-empty")
+        obj = cls.__new__(cls)
+        obj.coeffs = mat
+        return obj
+
+    def __len__(self):
+        return self.coeffs.shape[0]
+
+    @property
+    def degree(self):
+        return self.coeffs.shape[1] - 1
+
+    def evaluate(self, x, out=None):
+        """Evaluate every polynomial at every point of the 1-D array `x`.
+
+        Returns an (m, len(x)) array. Pass a preallocated `out` of that shape
+        to avoid allocating the result on repeated calls.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        if x.ndim != 1:
+            raise ValueError("x must be a 1-D array")
+        c = self.coeffs
+        shape = (c.shape[0], x.shape[0])
+        if out is None:
+            out = np.empty(shape, dtype=np.float64)
+        elif out.shape != shape:
+            raise ValueError(f"out must have shape {shape}")
+
+        out[...] = c[:, :1]
+        for j in range(1, c.shape[1]):
+            np.multiply(out, x, out=out)
+            np.add(out, c[:, j:j + 1], out=out)
+        return out
+
+    __call__ = evaluate
+
+
+def benchmark(num_polys=1000, num_x=100_000, degree=5, repeat=3, seed=0):
+    """Compare `PolyBatch.evaluate` against one `np.poly1d(c)(x)` per row."""
+    rng = np.random.default_rng(seed)
+    mat = rng.uniform(-5.0, 5.0, size=(num_polys, degree + 1))
+    x = np.linspace(-10.0, 10.0, num_x)
+    batch = PolyBatch.from_matrix(mat)
+    out = np.empty((num_polys, num_x))
+
+    def _poly1d():
+        for i in range(num_polys):
+            out[i] = np.poly1d(mat[i])(x)
+
+    def _horner():
+        batch.evaluate(x, out=out)
+
+    results = {}
+    for name, fn in (("poly1d", _poly1d), ("horner", _horner)):
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+        results[name] = best
+
+    ref = np.vstack([np.poly1d(mat[i])(x[:16]) for i in range(num_polys)])
+    max_err = float(np.max(np.abs(batch.evaluate(x[:16]) - ref)))
+
+    print(f"{num_polys} polynomials of degree {degree} x {num_x} points")
+    print(f"  poly1d loop : {results['poly1d']:.4f} s")
+    print(f"  PolyBatch   : {results['horner']:.4f} s  "
+          f"({results['poly1d'] / results['horner']:.1f}x)")
+    print(f"  max abs diff: {max_err:.3g}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark()
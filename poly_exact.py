@@ -0,0 +1,561 @@
+# Elias Daniel Macero Gutierrez
+# Exact integer / rational polynomial arithmetic
+# Date 10/18/2026
+# Version 1.0.0
+import math
+import numbers
+import re
+import time
+from fractions import Fraction
+
+from Polynomial import _parse_polynomial_legacy, _scan_terms
+
+# Below this many coefficients (of the shorter factor) the schoolbook
+# product beats Karatsuba's bookkeeping.
+KARATSUBA_CUTOFF = 32
+# From this many coefficients (of the shorter factor) integer products go
+# through the number-theoretic transform, when numpy is available.
+NTT_CUTOFF = 256
+
+# NTT-friendly primes p = c * 2**k + 1 below 2**31, with a primitive root g.
+# Products of two residues stay below 2**62 and fit numpy's int64.
+_NTT_PRIMES = (
+    (998244353, 3),   # 119 * 2**23 + 1
+    (167772161, 3),   # 5 * 2**25 + 1
+    (469762049, 3),   # 7 * 2**26 + 1
+    (754974721, 11),  # 45 * 2**24 + 1
+    (2013265921, 31),  # 15 * 2**27 + 1
+)
+
+
+def _coerce(c):
+    """Return `c` as an int, or as a Fraction if it is not integral."""
+    if isinstance(c, bool) or not isinstance(c, numbers.Rational):
+        raise TypeError("coefficients must be int or Fraction")
+    if isinstance(c, numbers.Integral):
+        return int(c)
+    c = Fraction(c)
+    return c.numerator if c.denominator == 1 else c
+
+
+def _trim(a):
+    """Drop zero high-order coefficients of a low-first list, in place."""
+    while a and a[-1] == 0:
+        a.pop()
+    return a
+
+
+def _add(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    out = list(a)
+    for i, c in enumerate(b):
+        out[i] += c
+    return out
+
+
+def _sub(a, b):
+    out = list(a) + [0] * (len(b) - len(a))
+    for i, c in enumerate(b):
+        out[i] -= c
+    return out
+
+
+def _schoolbook(a, b):
+    out = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                out[i + j] += x * y
+    return out
+
+
+def _karatsuba(a, b):
+    """Product of two low-first coefficient lists in O(n**1.585)."""
+    if len(a) < len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    if m <= KARATSUBA_CUTOFF:
+        return _schoolbook(a, b)
+    out = [0] * (n + m - 1)
+    if 2 * m <= n:
+        # very unequal sizes: multiply b by m-long slices of a
+        for i in range(0, n, m):
+            for j, c in enumerate(_karatsuba(a[i:i + m], b)):
+                out[i + j] += c
+        return out
+    h = n // 2
+    a0, a1 = a[:h], a[h:]
+    b0, b1 = b[:h], b[h:]
+    z0 = _karatsuba(a0, b0)
+    z2 = _karatsuba(a1, b1)
+    z1 = _karatsuba(_add(a0, a1), _add(b0, b1))
+    for i, c in enumerate(z0):
+        out[i] += c
+        out[i + h] -= c
+    for i, c in enumerate(z2):
+        out[i + 2 * h] += c
+        out[i + h] -= c
+    for i, c in enumerate(z1):
+        out[i + h] += c
+    return out
+
+
+def _ntt(np, a, p, g, invert=False):
+    """In-place iterative NTT of the int64 array `a` (length a power of 2) mod p."""
+    n = a.shape[0]
+    bits = n.bit_length() - 1
+    rev = np.zeros(n, dtype=np.int64)
+    for k in range(bits):
+        rev |= ((np.arange(n) >> k) & 1) << (bits - 1 - k)
+    a[:] = a[rev]
+    length = 2
+    while length <= n:
+        half = length // 2
+        w = pow(g, (p - 1) // length, p)
+        if invert:
+            w = pow(w, p - 2, p)
+        # twiddles w**0 .. w**(half-1), doubled up one block at a time
+        tw = np.ones(half, dtype=np.int64)
+        filled = 1
+        while filled < half:
+            step = min(filled, half - filled)
+            tw[filled:filled + step] = tw[:step] * pow(w, filled, p) % p
+            filled += step
+        blocks = a.reshape(n // length, length)
+        u = blocks[:, :half].copy()
+        v = blocks[:, half:] * tw % p
+        blocks[:, :half] = (u + v) % p
+        blocks[:, half:] = (u - v) % p
+        length *= 2
+    if invert:
+        a *= pow(n, p - 2, p)
+        a %= p
+    return a
+
+
+def _residues(np, a, p):
+    try:
+        return np.array(a, dtype=np.int64) % p
+    except OverflowError:
+        return np.array([c % p for c in a], dtype=np.int64)
+
+
+def _ntt_mul(a, b):
+    """Integer product through NTTs modulo a few primes and CRT, or None.
+
+    Returns None if numpy is missing or the product's coefficients could be
+    too large for the available primes to pin down.
+    """
+    try:
+        import numpy as np
+    except Exception:
+        return None
+    n = len(a) + len(b) - 1
+    size = 1 << (n - 1).bit_length()
+    bound = 2 * max(abs(c) for c in a) * max(abs(c) for c in b) * min(len(a), len(b)) + 1
+    primes = []
+    modulus = 1
+    for p, g in _NTT_PRIMES:
+        if modulus > bound:
+            break
+        if (p - 1) % size == 0:
+            primes.append((p, g))
+            modulus *= p
+    if modulus <= bound:
+        return None
+
+    residues = []
+    for p, g in primes:
+        fa = np.zeros(size, dtype=np.int64)
+        fb = np.zeros(size, dtype=np.int64)
+        fa[:len(a)] = _residues(np, a, p)
+        fb[:len(b)] = _residues(np, b, p)
+        _ntt(np, fa, p, g)
+        _ntt(np, fb, p, g)
+        fa *= fb
+        fa %= p
+        residues.append(_ntt(np, fa, p, g, invert=True)[:n])
+
+    # Garner's mixed-radix CRT: value = t0 + t1 p0 + t2 p0 p1 + ...
+    digits = []
+    for i, (p, _) in enumerate(primes):
+        t = residues[i]
+        for j, (q, _) in enumerate(primes[:i]):
+            t = (t - digits[j]) % p * pow(q, p - 2, p) % p
+        digits.append(t)
+    if modulus < 1 << 62:
+        value = digits[0].copy()
+        if len(digits) > 1:
+            value += digits[1] * primes[0][0]
+        value[value > modulus // 2] -= modulus
+        return value.tolist()
+    radices = [1]
+    for p, _ in primes[:-1]:
+        radices.append(radices[-1] * p)
+    half = modulus // 2
+    out = []
+    for ds in zip(*(d.tolist() for d in digits)):
+        v = sum(d * r for d, r in zip(ds, radices))
+        out.append(v - modulus if v > half else v)
+    return out
+
+
+def _int_mul(a, b):
+    if not a or not b:
+        return []
+    if min(len(a), len(b)) >= NTT_CUTOFF:
+        out = _ntt_mul(a, b)
+        if out is not None:
+            return out
+    return _karatsuba(a, b)
+
+
+def _content_denominator(a):
+    """Least common multiple of the denominators of a coefficient list."""
+    d = 1
+    for c in a:
+        if isinstance(c, Fraction):
+            d = math.lcm(d, c.denominator)
+    return d
+
+
+def _mul(a, b):
+    """Exact product of low-first int/Fraction lists; rationals are scaled to ints."""
+    da, db = _content_denominator(a), _content_denominator(b)
+    if da == 1 and db == 1:
+        return _int_mul(a, b)
+    ia = [int(c * da) for c in a]
+    ib = [int(c * db) for c in b]
+    d = da * db
+    return [_coerce(Fraction(c, d)) for c in _int_mul(ia, ib)]
+
+
+def _divide(x, y):
+    """Exact x / y, staying an int when y divides x."""
+    if isinstance(x, int) and isinstance(y, int) and x % y == 0:
+        return x // y
+    return _coerce(Fraction(x) / y)
+
+
+def _divmod(a, b):
+    """Quotient and remainder of low-first lists by schoolbook long division."""
+    if not b:
+        raise ZeroDivisionError("polynomial division by zero")
+    r = list(a)
+    if len(r) < len(b):
+        return [], r
+    lead = b[-1]
+    q = [0] * (len(r) - len(b) + 1)
+    for k in range(len(q) - 1, -1, -1):
+        c = r[k + len(b) - 1]
+        if c == 0:
+            continue
+        c = _divide(c, lead)
+        q[k] = c
+        for j, bj in enumerate(b):
+            r[k + j] -= c * bj
+    # integral Fractions left in the remainder are stored as ints
+    return q, _trim([_coerce(c) for c in r[:len(b) - 1]])
+
+
+class ExactPolynomial:
+    """A polynomial with int and Fraction coefficients and exact arithmetic.
+
+    `coeffs` is a tuple highest-degree first, like the lists returned by
+    `_parse_polynomial_input`, without leading zeros; the zero polynomial
+    has no coefficients and degree -1. Integral Fractions are stored as
+    ints. Supports +, -, *, divmod, //, %, ** and calling, plus `deriv`,
+    `compose` and the module-level `gcd`. Products use Karatsuba and, from
+    `NTT_CUTOFF` coefficients on, a multi-prime NTT.
+    """
+
+    __slots__ = ("coeffs",)
+
+    def __init__(self, coeffs=()):
+        self.coeffs = tuple(_trim([_coerce(c) for c in reversed(list(coeffs))])[::-1])
+
+    @classmethod
+    def _from_low(cls, low):
+        """Wrap a low-first list of already coerced coefficients."""
+        obj = cls.__new__(cls)
+        obj.coeffs = tuple(_trim(low)[::-1])
+        return obj
+
+    @classmethod
+    def from_formula(cls, s):
+        """Parse a formula or coefficient list with exact decimal coefficients."""
+        if not isinstance(s, str):
+            raise TypeError("Input must be a string")
+        terms = _scan_terms(s, number=Fraction)
+        if terms is not None:
+            low = [Fraction(0)] * (max(terms) + 1)
+            for e, c in terms.items():
+                low[e] = c
+            return cls._from_low([_coerce(c) for c in low])
+        if 'x' not in s.lower():
+            parts = [t for t in re.split(r'[,\s]+', s.strip()) if t]
+            try:
+                coeffs = [Fraction(t) for t in parts]
+            except ValueError:
+                raise ValueError("Could not parse coefficients list; use numbers separated by space or comma.")
+            if not coeffs:
+                raise ValueError("Empty input" if not s.strip() else "No coefficients found")
+            return cls(coeffs)
+        # unusual spacing the tokenizer declines: reuse the original parser
+        # (and its error messages), reading its floats back as shortest decimals
+        return cls(Fraction(repr(c)) for c in _parse_polynomial_legacy(s))
+
+    @property
+    def _low(self):
+        return list(reversed(self.coeffs))
+
+    @property
+    def degree(self):
+        return len(self.coeffs) - 1
+
+    @property
+    def leading(self):
+        return self.coeffs[0] if self.coeffs else 0
+
+    def __len__(self):
+        return len(self.coeffs)
+
+    def __bool__(self):
+        return bool(self.coeffs)
+
+    def __eq__(self, other):
+        if isinstance(other, ExactPolynomial):
+            return self.coeffs == other.coeffs
+        if isinstance(other, numbers.Rational):
+            return self.coeffs == ExactPolynomial([other]).coeffs
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.coeffs)
+
+    def __repr__(self):
+        return f"ExactPolynomial({list(self.coeffs)!r})"
+
+    def __call__(self, x):
+        """Evaluate by Horner's rule; exact for int and Fraction x."""
+        acc = 0
+        for c in self.coeffs:
+            acc = acc * x + c
+        return acc
+
+    @staticmethod
+    def _wrap(other):
+        if isinstance(other, ExactPolynomial):
+            return other
+        if isinstance(other, numbers.Rational) and not isinstance(other, bool):
+            return ExactPolynomial([other])
+        return None
+
+    def __neg__(self):
+        return ExactPolynomial._from_low([-c for c in self._low])
+
+    def __add__(self, other):
+        other = self._wrap(other)
+        if other is None:
+            return NotImplemented
+        return ExactPolynomial._from_low([_coerce(c) for c in _add(self._low, other._low)])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = self._wrap(other)
+        if other is None:
+            return NotImplemented
+        return ExactPolynomial._from_low([_coerce(c) for c in _sub(self._low, other._low)])
+
+    def __rsub__(self, other):
+        other = self._wrap(other)
+        if other is None:
+            return NotImplemented
+        return other - self
+
+    def __mul__(self, other):
+        other = self._wrap(other)
+        if other is None:
+            return NotImplemented
+        return ExactPolynomial._from_low(_mul(self._low, other._low))
+
+    __rmul__ = __mul__
+
+    def __pow__(self, n):
+        if not isinstance(n, int) or n < 0:
+            raise ValueError("exponent must be a non-negative int")
+        result = [1]
+        base = self._low
+        while n:
+            if n & 1:
+                result = _mul(result, base)
+            n >>= 1
+            if n:
+                base = _mul(base, base)
+        return ExactPolynomial._from_low(result)
+
+    def __divmod__(self, other):
+        other = self._wrap(other)
+        if other is None:
+            return NotImplemented
+        q, r = _divmod(self._low, other._low)
+        return ExactPolynomial._from_low(q), ExactPolynomial._from_low(r)
+
+    def __floordiv__(self, other):
+        return divmod(self, other)[0]
+
+    def __mod__(self, other):
+        return divmod(self, other)[1]
+
+    def deriv(self):
+        return ExactPolynomial._from_low([c * k for k, c in enumerate(self._low)][1:])
+
+    def compose(self, other):
+        """Return self(other(x)), splitting self in halves around other**(2**k)."""
+        other = self._wrap(other)
+        if other is None:
+            raise TypeError("can only compose with a polynomial or a number")
+        low = self._low
+        if len(low) <= 1:
+            return ExactPolynomial._from_low(low)
+        # powers[k] = other ** (2 ** k)
+        powers = [other._low]
+        while 1 << len(powers) < len(low):
+            powers.append(_mul(powers[-1], powers[-1]))
+
+        def _compose(part, k):
+            # part has at most 2**k coefficients
+            if len(part) <= 1:
+                return list(part)
+            h = 1 << (k - 1)
+            lo = _compose(part[:h], k - 1)
+            hi = _compose(part[h:], k - 1)
+            return _add(lo, _mul(hi, powers[k - 1])) if hi else lo
+
+        return ExactPolynomial._from_low(_compose(low, len(powers)))
+
+    def content(self):
+        """Gcd of the coefficients, as an int or Fraction (0 for the zero polynomial)."""
+        d = _content_denominator(self.coeffs)
+        g = 0
+        for c in self.coeffs:
+            g = math.gcd(g, int(c * d))
+        return _coerce(Fraction(g, d))
+
+    def primitive(self):
+        """self / content, with a positive leading coefficient."""
+        if not self.coeffs:
+            return self
+        g = self.content()
+        if self.leading < 0:
+            g = -g
+        return ExactPolynomial._from_low([_divide(c, g) for c in self._low])
+
+    def to_sparse(self):
+        """Float approximation as a `SparsePolynomial`, e.g. for roots or plotting."""
+        from Polynomial import SparsePolynomial
+        n = self.degree
+        return SparsePolynomial((n - i, float(c)) for i, c in enumerate(self.coeffs) if c)
+
+
+def _prem(a, b):
+    """Pseudo-remainder of low-first int lists: lc(b)**k * a mod b, in ints."""
+    r = list(a)
+    lead = b[-1]
+    while len(r) >= len(b):
+        c = r[-1]
+        shift = len(r) - len(b)
+        r = [lead * x for x in r]
+        for j, bj in enumerate(b):
+            r[shift + j] -= c * bj
+        _trim(r)
+    return r
+
+
+def gcd(a, b):
+    """Greatest common divisor of two polynomials.
+
+    For integer inputs this is the gcd in Z[x]: the gcd of the contents
+    times the primitive gcd, with a positive leading coefficient. If either
+    input has Fraction coefficients the monic gcd over Q is returned.
+    Works on primitive pseudo-remainders, so coefficients stay integers
+    of modest size throughout.
+    """
+    a, b = ExactPolynomial._wrap(a), ExactPolynomial._wrap(b)
+    if a is None or b is None:
+        raise TypeError("gcd needs polynomials or numbers")
+    rational = any(c.denominator != 1 for c in a.coeffs + b.coeffs)
+    # the content of the zero polynomial is 0, so it drops out here
+    content = 1 if rational else math.gcd(int(a.content()), int(b.content()))
+    u, v = a.primitive()._low, b.primitive()._low
+    if len(u) < len(v):
+        u, v = v, u
+    while v:
+        r = _prem(u, v)
+        u, v = v, ExactPolynomial._from_low(r).primitive()._low
+    g = ExactPolynomial._from_low(u).primitive()
+    if rational:
+        lead = g.leading
+        return ExactPolynomial._from_low([_divide(c, lead) for c in g._low])
+    return g * content
+
+
+def check():
+    """Regression checks for Fraction arithmetic that once left integral Fractions behind."""
+    p = ExactPolynomial([2, Fraction(1, 2), 4, 6])
+    q, r = divmod(p, ExactPolynomial([2, 0, 0]))
+    assert q * ExactPolynomial([2, 0, 0]) + r == p
+    assert all(type(c) is int for c in r.coeffs), r
+    assert gcd(r, ExactPolynomial([2, 3])) == ExactPolynomial([2, 3])
+    assert gcd(ExactPolynomial([Fraction(1, 2), 1]), ExactPolynomial([1, 2])) == ExactPolynomial([1, 2])
+    print("Fraction remainders and gcd: ok")
+
+
+def benchmark(degrees=(1_000, 10_000, 100_000), coef_range=1000, seed=0):
+    """Time Karatsuba against the NTT on random integer polynomials.
+
+    Karatsuba is skipped above degree 20000; where both run their products
+    are compared exactly. The NTT product is checked against p(x) q(x) at
+    a random point modulo a large prime.
+    """
+    import random
+
+    rng = random.Random(seed)
+    modulus = (1 << 61) - 1
+    results = []
+    print(f"{'degree':>8} {'karatsuba s':>12} {'ntt s':>8} {'check':>6}")
+    for n in degrees:
+        a = [rng.randint(-coef_range, coef_range) for _ in range(n + 1)]
+        b = [rng.randint(-coef_range, coef_range) for _ in range(n + 1)]
+        t_kara = None
+        if n <= 20_000:
+            t0 = time.perf_counter()
+            ref = _karatsuba(a, b)
+            t_kara = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        out = _ntt_mul(a, b)
+        t_ntt = time.perf_counter() - t0
+        if out is None:
+            raise RuntimeError("NTT multiplication needs numpy")
+        x = rng.randrange(modulus)
+
+        def _at(low):
+            acc = 0
+            for c in reversed(low):
+                acc = (acc * x + c) % modulus
+            return acc
+
+        ok = _at(out) == _at(a) * _at(b) % modulus
+        if t_kara is not None:
+            ok = ok and out == ref
+        results.append({"degree": n, "karatsuba_s": t_kara, "ntt_s": t_ntt, "ok": ok})
+        kara = f"{t_kara:12.3f}" if t_kara is not None else f"{'-':>12}"
+        print(f"{n:>8} {kara} {t_ntt:8.3f} {'ok' if ok else 'FAIL':>6}")
+    return results
+
+
+if __name__ == "__main__":
+    check()
+    benchmark()
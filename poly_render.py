@@ -0,0 +1,244 @@
+# Elias Daniel Macero Gutierrez
+# Headless bulk rendering of polynomial graphs to PNG/SVG
+# Date 10/18/2026
+# Version 1.0.0
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+    import matplotlib.ticker as mticker
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+except Exception as exc:
+    raise RuntimeError("poly_render requires numpy and matplotlib") from exc
+
+from Polynomial import (
+    _AxisArrows, _adaptive_sample, _as_sparse, _format_poly_label,
+    _pixel_scales, _view_ylim,
+)
+from parallel import chunked, imap_unordered
+
+
+class PolyRenderer:
+    """One Agg figure that draws polynomial after polynomial.
+
+    Builds the same Desmos-like graph as `polynomial_grapher` (glow, root
+    and critical point markers with labels, axis arrows, integer ticks),
+    but without pyplot, `plt.show()` or any interactive callbacks. All
+    artists are created once; `render()` only swaps line data, labels and
+    annotation positions before saving, so each image skips figure setup.
+    """
+
+    def __init__(self, figsize=(10, 6), dpi=100, pixel_tol=0.5, half_span=5.0):
+        self.pixel_tol = pixel_tol
+        self.half_span = half_span
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        fig.patch.set_facecolor("white")
+        ax = fig.add_subplot()
+        ax.set_facecolor("white")
+        ax.set_xlim(-half_span, half_span)
+        ax.set_ylim(-half_span, half_span)
+        self.fig = fig
+        self.ax = ax
+
+        base_color = (0.0, 0.4, 0.8)  # blue
+        self.glow = [ax.plot([], [], linewidth=w, color=base_color, alpha=a,
+                             solid_capstyle='round', zorder=1)[0]
+                     for w, a in [(8, 0.05), (5, 0.08), (3, 0.12)]]
+        self.line = ax.plot([], [], linewidth=2.6, color=base_color, zorder=2,
+                            solid_capstyle='round')[0]
+        self.root_markers = ax.plot([], [], 'o', linestyle='none', color='firebrick',
+                                    markersize=6, zorder=6)[0]
+        self.crit_markers = ax.plot([], [], 's', linestyle='none', color='darkorange',
+                                    markersize=5, zorder=6)[0]
+        # label pools grow to the largest count seen and are hidden when unused
+        self.root_labels = []
+        self.crit_labels = []
+
+        ax.spines['left'].set_position('zero')
+        ax.spines['bottom'].set_position('zero')
+        ax.spines['right'].set_color('none')
+        ax.spines['top'].set_color('none')
+        ax.spines['left'].set_zorder(3)
+        ax.spines['bottom'].set_zorder(3)
+        self.arrows = _AxisArrows(ax)
+
+        max_ticks = 21  # cap to avoid huge numbers of ticks
+        integer_label = mticker.FuncFormatter(lambda t, _: str(int(t)))
+        ax.xaxis.set_major_locator(mticker.MaxNLocator(nbins=max_ticks, integer=True, prune='both'))
+        ax.yaxis.set_major_locator(mticker.MaxNLocator(nbins=max_ticks, integer=True, prune='both'))
+        ax.xaxis.set_major_formatter(integer_label)
+        ax.yaxis.set_major_formatter(integer_label)
+
+        ax.grid(True, which='major', linestyle='--', linewidth=0.6, color='#dddddd', zorder=0)
+        ax.set_xlabel("x", loc='right')
+        ax.set_ylabel("p(x)", loc='top', rotation=0)
+        self.title = ax.set_title("p(x) = polynomial", fontsize=12)
+        # stands in for the grapher's legend, which would be rebuilt on every call
+        self.formula = ax.text(0.01, 0.99, "", transform=ax.transAxes, ha='left', va='top',
+                               fontsize='small', zorder=7)
+        # the layout does not depend on the polynomial, so it is computed once
+        fig.tight_layout()
+
+    def _labels(self, pool, points, color, offset):
+        """Show one annotation per (x, y) point, reusing artists from `pool`."""
+        while len(pool) < len(points):
+            pool.append(self.ax.annotate("", xy=(0, 0), xytext=offset, textcoords='offset points',
+                                         color=color, fontsize=8, zorder=7))
+        for annot, (x, y) in zip(pool, points):
+            annot.xy = (x, y)
+            annot.set_text(f"{x:.6g}")
+            annot.set_visible(True)
+        for annot in pool[len(points):]:
+            annot.set_visible(False)
+
+    def render(self, coefficient, path, fmt=None):
+        """Draw one polynomial and save it to `path`; returns the seconds taken.
+
+        `coefficient` is anything `polynomial_grapher` accepts. `fmt` is
+        'png' or 'svg' and defaults to the extension of `path`.
+        """
+        t0 = time.perf_counter()
+        p = _as_sparse(coefficient)
+        ax = self.ax
+        real_roots = p.real_roots()
+        real_crit = p.deriv().real_roots() if p.degree >= 1 else []
+
+        x_min, x_max = -self.half_span, self.half_span
+        y_min, y_max = _view_ylim(p, x_min, x_max, real_crit)
+        ax.set_xlim(x_min, x_max)
+        ax.set_ylim(y_min, y_max)
+
+        px_x, px_y = _pixel_scales(ax)
+        init_pts = max(33, 4 * min(p.degree, 2 * len(p)) + 1)
+        x, y = _adaptive_sample(p, x_min, x_max, px_x, px_y, y_view=(y_min, y_max),
+                                pixel_tol=self.pixel_tol, init_pts=init_pts)
+        for line in self.glow:
+            line.set_data(x, y)
+        self.line.set_data(x, y)
+        self.arrows.update()
+
+        roots = [(r, 0.0) for r in real_roots]
+        crit = [(c, v) for c, v in ((c, float(p(c))) for c in real_crit) if np.isfinite(v)]
+        self.root_markers.set_data([r for r, _ in roots], [0.0] * len(roots))
+        self.crit_markers.set_data([c for c, _ in crit], [v for _, v in crit])
+        self._labels(self.root_labels, roots, 'firebrick', (6, 6))
+        self._labels(self.crit_labels, crit, 'darkorange', (6, -10))
+
+        self.title.set_text(f"p(x) = polynomial — Leading coef: {p.leading:.6g}")
+        self.formula.set_text(_format_poly_label(p))
+
+        self.fig.savefig(path, format=fmt)
+        return time.perf_counter() - t0
+
+
+# one renderer per worker process, created by the pool initializer
+_worker_renderer = None
+
+
+def _init_worker(renderer_kwargs):
+    global _worker_renderer
+    _worker_renderer = PolyRenderer(**renderer_kwargs)
+
+
+def _render_chunk(chunk, out_dir, fmt, name_format, renderer=None):
+    """Render (index, item) pairs, turning failures into error records."""
+    renderer = renderer or _worker_renderer
+    out = []
+    for index, item in chunk:
+        path = os.path.join(out_dir, name_format.format(index=index) + "." + fmt)
+        try:
+            seconds = renderer.render(item, path, fmt=fmt)
+            out.append({"index": index, "path": path, "seconds": seconds})
+        except Exception as exc:
+            out.append({"index": index, "error": f"{type(exc).__name__}: {exc}"})
+    return out
+
+
+def render_batch(polys, out_dir, fmt="png", max_workers=1, chunksize=16,
+                 name_format="poly_{index:05d}", **renderer_kwargs):
+    """Render many polynomials to image files, yielding one record per image.
+
+    Each record is {"index", "path", "seconds"} with the render time of
+    that image, or {"index", "error"} if the input could not be drawn.
+    With `max_workers=1` a single `PolyRenderer` draws everything in this
+    process; otherwise each worker process keeps its own renderer and
+    records arrive as their chunk finishes, not in input order. Extra
+    keyword arguments are passed to `PolyRenderer`.
+    """
+    if fmt not in ("png", "svg"):
+        raise ValueError("fmt must be 'png' or 'svg'")
+    chunks = chunked(enumerate(polys), chunksize)
+    os.makedirs(out_dir, exist_ok=True)
+
+    if max_workers == 1:
+        renderer = PolyRenderer(**renderer_kwargs)
+        for chunk in chunks:
+            yield from _render_chunk(chunk, out_dir, fmt, name_format, renderer)
+        return
+
+    tasks = ((chunk, out_dir, fmt, name_format) for chunk in chunks)
+    for records in imap_unordered(_render_chunk, tasks, max_workers,
+                                  initializer=_init_worker, initargs=(renderer_kwargs,)):
+        yield from records
+
+
+def _report(records):
+    """Print per-image render times as they arrive and a summary at the end."""
+    times = []
+    errors = 0
+    for rec in records:
+        if "error" in rec:
+            errors += 1
+            print(f"{rec['index']:>6}  error  {rec['error']}")
+            continue
+        times.append(rec["seconds"])
+        print(f"{rec['index']:>6}  {rec['seconds'] * 1000:8.1f} ms  {rec['path']}")
+    if times:
+        t = np.array(times)
+        print(f"{len(times)} images, {errors} errors: mean {t.mean() * 1000:.1f} ms, "
+              f"median {np.median(t) * 1000:.1f} ms, max {t.max() * 1000:.1f} ms")
+    return times
+
+
+def benchmark(n=100, out_dir="render_bench", fmt="png", seed=0):
+    """Compare a fresh figure per image against one reused `PolyRenderer`."""
+    import random
+    from Polynomial import _random_formula
+
+    rng = random.Random(seed)
+    formulas = [_random_formula(rng) for _ in range(n)]
+    os.makedirs(out_dir, exist_ok=True)
+    results = {}
+
+    t0 = time.perf_counter()
+    for i, s in enumerate(formulas):
+        PolyRenderer().render(s, os.path.join(out_dir, f"fresh_{i:05d}.{fmt}"), fmt=fmt)
+    results["fresh"] = (time.perf_counter() - t0) / n
+
+    t0 = time.perf_counter()
+    for rec in render_batch(formulas, out_dir, fmt=fmt, name_format="reused_{index:05d}"):
+        if "error" in rec:
+            raise RuntimeError(rec["error"])
+    results["reused"] = (time.perf_counter() - t0) / n
+
+    print(f"{n} {fmt} images")
+    print(f"  new figure per image : {results['fresh'] * 1000:.1f} ms/image")
+    print(f"  reused renderer      : {results['reused'] * 1000:.1f} ms/image "
+          f"({results['fresh'] / results['reused']:.1f}x)")
+    return results
+
+
+if __name__ == "__main__":
+    # python poly_render.py OUT_DIR [png|svg] [WORKERS] < formulas.txt
+    if len(sys.argv) < 2:
+        print("usage: python poly_render.py OUT_DIR [png|svg] [WORKERS] < formulas.txt")
+        sys.exit(2)
+    out_dir = sys.argv[1]
+    fmt = sys.argv[2] if len(sys.argv) > 2 else "png"
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    lines = (line.strip() for line in sys.stdin)
+    _report(render_batch((line for line in lines if line), out_dir, fmt=fmt, max_workers=workers))
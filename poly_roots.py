@@ -0,0 +1,634 @@
+# Elias Daniel Macero Gutierrez
+# Real-root isolation for high-degree polynomials
+# Date 10/18/2026
+# Version 1.0.0
+import math
+import time
+
+try:
+    import numpy as np
+except Exception as exc:
+    raise RuntimeError("poly_roots requires numpy") from exc
+
+# Relative safety margin on the disk tests, to absorb rounding in the FFT.
+_MARGIN = 1e-9
+# A disk is treated as rounding noise (part of a root cluster) while the
+# largest |p| on it stays within this factor of the noise bound; near a
+# k-fold root the computed p wanders around the bound over a region about
+# eps**(1/k) wide, and a tighter test keeps splitting that region forever.
+_NOISE_SLACK = 16.0
+# Disk tests allowed per isolated interval, so that isolation costs at
+# most O(degree**2) work; intervals still open after that are only
+# searched for sign changes.
+_MAX_TESTS = 1000
+# Largest degree of the eigenvalue problem used to split a root cluster:
+# polynomials up to this degree are solved whole, larger ones through a
+# local Taylor model of at most this degree.
+_LOCAL_DEGREE = 64
+# Intervals are split slightly off-center so that simple roots such as 1/2
+# or 1/4 do not land exactly on a split point.
+_SPLIT = 0.49
+
+
+def _horner(coeffs, x):
+    """Return (p(x), p'(x)) for coeffs highest-degree first."""
+    p = 0.0
+    dp = 0.0
+    for c in coeffs:
+        dp = dp * x + p
+        p = p * x + c
+    return p, dp
+
+
+def _taylor(coeffs, center, radius, n_fft):
+    """Coefficients q_k of q(t) = p(center + radius * t), for k = 0..degree.
+
+    p is evaluated at `n_fft` points on the circle |x - center| = radius and
+    an FFT turns those values back into Taylor coefficients. This costs
+    O(degree * n_fft) and never forms powers of the center or radius.
+    Also returns the largest |p| seen on the circle.
+    """
+    z = center + radius * np.exp(2j * np.pi * np.arange(n_fft) / n_fft)
+    acc = np.full(n_fft, coeffs[0], dtype=complex)
+    for c in coeffs[1:]:
+        acc *= z
+        acc += c
+    return np.fft.fft(acc)[:len(coeffs)] / n_fft, float(np.max(np.abs(acc)))
+
+
+def _disk_coeffs(coeffs, center, radius, n_fft):
+    """|q_k| and the largest |p| on the circle; see `_taylor`."""
+    q, peak = _taylor(coeffs, center, radius, n_fft)
+    return np.abs(q), peak
+
+
+def _count_test(q, noise, k):
+    """Pellet test: True if exactly k roots lie in the disk (|q_k| dominates)."""
+    rest = float(q.sum()) - q[k]
+    return q[k] > (1.0 + _MARGIN) * rest + noise
+
+
+def _refine(coeffs, a, b, fa):
+    """Newton iteration safeguarded by bisection on a bracket with a sign change."""
+    tol = 4 * np.finfo(float).eps
+    x = 0.5 * (a + b)
+    for _ in range(200):
+        fx, dfx = _horner(coeffs, x)
+        if fx == 0.0:
+            return x
+        if (fx < 0) == (fa < 0):
+            a, fa = x, fx
+        else:
+            b = x
+        step = fx / dfx if dfx != 0.0 else 0.0
+        x_new = x - step
+        if not (a < x_new < b):
+            x_new = 0.5 * (a + b)
+        if abs(x_new - x) <= tol * max(1.0, abs(x_new)) or b - a <= tol:
+            return x_new
+        x = x_new
+    return x
+
+
+def _deriv(coeffs):
+    n = len(coeffs) - 1
+    return [c * (n - i) for i, c in enumerate(coeffs[:-1])]
+
+
+class _Disk:
+    """Taylor data of one polynomial on disks centered on the real axis.
+
+    `tests` counts the calls of `test`.
+    """
+
+    def __init__(self, coeffs):
+        self.coeffs = coeffs
+        self.degree = len(coeffs) - 1
+        self.n_fft = 1 << max(3, self.degree.bit_length())
+        self.abs_coeffs = [abs(c) for c in coeffs]
+        self.tests = 0
+
+    def _noise(self, center, radius, peak):
+        """Rounding error bound of Horner's rule on the disk, plus the FFT's."""
+        eps = np.finfo(float).eps
+        return (4 * self.degree * eps * _horner(self.abs_coeffs, abs(center) + radius)[0]
+                + self.n_fft * eps * peak)
+
+    def test(self, center, radius):
+        """Return (|q_k|, largest |p| on the circle, rounding noise bound)."""
+        self.tests += 1
+        q, peak = _disk_coeffs(self.coeffs, center, radius, self.n_fft)
+        return q, peak, self._noise(center, radius, peak)
+
+    def local_roots(self, a, b):
+        """Roots of the Taylor model of p within the disk around [a, b], or None.
+
+        The model keeps the Taylor terms at the center of [a, b] that stand
+        above rounding noise on a disk twice as wide, so it is only an
+        eigenvalue problem of that (small) degree. None if more than
+        `_LOCAL_DEGREE` terms matter.
+        """
+        center, radius = 0.5 * (a + b), b - a
+        q, peak = _taylor(self.coeffs, center, radius, self.n_fft)
+        big = np.nonzero(np.abs(q) > self._noise(center, radius, peak))[0]
+        if not big.size:
+            return []
+        d = int(big[-1])
+        if d > _LOCAL_DEGREE:
+            return None
+        # the model is real up to rounding, and [a, b] is |t| <= 1/2
+        t = np.roots(q[d::-1].real) if d else []
+        return [center + radius * complex(x) for x in t if abs(x) <= 0.5]
+
+
+def _cluster_root(disk, a, b, k, tol):
+    """Locate a cluster of exactly k roots known to lie in the disk around [a, b].
+
+    The cluster's center is the root of the (k-1)-th derivative in [a, b].
+    The disk around it is shrunk while it still holds all k roots. Returns
+    the center if the cluster is tighter than `tol` or than rounding noise
+    allows to resolve, False if those k roots are all non-real, and None if
+    they are spread out and [a, b] should just be split further.
+    """
+    d = disk.coeffs
+    for _ in range(k - 1):
+        d = _deriv(d)
+    fa = _horner(d, a)[0]
+    fb = _horner(d, b)[0]
+    if fa == 0.0 or fb == 0.0:
+        x = a if fa == 0.0 else b
+    elif (fa < 0) != (fb < 0):
+        x = _refine(d, a, b, fa)
+    else:
+        return None
+    rho = 0.5 * (b - a)
+    while rho > tol * max(1.0, abs(x)):
+        rho /= 8.0
+        q, _, noise = disk.test(x, rho)
+        if _count_test(q, noise, k):
+            continue
+        if q[:k].sum() > 2 * noise:
+            return None  # the roots separate at this scale
+        break  # rounding noise: the cluster cannot be resolved further
+    # an odd cluster always holds a real root; an even one is real only if
+    # p vanishes (to rounding) at its center
+    _, peak, noise = disk.test(x, 0.0)
+    if k % 2 == 0 and peak > _NOISE_SLACK * noise:
+        return False
+    return x
+
+
+def _sign_roots(coeffs, a, b, pieces=8):
+    """Roots of p at the sign changes between `pieces` + 1 points of [a, b]."""
+    xs = [a + (b - a) * i / pieces for i in range(pieces)] + [b]
+    fs = [_horner(coeffs, x)[0] for x in xs]
+    roots = [x for x, f in zip(xs, fs) if f == 0.0]
+    for x0, x1, f0, f1 in zip(xs, xs[1:], fs, fs[1:]):
+        if f0 != 0.0 and f1 != 0.0 and (f0 < 0) != (f1 < 0):
+            roots.append(_refine(coeffs, x0, x1, f0))
+    return roots
+
+
+def _isolate(coeffs, lo, hi, tol):
+    """Real roots of `coeffs` in [lo, hi], a subinterval of [-1, 1].
+
+    Returns (roots, clusters): the isolated roots and the intervals on
+    which p is rounding noise, each holding a multiple root or several
+    roots too close to tell apart.
+    """
+    disk = _Disk(coeffs)
+    roots = []
+    clusters = []
+    f_lo = _horner(coeffs, lo)[0]
+    f_hi = _horner(coeffs, hi)[0]
+    stack = [(lo, hi)]
+    while stack:
+        if disk.tests >= _MAX_TESTS:
+            # out of budget: keep only the roots that sign changes give away
+            for a, b in stack:
+                roots.extend(_sign_roots(coeffs, a, b))
+            break
+        a, b = stack.pop()
+        center = 0.5 * (a + b)
+        radius = 0.5 * (b - a)
+        q, peak, noise = disk.test(center, radius)
+        if peak <= _NOISE_SLACK * noise:
+            # p is numerically zero on the whole disk: part of a root cluster
+            clusters.append((a, b))
+            continue
+        if _count_test(q, noise, 0):
+            continue  # no root anywhere in the disk around [a, b]
+        if _count_test(q, noise, 1):
+            # one root in a disk symmetric about the real axis must be real
+            fa = _horner(coeffs, a)[0]
+            fb = _horner(coeffs, b)[0]
+            if fa == 0.0 or fb == 0.0:
+                roots.append(a if fa == 0.0 else b)
+                continue
+            if (fa < 0) != (fb < 0):
+                roots.append(_refine(coeffs, a, b, fa))
+                continue
+        k = int(np.argmax(q))
+        if k >= 2 and _count_test(q, noise, k):
+            x = _cluster_root(disk, a, b, k, tol)
+            if x is False:
+                continue
+            if x is not None:
+                roots.append(x)
+                continue
+        if radius <= tol:
+            # the edge of a root cluster that cannot be split any further
+            clusters.append((a, b))
+            continue
+        split = a + _SPLIT * (b - a)
+        stack.append((split, b))
+        stack.append((a, split))
+
+    # Around a multiple root the computed p is rounding noise over a small
+    # region, which leaves clusters separated by tiny gaps; they are one root.
+    gap = math.sqrt(tol)
+    clusters.sort()
+    merged = []
+    clusters_out = []
+    for a, b in clusters:
+        if merged and a - merged[-1][1] <= gap * max(1.0, abs(a)):
+            merged[-1][1] = max(merged[-1][1], b)
+        else:
+            merged.append([a, b])
+    for a, b in merged:
+        if a == lo and f_lo == 0.0:
+            roots.append(lo)  # a root exactly on the boundary of the search
+        elif b == hi and f_hi == 0.0:
+            roots.append(hi)
+        else:
+            clusters_out.append((a, b))
+    return roots, clusters_out
+
+
+def _polish(coeffs, x):
+    """One Newton step on p itself, kept only if it lowers |p(x)|."""
+    fx, dfx = _horner(coeffs, x)
+    if fx == 0.0 or dfx == 0.0 or not math.isfinite(fx / dfx):
+        return x
+    x_new = x - fx / dfx
+    f_new = _horner(coeffs, x_new)[0]
+    return x_new if math.isfinite(f_new) and abs(f_new) < abs(fx) else x
+
+
+def _dedup(roots, tol):
+    roots.sort()
+    out = []
+    for r in roots:
+        if out and abs(r - out[-1]) <= 8 * tol * max(1.0, abs(r)):
+            continue
+        out.append(r)
+    return out
+
+
+def _isolate_all(coeffs, lo, hi, tol):
+    """Roots of `coeffs` (no root at 0) in [lo, hi], on p near [-1, 1] and on the reversal outside."""
+    roots = []
+    clusters = []
+    # |x| <= edge on p itself; the edge sits just past 1 (where (1 + 1/n)**n
+    # is still small) so that the common roots x = +-1 are not on a boundary
+    edge = 1.0 + 1.0 / (math.pi * (len(coeffs) - 1))
+    a, b = max(lo, -edge), min(hi, edge)
+    if a <= b:
+        found, noisy = _isolate(coeffs, a, b, tol)
+        roots.extend(found)
+        clusters.extend(noisy)
+
+    # |x| >= edge through y = 1/x on the reversed polynomial
+    rev = coeffs[::-1]
+    spans = []
+    if hi > edge:
+        spans.append((1.0 / hi if math.isfinite(hi) else 0.0, 1.0 / max(lo, edge)))
+    if lo < -edge:
+        spans.append((1.0 / min(hi, -edge), 1.0 / lo if math.isfinite(lo) else 0.0))
+    for y_lo, y_hi in spans:
+        if y_lo > y_hi:
+            continue
+        found, noisy = _isolate(rev, y_lo, y_hi, tol)
+        roots.extend(_polish(coeffs, 1.0 / y) for y in found if y != 0.0)
+        clusters.extend((1.0 / yb if yb else -math.inf, 1.0 / ya if ya else math.inf)
+                        for ya, yb in noisy)
+    roots.extend(_resolve_clusters(coeffs, clusters, tol))
+    return roots
+
+
+def _distinct_roots(zs):
+    """Real parts of the model roots `zs` if they are distinct real roots blurred by rounding, else None.
+
+    Rounding spreads a k-fold root over a circle, so the imaginary parts
+    reach about half the spread of the real parts; roots that are really
+    distinct and real stay much closer to the axis (Wilkinson's polynomial
+    gives under a tenth).
+    """
+    if len(zs) < 3:
+        return None
+    re = [z.real for z in zs]
+    spread = max(re) - min(re)
+    if not (spread > 0 and max(abs(z.imag) for z in zs) < 0.4 * spread):
+        return None
+    # a pair m +- is stands for two real roots m +- s whose discriminant
+    # rounding turned negative
+    roots = []
+    for z in zs:
+        if z.imag == 0:
+            roots.append(z.real)
+        elif z.imag > 0:
+            roots.extend((z.real - z.imag, z.real + z.imag))
+    return sorted(roots)
+
+
+def _resolve_clusters(coeffs, clusters, tol):
+    """One root per noise cluster (a, b), unless a local model shows it hides several.
+
+    Clusters meeting at the edge between p and its reversal are one
+    cluster. Each is modelled by the Taylor expansion of p (or, far from
+    0, of the reversal) on its own disk, see `_Disk.local_roots`; up to
+    degree `_LOCAL_DEGREE` the eigenvalues of p itself near the cluster
+    are used instead, which is no dearer and more accurate. The roots of
+    the model tell a multiple root, reported once at the cluster's
+    center, from distinct roots that the disk tests cannot separate (as
+    in Wilkinson's polynomial), which are all reported; see
+    `_distinct_roots`.
+    """
+    gap = math.sqrt(tol)
+    merged = []
+    for a, b in sorted(clusters):
+        if merged and a - merged[-1][1] <= gap * max(1.0, abs(a)):
+            merged[-1][1] = max(merged[-1][1], b)
+        else:
+            merged.append([a, b])
+    eig = np.roots(coeffs) if merged and len(coeffs) - 1 <= _LOCAL_DEGREE else None
+    roots = []
+    for a, b in merged:
+        if eig is not None and math.isfinite(a) and math.isfinite(b):
+            center = 0.5 * (a + b)
+            inside = _distinct_roots([complex(z) for z in eig if abs(z - center) <= 0.5 * (b - a)])
+        elif max(abs(a), abs(b)) <= 2.0:
+            center = 0.5 * (a + b)
+            inside = _distinct_roots(_Disk(coeffs).local_roots(a, b) or [])
+        elif a * b > 0 and math.isfinite(a) and math.isfinite(b):
+            # on the reversal y = 1/x, where the cluster is [1/b, 1/a]
+            center = 2.0 / (1.0 / a + 1.0 / b)
+            inside = _distinct_roots(_Disk(coeffs[::-1]).local_roots(1.0 / b, 1.0 / a) or [])
+            if inside:
+                inside = [_polish(coeffs, 1.0 / y) for y in inside if y != 0.0]
+        else:
+            center, inside = 0.5 * (a + b), None
+        if inside:
+            roots.extend(inside)
+        elif math.isfinite(center):
+            roots.append(center)
+    return roots
+
+
+def real_roots(coeffs, lo=-math.inf, hi=math.inf, tol=1e-12):
+    """Return the distinct real roots of a polynomial that lie in [lo, hi].
+
+    `coeffs` is a dense list, highest degree first, as returned by
+    `_parse_polynomial_input`. Roots near [-1, 1] are isolated on p itself
+    and roots outside it on the reversed polynomial x**n p(1/x), so every
+    evaluation stays on (about) the unit disk and cannot overflow. Intervals are
+    bisected until a Pellet test on the interval's disk proves it has no
+    root or exactly one; each single root is then polished with a
+    safeguarded Newton iteration. A tight cluster of k roots (a multiple
+    root) is reported once, at the root of the (k-1)-th derivative.
+    Where p is lost in rounding noise, a small eigenvalue problem on the
+    local Taylor model tells a multiple root from distinct ones.
+    A polynomial of degree n costs O(n**2) per tested interval, and at
+    most `_MAX_TESTS` intervals are tested, instead of an O(n**3)
+    eigen-solve; past that budget only sign changes are searched.
+    """
+    coeffs = [float(c) for c in coeffs]
+    lo, hi = float(lo), float(hi)
+    while coeffs and coeffs[0] == 0.0:
+        coeffs.pop(0)
+    if lo > hi or len(coeffs) < 2:
+        return []
+
+    roots = []
+    # x = 0 with multiplicity k: split off exactly
+    if coeffs[-1] == 0.0:
+        while coeffs[-1] == 0.0:
+            coeffs.pop()
+        if lo <= 0.0 <= hi:
+            roots.append(0.0)
+        if len(coeffs) < 2:
+            return roots
+
+    roots.extend(_isolate_all(coeffs, lo, hi, tol))
+    return _dedup([r for r in roots if lo <= r <= hi], tol)
+
+
+class _Fewnomial:
+    """sum c * x**e for x > 0, evaluated in log scale so that no power overflows."""
+
+    def __init__(self, terms):
+        self.exps = np.array([e for e, _ in terms], dtype=float)
+        self.logs = np.log(np.abs([c for _, c in terms]))
+        self.signs = np.sign([c for _, c in terms])
+
+    def scaled(self, x):
+        """Return (p(x), x p'(x), noise), all divided by the largest |c x**e|.
+
+        `noise` bounds the rounding error of the scaled p(x), including
+        the error of each term's log.
+        """
+        t = self.logs + self.exps * math.log(x)
+        w = np.exp(t - t.max())
+        s = float(self.signs @ w)
+        ds = float((self.signs * self.exps) @ w)
+        noise = 4 * np.finfo(float).eps * float(w @ (len(w) + np.abs(t)))
+        return s, ds, noise
+
+
+def _refine_fewnomial(f, a, b, sa):
+    """`_refine` for a `_Fewnomial` on 0 < a < b; bisects geometrically while b / a is large."""
+    tol = 4 * np.finfo(float).eps
+    x = math.sqrt(a * b)
+    width = b - a
+    for _ in range(200):
+        s, ds, noise = f.scaled(x)
+        if abs(s) <= noise:
+            return x
+        if (s < 0) == (sa < 0):
+            a = x
+        else:
+            b = x
+        x_new = x - x * s / ds if ds != 0.0 else x
+        # far from the root one power dominates and Newton crawls: bisect
+        # whenever the bracket did not at least halve
+        if not (a < x_new < b) or b - a > 0.5 * width:
+            x_new = math.sqrt(a * b) if b > 4 * a else 0.5 * (a + b)
+        if abs(x_new - x) <= tol * x_new or b - a <= tol * b:
+            return x_new
+        x, width = x_new, b - a
+    return x
+
+
+def _fewnomial_roots(terms, lo, hi):
+    """Positive roots in (lo, hi) of sum c * x**e, `terms` highest exponent first.
+
+    p has at most as many positive roots as its coefficients have sign
+    changes (Descartes). Otherwise the positive roots of (p / x**low)',
+    which has one term fewer, cut (lo, hi) into pieces where p is
+    monotone, each holding at most one root. A critical point where p is
+    within rounding noise is a multiple root.
+    """
+    changes = sum((a < 0) != (b < 0) for (_, a), (_, b) in zip(terms, terms[1:]))
+    if changes == 0:
+        return []
+    if len(terms) == 2:
+        (e1, c1), (e0, c0) = terms
+        x = math.exp(math.log(-c0 / c1) / (e1 - e0))
+        return [x] if lo < x < hi else []
+    f = _Fewnomial(terms)
+    crit = []
+    if changes > 1:
+        low = terms[-1][0]
+        crit = _fewnomial_roots([(e - low - 1, c * (e - low)) for e, c in terms[:-1]], lo, hi)
+    points = [lo] + crit + [hi]
+    signs = []
+    for x in points:
+        s, _, noise = f.scaled(x)
+        signs.append(0.0 if abs(s) <= noise else math.copysign(1.0, s))
+    roots = [x for x, s in zip(points[1:-1], signs[1:-1]) if s == 0.0]
+    for a, b, sa, sb in zip(points, points[1:], signs, signs[1:]):
+        if sa * sb < 0:
+            roots.append(_refine_fewnomial(f, a, b, sa))
+    return sorted(roots)
+
+
+def _positive_roots(terms):
+    """All positive roots of sum c * x**e, bracketed by bounds read off the terms.
+
+    A root x has |c_n| x**n <= sum |c_i| x**e_i, so x <= max over i of
+    ((m - 1) |c_i| / |c_n|) ** (1 / (n - e_i)) for m terms; the lower
+    bound is the same on the lowest term.
+    """
+    m = len(terms)
+    if m < 2:
+        return []
+    logs = [math.log(abs(c)) for _, c in terms]
+    n, e0 = terms[0][0], terms[-1][0]
+    log_hi = max((math.log(m - 1) + logs[i] - logs[0]) / (n - e) for i, (e, _) in enumerate(terms[1:], 1))
+    log_lo = min((logs[-1] - math.log(m - 1) - logs[i]) / (e - e0) for i, (e, _) in enumerate(terms[:-1]))
+    lo = math.exp(max(log_lo - math.log(2.0), -700.0))
+    hi = math.exp(min(log_hi + math.log(2.0), 700.0))
+    return _fewnomial_roots(terms, lo, hi)
+
+
+def sparse_real_roots(terms, lo=-math.inf, hi=math.inf, tol=1e-12):
+    """Return the sorted distinct real roots in [lo, hi] of sum c * x**e.
+
+    `terms` are (exponent, coefficient) pairs, as in
+    `Polynomial.SparsePolynomial`. The work grows with the number of
+    terms m and not with the degree: evaluating costs O(m) in log scale,
+    and the roots are found by recursing on derivatives with one term
+    fewer, so `x^100000 + x - 1` is as cheap as `x^3 + x - 1`. Negative
+    roots are the positive roots of p(-x).
+    """
+    terms = sorted(((int(e), float(c)) for e, c in terms if c != 0), reverse=True)
+    lo, hi = float(lo), float(hi)
+    if lo > hi or not terms:
+        return []
+    low = terms[-1][0]
+    roots = [0.0] if low > 0 and lo <= 0.0 <= hi else []
+    terms = [(e - low, c) for e, c in terms]
+    if hi > 0.0:
+        roots.extend(x for x in _positive_roots(terms) if lo <= x <= hi)
+    if lo < 0.0:
+        mirrored = [(e, -c if e % 2 else c) for e, c in terms]
+        roots.extend(-x for x in _positive_roots(mirrored) if lo <= -x <= hi)
+    return _dedup(roots, tol)
+
+
+def _numpy_real_roots(coeffs):
+    """Real roots the way `polynomial_grapher` used to find them."""
+    r = np.roots(coeffs)
+    return sorted(float(x.real) for x in r if abs(x.imag) < 1e-9 and np.isfinite(x.real))
+
+
+def _backward_error(coeffs, x):
+    """|p(x)| relative to sum |a_k| |x|**k, evaluated on the side where it cannot overflow."""
+    if abs(x) > 1.0:
+        coeffs, x = coeffs[::-1], 1.0 / x
+    num = abs(_horner(coeffs, x)[0])
+    den = _horner([abs(c) for c in coeffs], abs(x))[0]
+    return num / den if den else num
+
+
+def check():
+    """Regression checks on ill-conditioned inputs that once hung or lost roots."""
+    for k in range(1, 16):
+        t0 = time.perf_counter()
+        roots = real_roots(np.poly([1.0] * k).tolist())
+        assert len(roots) == 1 and abs(roots[0] - 1.0) < 0.1, (k, roots)
+        assert time.perf_counter() - t0 < 5.0, (k, "too slow")
+    roots = real_roots(np.poly([0.5] * 6 + [2.0] * 3).tolist())
+    assert len(roots) == 2 and abs(roots[0] - 0.5) < 0.05 and abs(roots[1] - 2.0) < 0.05, roots
+    t0 = time.perf_counter()
+    roots = real_roots(np.poly(np.arange(1, 21)).tolist())
+    assert time.perf_counter() - t0 < 5.0, "Wilkinson's polynomial too slow"
+    assert len(roots) == 20 and all(abs(r - k) < 0.2 for r, k in zip(roots, range(1, 21))), roots
+    # degree 2000: multiple roots are resolved without an O(n**3) eigen-solve
+    rng = np.random.default_rng(1)
+    for root, k in ((0.3, 2), (0.5, 7)):
+        coeffs = np.convolve(rng.standard_normal(2001 - k), np.poly([root] * k)).tolist()
+        t0 = time.perf_counter()
+        roots = real_roots(coeffs)
+        assert time.perf_counter() - t0 < 10.0, (k, "too slow at degree 2000")
+        near = [r for r in roots if abs(r - root) < 0.05]
+        assert len(near) == 1 and abs(near[0] - root) < 1e-3, (k, near)
+    # sparse: the cost follows the number of terms, not the degree
+    for n in (3000, 100000):
+        t0 = time.perf_counter()
+        roots = sparse_real_roots([(n, 1.0), (1, 1.0), (0, -1.0)])
+        assert time.perf_counter() - t0 < 1.0, (n, "sparse roots too slow")
+        assert len(roots) == 2 and all(abs(r ** n + r - 1.0) < 1e-6 for r in roots), (n, roots)
+    assert sparse_real_roots([(100000, 1.0), (1, 1.0), (0, 1.0)]) == []
+    rng = np.random.default_rng(2)
+    for _ in range(200):
+        exps = sorted(rng.choice(13, size=4, replace=False), reverse=True)
+        terms = [(int(e), float(c)) for e, c in zip(exps, rng.standard_normal(4))]
+        dense = [0.0] * (terms[0][0] + 1)
+        for e, c in terms:
+            dense[terms[0][0] - e] = c
+        a, b = sparse_real_roots(terms), real_roots(dense)
+        assert len(a) == len(b) and all(abs(x - y) < 1e-6 * max(1.0, abs(y)) for x, y in zip(a, b)), (terms, a, b)
+    print("multiple roots, Wilkinson's polynomial and sparse roots: ok")
+
+
+def benchmark(degrees=(50, 200, 500, 1000), seed=0):
+    """Compare `real_roots` with `np.roots` on random-coefficient polynomials.
+
+    Reports the time, the number of real roots found and the worst
+    backward error of the returned roots for both methods.
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+    print(f"{'degree':>7} {'np.roots s':>11} {'found':>6} {'err':>9} "
+          f"{'real_roots s':>13} {'found':>6} {'err':>9}")
+    for n in degrees:
+        coeffs = rng.standard_normal(n + 1).tolist()
+        t0 = time.perf_counter()
+        ref = _numpy_real_roots(coeffs)
+        t_np = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        ours = real_roots(coeffs)
+        t_ours = time.perf_counter() - t0
+        err_np = max((_backward_error(coeffs, x) for x in ref), default=0.0)
+        err_ours = max((_backward_error(coeffs, x) for x in ours), default=0.0)
+        results.append({"degree": n, "numpy_s": t_np, "numpy_roots": len(ref), "numpy_err": err_np,
+                        "real_roots_s": t_ours, "real_roots": len(ours), "real_roots_err": err_ours})
+        print(f"{n:>7} {t_np:>11.4f} {len(ref):>6} {err_np:>9.1e} "
+              f"{t_ours:>13.4f} {len(ours):>6} {err_ours:>9.1e}")
+    return results
+
+
+if __name__ == "__main__":
+    check()
+    benchmark()
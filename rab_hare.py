@@ -7,9 +7,13 @@
 
 import os
 import json
-import openai
+import threading
+import time
 from typing import Dict, Any
 
+from race_config import RaceConfig
+from race_render import make_renderer
+
 DEFAULT_VALUES = {
     "min_race_length": 10,
     "recommended_race_length": 20,
@@ -31,66 +35,169 @@ def default_values() -> Dict[str, Any]:
     return DEFAULT_VALUES
 
 
-def fetch_values_from_model() -> Dict[str, Any]:
-    """Ask ChatGPT (via OpenAI API) to return the race parameters as JSON.
+MODEL = "gpt-4"
+# Seconds `rab_hare()` waits for the model before using DEFAULT_VALUES.
+FETCH_DEADLINE = 10.0
+# Seconds to wait for the parameters before showing the race-length prompt.
+STARTUP_GRACE = 0.25
 
-    The model is explicitly instructed to return ONLY a JSON object with the
-    required schema so this program can parse it directly.
-    """
+PROMPT = (
+    "You are designing movement probabilities for a Tortoise and a Hare race.\n"
+    "Return ONLY a JSON object (no explanatory text) with this exact schema:\n"
+    "{\n"
+    "  \"min_race_length\": integer,\n"
+    "  \"recommended_race_length\": integer,\n"
+    "  \"tortoise_moves\": [{\"prob\": int, \"move\": int}, ...],\n"
+    "  \"hare_moves\": [{\"prob\": int, \"move\": int}, ...]\n"
+    "}\n"
+    "Make sure the probabilities for each animal sum to 100. Use integers for probabilities and moves.\n"
+    "Example movements you may use (but you can keep these):\n"
+    "Tortoise options: 50% 3 ahead, 20% 6 back, 30% 1 ahead\n"
+    "Hare options: 20% no move, 20% 9 ahead, 10% 12 back, 30% 1 ahead, 20% 2 back\n"
+    "Choose a sensible `min_race_length` and `recommended_race_length`.\n"
+)
+
+REQUIRED_KEYS = ("min_race_length", "recommended_race_length", "tortoise_moves", "hare_moves")
+
+
+class BackendUnavailable(RuntimeError):
+    """The backend cannot be used at all (no key, no package); not worth reporting as a failure."""
+
+
+def openai_backend(model: str, prompt: str) -> str:
+    """Send `prompt` to the OpenAI chat API and return the reply text."""
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
-        print("OPENAI_API_KEY not set — using default values.")
-        return default_values()
+        raise BackendUnavailable("OPENAI_API_KEY not set")
+    try:
+        import openai
+    except ImportError:
+        raise BackendUnavailable("openai package not installed")
 
     openai.api_key = api_key
-
-    prompt = (
-        "You are designing movement probabilities for a Tortoise and a Hare race.\n"
-        "Return ONLY a JSON object (no explanatory text) with this exact schema:\n"
-        "{\n"
-        "  \"min_race_length\": integer,\n"
-        "  \"recommended_race_length\": integer,\n"
-        "  \"tortoise_moves\": [{\"prob\": int, \"move\": int}, ...],\n"
-        "  \"hare_moves\": [{\"prob\": int, \"move\": int}, ...]\n"
-        "}\n"
-        "Make sure the probabilities for each animal sum to 100. Use integers for probabilities and moves.\n"
-        "Example movements you may use (but you can keep these):\n"
-        "Tortoise options: 50% 3 ahead, 20% 6 back, 30% 1 ahead\n"
-        "Hare options: 20% no move, 20% 9 ahead, 10% 12 back, 30% 1 ahead, 20% 2 back\n"
-        "Choose a sensible `min_race_length` and `recommended_race_length`.\n"
+    response = openai.ChatCompletion.create(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0,
+        max_tokens=500,
+        request_timeout=FETCH_DEADLINE,
     )
+    return response.choices[0].message.content.strip()
+
+
+openai_backend.cache_name = "openai"
 
+
+def stub_backend(path: str | None = None):
+    """Return an offline backend that answers every prompt from a local JSON file.
+
+    Without `path` (or `$RAB_HARE_STUB_FILE`) it answers with DEFAULT_VALUES.
+    """
+    path = path or os.getenv("RAB_HARE_STUB_FILE")
+
+    def _backend(model: str, prompt: str) -> str:
+        if path:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        return json.dumps(DEFAULT_VALUES)
+
+    _backend.cache_name = f"stub:{os.path.abspath(path)}" if path else "stub"
+    return _backend
+
+
+def backend_name(backend) -> str:
+    """The name a backend's replies are cached under: its `cache_name`, else its qualified name."""
+    name = getattr(backend, "cache_name", None)
+    if name:
+        return name
+    qualname = getattr(backend, "__qualname__", type(backend).__qualname__)
+    return f"{getattr(backend, '__module__', '')}.{qualname}"
+
+
+def default_backend():
+    """The backend named by `$RAB_HARE_BACKEND`: 'openai' (default) or 'stub'."""
+    name = os.getenv("RAB_HARE_BACKEND", "openai").lower()
+    if name == "stub":
+        return stub_backend()
+    if name != "openai":
+        raise ValueError(f"Unknown RAB_HARE_BACKEND {name!r}; use 'openai' or 'stub'")
+    return openai_backend
+
+
+def parse_model_reply(content: str) -> Dict[str, Any]:
+    """Parse the JSON object in a model reply and check it against `RaceConfig`.
+
+    Missing keys raise KeyError; malformed moves, or probabilities that do
+    not sum to 100, raise ValueError.
+    """
+    # Attempt to parse JSON. If the model returns code fences or extra text,
+    # try to find the first JSON object inside the content.
     try:
-        response = openai.ChatCompletion.create(
-            model="gpt-4",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0,
-            max_tokens=500,
-        )
-        content = response.choices[0].message.content.strip()
-        # Attempt to parse JSON. If the model returns code fences or extra text,
-        # try to find the first JSON object inside the content.
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError:
-            # Try to extract a JSON substring
-            start = content.find('{')
-            end = content.rfind('}')
-            if start != -1 and end != -1 and end > start:
-                sub = content[start:end+1]
-                data = json.loads(sub)
-            else:
-                raise
-        # Basic validation: check required keys
-        if not all(k in data for k in ("min_race_length", "recommended_race_length", "tortoise_moves", "hare_moves")):
-            print("Model returned JSON missing required keys — falling back to defaults.")
-            return default_values()
-        return data
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        # Try to extract a JSON substring
+        start = content.find('{')
+        end = content.rfind('}')
+        if start != -1 and end != -1 and end > start:
+            sub = content[start:end+1]
+            data = json.loads(sub)
+        else:
+            raise
+    # Basic validation: check required keys
+    if not isinstance(data, dict) or not all(k in data for k in REQUIRED_KEYS):
+        raise KeyError("Model returned JSON missing required keys")
+    RaceConfig.from_values(data)  # ValueError on bad moves or probabilities
+    return data
+
+
+def fetch_values_from_model(backend=None, cache=None, model: str = MODEL) -> Dict[str, Any]:
+    """Ask ChatGPT (via OpenAI API) to return the race parameters as JSON.
+
+    The model is explicitly instructed to return ONLY a JSON object with the
+    required schema so this program can parse it directly.
+
+    `backend(model, prompt) -> str` does the asking; it defaults to
+    `default_backend()`, so `RAB_HARE_BACKEND=stub` runs fully offline.
+    Valid replies are kept in a `ResponseCache` keyed by (backend name,
+    model, prompt hash), so later runs start without a network call and
+    stub replies never shadow the real model's; pass a cache of your own,
+    or `cache=False` to always ask.
+    """
+    from response_cache import ResponseCache
+
+    backend = backend or default_backend()
+    name = backend_name(backend)
+    if cache is None:
+        cache = ResponseCache()
+    if cache:
+        content = cache.get(model, PROMPT, name)
+        if content is not None:
+            try:
+                return parse_model_reply(content)
+            except (ValueError, KeyError, OverflowError, TypeError):
+                pass  # a bad entry is simply fetched again
+
+    try:
+        content = backend(model, PROMPT)
+        data = parse_model_reply(content)
+    except BackendUnavailable as e:
+        print(f"{e} — using default values.")
+        return default_values()
+    except KeyError:
+        print("Model returned JSON missing required keys — falling back to defaults.")
+        return default_values()
     except Exception as e:
         print("OpenAI request failed or returned invalid JSON:", e)
         print("Falling back to default values.")
         return default_values()
 
+    if cache:
+        try:
+            cache.put(model, PROMPT, content, name)
+        except OSError as e:
+            print("Could not write the response cache:", e)
+    return data
+
 
 def print_values(values: Dict[str, Any]) -> None:
     print("\nRace parameters:")
@@ -104,17 +211,66 @@ def print_values(values: Dict[str, Any]) -> None:
         print(f"  - {move['prob']}% -> {move['move']} squares")
 
 
-def rab_hare():
+class BackgroundFetch:
+    """Run `fetch_values_from_model` on a daemon thread with a hard deadline.
+
+    The thread is a daemon, so a request that never returns cannot keep
+    the program alive; once `deadline` seconds have passed since the start
+    its answer is simply ignored.
+    """
+
+    def __init__(self, deadline: float = FETCH_DEADLINE, **fetch_kwargs):
+        self._deadline = time.monotonic() + deadline
+        self._seconds = deadline
+        self._done = threading.Event()
+        self._values = None
+        thread = threading.Thread(target=self._run, kwargs=fetch_kwargs, daemon=True)
+        thread.start()
+
+    def _run(self, **fetch_kwargs):
+        try:
+            self._values = fetch_values_from_model(**fetch_kwargs)
+        except Exception as e:
+            print("Fetching race parameters failed:", e)
+        finally:
+            self._done.set()
+
+    def poll(self, timeout: float = 0.0) -> Dict[str, Any] | None:
+        """The fetched values if they arrive within `timeout` seconds, else None."""
+        timeout = min(timeout, max(0.0, self._deadline - time.monotonic()))
+        if self._done.wait(timeout):
+            return self._values or default_values()
+        return None
+
+    def result(self) -> Dict[str, Any]:
+        """Wait until the deadline at most; fall back to `default_values()`."""
+        values = self.poll(self._deadline - time.monotonic())
+        if values is None:
+            print(f"No race parameters after {self._seconds:g} s — using default values.")
+            return default_values()
+        return values
+
+
+def rab_hare(deadline: float = FETCH_DEADLINE, render="buffered"):
     """Main entry: fetch values from the model (or defaults), print them,
     prompt the user for a race length, then run the race simulation on a
     number line until someone reaches or passes the finish line.
-    """
 
-    values = fetch_values_from_model()
-    print_values(values)
+    The fetch runs in the background while the race length is typed in and
+    is given at most `deadline` seconds, after which the defaults are used.
+    Cached or offline answers arrive before the prompt, so it shows their
+    limits; otherwise the prompt shows the default limits and the answer
+    is checked again once the parameters are in. `render` picks how the
+    race is shown; see `simulate_race`.
+    """
 
-    min_len = int(values.get('min_race_length', 10))
-    recommended = int(values.get('recommended_race_length', min_len))
+    fetch = BackgroundFetch(deadline)
+    values = fetch.poll(STARTUP_GRACE)
+    if values is not None:
+        print_values(values)
+    limits = values or default_values()
+    min_len = int(limits.get('min_race_length', 10))
+    recommended = int(limits.get('recommended_race_length', min_len))
 
     # Ask user for race length
     try:
@@ -125,6 +281,12 @@ def rab_hare():
             except ValueError:
                 print("Please enter an integer.")
                 continue
+            if values is None:
+                # the model's own limits apply once its answer is in
+                values = fetch.result()
+                print_values(values)
+                min_len = int(values.get('min_race_length', 10))
+                recommended = int(values.get('recommended_race_length', min_len))
             if race_len < min_len:
                 print(f"Race length must be at least {min_len}.")
                 continue
@@ -134,62 +296,44 @@ def rab_hare():
         return
 
     # Run interactive simulation using the helper
-    simulate_race(values, race_len)
+    simulate_race(values, race_len, render=render)
 
 
-def simulate_race(values: Dict[str, Any], race_len: int, seed: int | None = None) -> None:
-    """Simulate a race given parameter dict `values` and integer `race_len`.
+def simulate_race(values: Dict[str, Any], race_len: int, seed: int | None = None,
+                  render="buffered") -> str:
+    """Simulate a race given parameter dict or `RaceConfig` `values` and integer `race_len`.
 
     If `seed` is provided, random will be seeded for deterministic output.
-    This function prints per-turn moves and a simple ASCII number line.
+    The race is shown by `render`, a `race_render.RaceRenderer` or one of
+    the mode names 'quiet', 'summary', 'print', 'buffered' (the default:
+    per-turn moves and a simple ASCII number line, written in blocks) or
+    'ansi' (one number line redrawn in place). Returns the winner:
+    'tortoise', 'hare' or 'tie'.
     """
     import random
 
     if seed is not None:
         random.seed(seed)
+    if isinstance(render, str):
+        render = make_renderer(render)
 
-    def make_choices(moves):
-        weights = [m['prob'] for m in moves]
-        steps = [m['move'] for m in moves]
-        return steps, weights
-
-    tortoise_steps, tortoise_weights = make_choices(values['tortoise_moves'])
-    hare_steps, hare_weights = make_choices(values['hare_moves'])
+    # the samplers are built once per config, not re-weighted every turn
+    config = RaceConfig.from_values(values, rescale=True)
+    tortoise_draw = config.tortoise_sampler.draw
+    hare_draw = config.hare_sampler.draw
 
     tortoise_pos = 0
     hare_pos = 0
     turn = 0
 
-    print("\nStarting race!\n")
     finish = race_len
-
-    # Helper to draw a simple number line showing positions (clamped)
-    def draw_line(t_pos, h_pos, finish, width=60):
-        # Map positions from 0..finish to 0..width
-        def map_pos(p):
-            if p <= 0:
-                return 0
-            if p >= finish:
-                return width
-            return int((p / finish) * width)
-
-        t = map_pos(t_pos)
-        h = map_pos(h_pos)
-        line = ['-' for _ in range(width + 1)]
-        if t == h:
-            line[t] = 'B'  # Both
-        else:
-            line[t] = 'T'
-            line[h] = 'H'
-        # mark finish
-        line[-1] = '|'
-        return ''.join(line)
+    render.start(finish)
 
     # Run the simulation until someone reaches or passes finish
     while tortoise_pos < finish and hare_pos < finish:
         turn += 1
-        t_move = random.choices(tortoise_steps, weights=tortoise_weights, k=1)[0]
-        h_move = random.choices(hare_steps, weights=hare_weights, k=1)[0]
+        t_move = tortoise_draw(random.random)
+        h_move = hare_draw(random.random)
         tortoise_pos += t_move
         hare_pos += h_move
 
@@ -197,17 +341,17 @@ def simulate_race(values: Dict[str, Any], race_len: int, seed: int | None = None
         tortoise_pos = max(0, tortoise_pos)
         hare_pos = max(0, hare_pos)
 
-        print(f"Turn {turn}: Tortoise moved {t_move} -> pos {tortoise_pos}; Hare moved {h_move} -> pos {hare_pos}")
-        print(draw_line(tortoise_pos, hare_pos, finish))
+        render.turn(turn, t_move, tortoise_pos, h_move, hare_pos)
 
     # Determine winner (can be a tie)
     if tortoise_pos >= finish and hare_pos >= finish:
-        print("\nIt's a tie!")
+        winner = "tie"
     elif tortoise_pos >= finish:
-        print("\nTortoise wins!")
+        winner = "tortoise"
     else:
-        print("\nHare wins!")
-
+        winner = "hare"
+    render.end(winner, turn, tortoise_pos, hare_pos)
+    return winner
 
 if __name__ == "__main__":
     rab_hare()
\ No newline at end of file
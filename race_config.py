@@ -0,0 +1,165 @@
+# Elias Daniel Macero Gutierrez
+# Validated race parameters for the Tortoise and the Hare
+# Date 10/18/2026
+# Version 1.0.0
+import json
+import math
+from typing import Dict, Any, Tuple
+
+from alias_sampler import AliasSampler
+
+ANIMALS = ("tortoise_moves", "hare_moves")
+FIELDS = ("min_race_length", "recommended_race_length") + ANIMALS
+
+
+def _moves(name: str, moves, rescale: bool) -> Tuple[Tuple[int, float], ...]:
+    """Check one move list and return it as ((move, prob), ...) in its given order."""
+    if not isinstance(moves, (list, tuple)) or not moves:
+        raise ValueError(f"{name} must be a non-empty list of moves")
+    table = []
+    for m in moves:
+        if not isinstance(m, dict) or "prob" not in m or "move" not in m:
+            raise ValueError(f"{name}: every move needs 'prob' and 'move', got {m!r}")
+        move, prob = m["move"], m["prob"]
+        if (isinstance(move, bool) or not isinstance(move, (int, float)) or not math.isfinite(move)
+                or move != int(move)):
+            raise ValueError(f"{name}: move must be an integer, got {move!r}")
+        if isinstance(prob, bool) or not isinstance(prob, (int, float)) or not math.isfinite(prob) or prob < 0:
+            raise ValueError(f"{name}: prob must be a non-negative number, got {prob!r}")
+        table.append((int(move), int(prob) if prob == int(prob) else float(prob)))
+    total = sum(p for _, p in table)
+    if total <= 0:
+        raise ValueError(f"{name}: probabilities are all zero")
+    if not math.isclose(total, 100, rel_tol=1e-9):
+        if not rescale:
+            raise ValueError(f"{name}: probabilities sum to {total:g}, not 100")
+        table = [(move, p * 100 / total) for move, p in table]
+    return tuple(table)
+
+
+class RaceConfig:
+    """Race parameters, checked once and then read-only.
+
+    Move lists are stored as tuples of (move, prob) pairs in their given
+    order, with integer moves and probabilities summing to 100 (or
+    rescaled to 100 with `rescale=True`). The recommended length is raised
+    to the minimum if it is below it. An alias sampler per animal is built
+    up front, so simulations never re-derive weights from the dicts.
+
+    Configurations compare and hash by value and cannot be modified, so
+    they can key caches of simulation results. `config['hare_moves']` and
+    `config.get(...)` give the same view as the plain dict, so a RaceConfig
+    can be passed wherever the dict from `fetch_values_from_model` is used.
+    """
+
+    __slots__ = ("min_race_length", "recommended_race_length", "tortoise_moves", "hare_moves",
+                 "tortoise_sampler", "hare_sampler", "_hash")
+
+    def __init__(self, min_race_length: int, recommended_race_length: int,
+                 tortoise_moves, hare_moves, rescale: bool = False):
+        for name, n in (("min_race_length", min_race_length), ("recommended_race_length", recommended_race_length)):
+            if (isinstance(n, bool) or not isinstance(n, (int, float)) or not math.isfinite(n)
+                    or n != int(n) or n < 1):
+                raise ValueError(f"{name} must be a positive integer, got {n!r}")
+        min_len = int(min_race_length)
+        tortoise = _moves("tortoise_moves", tortoise_moves, rescale)
+        hare = _moves("hare_moves", hare_moves, rescale)
+        if max(m for m, _ in tortoise) <= 0 and max(m for m, _ in hare) <= 0:
+            raise ValueError("neither animal can move forward")
+        setattr_ = object.__setattr__
+        setattr_(self, "min_race_length", min_len)
+        setattr_(self, "recommended_race_length", max(min_len, int(recommended_race_length)))
+        setattr_(self, "tortoise_moves", tortoise)
+        setattr_(self, "hare_moves", hare)
+        setattr_(self, "tortoise_sampler", AliasSampler(*zip(*tortoise)))
+        setattr_(self, "hare_sampler", AliasSampler(*zip(*hare)))
+        setattr_(self, "_hash", hash(self._key()))
+
+    @classmethod
+    def from_values(cls, values: Dict[str, Any], rescale: bool = False) -> "RaceConfig":
+        """Build from the dict shape used by the model and DEFAULT_VALUES.
+
+        The two lengths default to 10 and the minimum, as in `rab_hare`.
+        """
+        if isinstance(values, cls):
+            return values
+        if not isinstance(values, dict):
+            raise ValueError(f"race parameters must be a JSON object, got {type(values).__name__}")
+        missing = [k for k in ANIMALS if k not in values]
+        if missing:
+            raise ValueError(f"race parameters missing {', '.join(missing)}")
+        min_len = values.get('min_race_length', 10)
+        return cls(min_len, values.get('recommended_race_length', min_len),
+                   values['tortoise_moves'], values['hare_moves'], rescale=rescale)
+
+    @classmethod
+    def from_json(cls, text: str, rescale: bool = False) -> "RaceConfig":
+        return cls.from_values(json.loads(text), rescale)
+
+    @classmethod
+    def load(cls, path: str, rescale: bool = False) -> "RaceConfig":
+        """Read a JSON file holding one race parameter object."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_values(json.load(f), rescale)
+
+    @classmethod
+    def from_model(cls, **fetch_kwargs) -> "RaceConfig":
+        """Ask the model (see `fetch_values_from_model`); the defaults if that fails."""
+        from rab_hare import fetch_values_from_model
+
+        return cls.from_values(fetch_values_from_model(**fetch_kwargs))
+
+    @classmethod
+    def default(cls) -> "RaceConfig":
+        from rab_hare import DEFAULT_VALUES
+
+        return cls.from_values(DEFAULT_VALUES)
+
+    def to_values(self) -> Dict[str, Any]:
+        """The plain dict form, as accepted by `from_values`."""
+        return {
+            "min_race_length": self.min_race_length,
+            "recommended_race_length": self.recommended_race_length,
+            "tortoise_moves": [{"prob": p, "move": m} for m, p in self.tortoise_moves],
+            "hare_moves": [{"prob": p, "move": m} for m, p in self.hare_moves],
+        }
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_values(), f, indent=2)
+
+    def __getitem__(self, key: str):
+        if key not in FIELDS:
+            raise KeyError(key)
+        value = getattr(self, key)
+        if key in ANIMALS:
+            return [{"prob": p, "move": m} for m, p in value]
+        return value
+
+    def get(self, key: str, default=None):
+        return self[key] if key in FIELDS else default
+
+    def _key(self):
+        return (self.min_race_length, self.recommended_race_length, self.tortoise_moves, self.hare_moves)
+
+    def __eq__(self, other):
+        if not isinstance(other, RaceConfig):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return self._hash
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RaceConfig is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("RaceConfig is read-only")
+
+    def __reduce__(self):
+        return (self.__class__.from_values, (self.to_values(),))
+
+    def __repr__(self):
+        return (f"RaceConfig(min_race_length={self.min_race_length}, "
+                f"recommended_race_length={self.recommended_race_length}, "
+                f"tortoise_moves={self.tortoise_moves}, hare_moves={self.hare_moves})")
@@ -0,0 +1,189 @@
+# Elias Daniel Macero Gutierrez
+# Exact win probabilities for the Tortoise and the Hare
+# Date 10/18/2026
+# Version 1.0.0
+import math
+import time
+from functools import lru_cache
+from typing import Dict, Any, List
+
+try:
+    import numpy as np
+except Exception as exc:
+    raise RuntimeError("race_exact requires numpy") from exc
+
+from rab_hare import DEFAULT_VALUES
+from race_config import RaceConfig
+
+
+def _move_probs(moves: List[Dict[str, Any]]):
+    """Return [(step, probability)] with duplicate steps merged and probabilities summing to 1."""
+    if not moves:
+        raise ValueError("move list is empty")
+    total = float(sum(m['prob'] for m in moves))
+    if any(m['prob'] < 0 for m in moves) or total <= 0:
+        raise ValueError("move probabilities must be non-negative and not all zero")
+    probs = {}
+    for m in moves:
+        if m['prob']:
+            step = int(m['move'])
+            probs[step] = probs.get(step, 0.0) + m['prob'] / total
+    return sorted(probs.items())
+
+
+class RaceChain:
+    """The race as a Markov chain on (tortoise_pos, hare_pos), clamped at 0.
+
+    Both animals move independently, so the joint chain is the product of
+    two one-dimensional chains and never has to be built: each animal's
+    position distribution is pushed forward turn by turn (O(race_len)
+    work per move and turn), which gives P(animal finishes on turn n).
+    The race outcome follows from those two hitting-time distributions:
+    the tortoise wins on turn n if it finishes then while the hare is
+    still running, and so on.
+
+    The move tables are read once; `solve_many` runs several race lengths
+    through the same forward pass, one row per length.
+    """
+
+    def __init__(self, values: Dict[str, Any]):
+        self.tortoise = _move_probs(values['tortoise_moves'])
+        self.hare = _move_probs(values['hare_moves'])
+
+    @staticmethod
+    def _step(dist, moves, beyond):
+        """Push each row of `dist` one turn forward; return (new dist, mass that finished)."""
+        n, width = dist.shape
+        up = beyond.shape[1] - width
+        new = np.zeros((n, width + up))
+        for step, p in moves:
+            if step >= 0:
+                new[:, step:step + width] += p * dist
+            else:
+                # moves below 0 stop at 0; a step back of the whole board or
+                # more sends every position there
+                back = min(-step, width)
+                new[:, :width - back] += p * dist[:, back:]
+                new[:, 0] += p * dist[:, :back].sum(axis=1)
+        finished = np.where(beyond, new, 0.0).sum(axis=1)
+        new = np.where(beyond[:, :width], 0.0, new[:, :width])
+        return new, finished
+
+    def solve_many(self, race_lens, tol: float = 1e-12, max_turns: int | None = None) -> List[Dict[str, Any]]:
+        """Solve several race lengths in one pass; returns one result per length.
+
+        Each result has the probabilities `tortoise`, `hare` and `tie`,
+        `unfinished` (the probability the race is still running when the
+        iteration stops, which also bounds the error of the other three),
+        `mean_turns` and `lengths`, whose item k is P(race ends on turn k).
+        The pass stops once every race is still running with probability
+        below `tol`, or after `max_turns` turns.
+        """
+        race_lens = [int(n) for n in race_lens]
+        if any(n < 1 for n in race_lens):
+            raise ValueError("race lengths must be positive")
+        ups = [s for moves in (self.tortoise, self.hare) for s, _ in moves]
+        if max_turns is None and max(ups) <= 0:
+            raise ValueError("neither animal can move forward; pass max_turns")
+        rows = len(race_lens)
+        width = max(race_lens)
+        up = max(0, max(ups))
+        beyond = np.arange(width + up)[None, :] >= np.array(race_lens)[:, None]
+
+        t_dist = np.zeros((rows, width))
+        h_dist = np.zeros((rows, width))
+        t_dist[:, 0] = 1.0
+        h_dist[:, 0] = 1.0
+        t_alive = np.ones(rows)
+        h_alive = np.ones(rows)
+        tortoise = np.zeros(rows)
+        hare = np.zeros(rows)
+        tie = np.zeros(rows)
+        mean_turns = np.zeros(rows)
+        lengths = [[0.0] for _ in range(rows)]
+        turn = 0
+        while (t_alive * h_alive).max() >= tol:
+            if max_turns is not None and turn >= max_turns:
+                break
+            turn += 1
+            running = t_alive * h_alive
+            mean_turns += running  # E[turns] = sum over n >= 0 of P(running after n)
+            t_dist, t_hit = self._step(t_dist, self.tortoise, beyond)
+            h_dist, h_hit = self._step(h_dist, self.hare, beyond)
+            t_alive = t_alive - t_hit
+            h_alive = h_alive - h_hit
+            tortoise += t_hit * h_alive
+            hare += h_hit * t_alive
+            tie += t_hit * h_hit
+            for i, ended in enumerate(running - t_alive * h_alive):
+                lengths[i].append(ended)
+
+        unfinished = np.clip(t_alive * h_alive, 0.0, 1.0)
+        return [
+            {
+                "race_len": race_lens[i],
+                "tortoise": float(tortoise[i]),
+                "hare": float(hare[i]),
+                "tie": float(tie[i]),
+                "unfinished": float(unfinished[i]),
+                "mean_turns": float(mean_turns[i]),
+                "lengths": np.array(lengths[i]),
+                "turns": turn,
+            }
+            for i in range(rows)
+        ]
+
+    def solve(self, race_len: int, tol: float = 1e-12, max_turns: int | None = None) -> Dict[str, Any]:
+        """Solve one race length; see `solve_many`."""
+        return self.solve_many([race_len], tol, max_turns)[0]
+
+
+@lru_cache(maxsize=256)
+def _solve_config(config: RaceConfig, race_len: int, tol: float) -> Dict[str, Any]:
+    return RaceChain(config).solve(race_len, tol)
+
+
+def win_probabilities(values: Dict[str, Any], race_len: int, tol: float = 1e-12) -> Dict[str, Any]:
+    """Exact tortoise / hare / tie probabilities and expected turns for one race.
+
+    Results for a `RaceConfig` are cached by (config, race_len, tol).
+    """
+    if isinstance(values, RaceConfig):
+        result = dict(_solve_config(values, int(race_len), tol))
+        result["lengths"] = result["lengths"].copy()
+        return result
+    return RaceChain(values).solve(race_len, tol)
+
+
+def benchmark(race_lens=(10, 20, 100, 1000, 2000, 5000), values=None, check_races=1_000_000, seed=0):
+    """Solve several race lengths at once and check the shortest one by sampling.
+
+    The default shortest length, 10, is below the hare's 12-step move back,
+    so the check covers steps that reach past the start of the board.
+    """
+    values = values or DEFAULT_VALUES
+    chain = RaceChain(values)
+    t0 = time.perf_counter()
+    results = chain.solve_many(race_lens)
+    elapsed = time.perf_counter() - t0
+    print(f"{len(race_lens)} race lengths solved in {elapsed:.2f} s ({results[0]['turns']} turns)")
+    print(f"{'length':>7} {'tortoise':>12} {'hare':>12} {'tie':>12} {'mean turns':>11} {'unfinished':>10}")
+    for r in results:
+        print(f"{r['race_len']:>7} {r['tortoise']:12.9f} {r['hare']:12.9f} {r['tie']:12.9f} "
+              f"{r['mean_turns']:11.4f} {r['unfinished']:10.1e}")
+
+    if check_races:
+        from race_sim import simulate_races
+
+        shortest = min(results, key=lambda r: r["race_len"])
+        sim = simulate_races(values, shortest["race_len"], check_races, seed=seed)
+        err = max(abs(sim[k] / check_races - shortest[k]) for k in ("tortoise", "hare", "tie"))
+        sigma = math.sqrt(0.25 / check_races)
+        print(f"sampling check at length {shortest['race_len']}: max |diff| {err:.2e} "
+              f"(standard error <= {sigma:.1e})")
+        assert err < 5 * sigma, f"exact and sampled results differ by {err:.2e}"
+    return results
+
+
+if __name__ == "__main__":
+    benchmark()
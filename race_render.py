@@ -0,0 +1,253 @@
+# Elias Daniel Macero Gutierrez
+# Output modes for the Tortoise and the Hare race
+# Date 10/18/2026
+# Version 1.0.0
+import io
+import os
+import sys
+import time
+
+RESULT_TEXT = {
+    "tie": "It's a tie!",
+    "tortoise": "Tortoise wins!",
+    "hare": "Hare wins!",
+}
+
+
+class RaceRenderer:
+    """Receives the race as it happens; this base class shows nothing.
+
+    `simulate_race` calls `start(finish)`, then `turn(...)` once per turn,
+    then `end(winner, turn, t_pos, h_pos)` with winner 'tortoise', 'hare'
+    or 'tie'.
+    """
+
+    def start(self, finish):
+        pass
+
+    def turn(self, turn, t_move, t_pos, h_move, h_pos):
+        pass
+
+    def end(self, winner, turn, t_pos, h_pos):
+        pass
+
+
+class QuietRenderer(RaceRenderer):
+    """No output at all, for batch use."""
+
+
+class SummaryRenderer(RaceRenderer):
+    """Only the result line, with the number of turns and final positions."""
+
+    def __init__(self, out=None):
+        self.out = out or sys.stdout
+
+    def end(self, winner, turn, t_pos, h_pos):
+        self.out.write(f"\n{RESULT_TEXT[winner]} (after {turn} turns: "
+                       f"tortoise at {t_pos}, hare at {h_pos})\n")
+        self.out.flush()
+
+
+class PrintRenderer(RaceRenderer):
+    """The original output: two `print` calls and a fresh number line per turn."""
+
+    def __init__(self, width=60):
+        self.width = width
+
+    def start(self, finish):
+        self.finish = finish
+        print("\nStarting race!\n")
+
+    def _draw_line(self, t_pos, h_pos):
+        finish, width = self.finish, self.width
+
+        def map_pos(p):
+            if p <= 0:
+                return 0
+            if p >= finish:
+                return width
+            return int((p / finish) * width)
+
+        t = map_pos(t_pos)
+        h = map_pos(h_pos)
+        line = ['-' for _ in range(width + 1)]
+        if t == h:
+            line[t] = 'B'  # Both
+        else:
+            line[t] = 'T'
+            line[h] = 'H'
+        # mark finish
+        line[-1] = '|'
+        return ''.join(line)
+
+    def turn(self, turn, t_move, t_pos, h_move, h_pos):
+        print(f"Turn {turn}: Tortoise moved {t_move} -> pos {t_pos}; Hare moved {h_move} -> pos {h_pos}")
+        print(self._draw_line(t_pos, h_pos))
+
+    def end(self, winner, turn, t_pos, h_pos):
+        print(f"\n{RESULT_TEXT[winner]}")
+
+
+class BufferedRenderer(RaceRenderer):
+    """Same text as `PrintRenderer`, written in large blocks.
+
+    The number line is one preallocated `bytearray` that is reset and
+    marked in place every turn, and whole frames accumulate in a byte
+    buffer that is written out once it holds `flush_bytes`. `out` is a
+    text stream (its binary buffer is used when it has one), a binary
+    file, or a path to write to.
+    """
+
+    def __init__(self, out=None, width=60, flush_bytes=1 << 16):
+        self._owned = isinstance(out, (str, os.PathLike))
+        if self._owned:
+            out = open(out, "wb")
+        out = out or sys.stdout
+        self._text = None
+        if isinstance(out, io.TextIOBase):
+            if hasattr(out, "buffer"):
+                self._text = out  # flushed first so text already written stays in order
+                out = out.buffer
+            else:
+                self._text = out
+                out = None
+        self.out = out
+        self.width = width
+        self.flush_bytes = flush_bytes
+        self._blank = b'-' * width + b'|'
+        self._line = bytearray(self._blank)
+        self._buf = bytearray()
+
+    def start(self, finish):
+        self.finish = finish
+        self._buf += b"\nStarting race!\n\n"
+
+    def _map(self, p):
+        if p <= 0:
+            return 0
+        if p >= self.finish:
+            return self.width
+        return int((p / self.finish) * self.width)
+
+    def turn(self, turn, t_move, t_pos, h_move, h_pos):
+        line = self._line
+        line[:] = self._blank
+        t = self._map(t_pos)
+        h = self._map(h_pos)
+        if t == h:
+            line[t] = 66  # 'B', both
+        else:
+            line[t] = 84  # 'T'
+            line[h] = 72  # 'H'
+        line[-1] = 124  # '|', the finish
+        buf = self._buf
+        buf += (f"Turn {turn}: Tortoise moved {t_move} -> pos {t_pos}; "
+                f"Hare moved {h_move} -> pos {h_pos}\n").encode()
+        buf += line
+        buf += b"\n"
+        if len(buf) >= self.flush_bytes:
+            self.flush()
+
+    def end(self, winner, turn, t_pos, h_pos):
+        self._buf += f"\n{RESULT_TEXT[winner]}\n".encode()
+        self.flush()
+        if self._owned:
+            self.out.close()
+
+    def flush(self):
+        if self._text is not None:
+            self._text.flush()
+        if self.out is not None:
+            self.out.write(self._buf)
+            self.out.flush()
+        else:
+            self._text.write(self._buf.decode())
+            self._text.flush()
+        self._buf.clear()
+
+
+class AnsiRenderer(BufferedRenderer):
+    """Animates the race on a single terminal line with ANSI escapes.
+
+    Each frame returns to the start of the line, clears it and redraws the
+    turn number and number line, instead of scrolling. At most `fps` frames
+    are shown per second; `frame_delay` slows the race down to watch it.
+    """
+
+    def __init__(self, out=None, width=60, fps=30, frame_delay=0.0):
+        super().__init__(out, width, flush_bytes=0)
+        self.interval = 1.0 / fps if fps > 0 else 0.0
+        self.frame_delay = frame_delay
+        self._last = float("-inf")
+
+    def turn(self, turn, t_move, t_pos, h_move, h_pos):
+        if self.frame_delay:
+            time.sleep(self.frame_delay)
+        now = time.perf_counter()
+        if now - self._last < self.interval:
+            return
+        self._last = now
+        self._frame(turn, t_pos, h_pos)
+
+    def _frame(self, turn, t_pos, h_pos):
+        line = self._line
+        line[:] = self._blank
+        t = self._map(t_pos)
+        h = self._map(h_pos)
+        if t == h:
+            line[t] = 66
+        else:
+            line[t] = 84
+            line[h] = 72
+        line[-1] = 124
+        self._buf += f"\r\x1b[2KTurn {turn:>6}  ".encode()
+        self._buf += line
+        self.flush()
+
+    def end(self, winner, turn, t_pos, h_pos):
+        self._frame(turn, t_pos, h_pos)  # always show the final position
+        self._buf += b"\n"
+        super().end(winner, turn, t_pos, h_pos)
+
+
+RENDERERS = {
+    "quiet": QuietRenderer,
+    "summary": SummaryRenderer,
+    "print": PrintRenderer,
+    "buffered": BufferedRenderer,
+    "ansi": AnsiRenderer,
+}
+
+
+def make_renderer(mode="buffered", **kwargs):
+    """Build a renderer by name: quiet, summary, print, buffered or ansi."""
+    try:
+        cls = RENDERERS[mode]
+    except KeyError:
+        raise ValueError(f"Unknown render mode {mode!r}; use one of {', '.join(RENDERERS)}")
+    return cls(**kwargs)
+
+
+def benchmark(race_len=20_000, seed=0):
+    """Time one long race per output mode, with stdout sent to os.devnull."""
+    from rab_hare import DEFAULT_VALUES, simulate_race
+
+    results = {}
+    real_stdout = sys.stdout
+    with open(os.devnull, "w") as devnull:
+        for mode in ("print", "buffered", "summary", "quiet"):
+            sys.stdout = devnull
+            try:
+                t0 = time.perf_counter()
+                simulate_race(DEFAULT_VALUES, race_len, seed=seed, render=mode)
+                results[mode] = time.perf_counter() - t0
+            finally:
+                sys.stdout = real_stdout
+    print(f"race length {race_len}")
+    for mode, seconds in results.items():
+        print(f"  {mode:<9}: {seconds:.3f} s ({results['print'] / seconds:.1f}x)")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark()
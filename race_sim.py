@@ -0,0 +1,236 @@
+# Elias Daniel Macero Gutierrez
+# Monte Carlo batch races for the Tortoise and the Hare
+# Date 10/18/2026
+# Version 1.0.0
+import math
+import time
+from typing import Dict, Any, List
+
+try:
+    import numpy as np
+except Exception as exc:
+    raise RuntimeError("race_sim requires numpy") from exc
+
+from alias_sampler import AliasSampler
+from rab_hare import DEFAULT_VALUES
+
+# Races simulated together; bounds the size of the (races x turns) blocks.
+CHUNK_RACES = 1 << 16
+# Turns drawn per block; finished races are dropped between blocks.
+BLOCK_TURNS = 8
+# Largest integer weight total sampled through a lookup table. Integer
+# weights (what the model is asked for) are drawn from a table with one
+# entry per unit of weight rather than from the `AliasSampler` that
+# `simulate_race` uses: both are O(1) per draw and give the same
+# distribution (see `check`), but the lookup needs one gather instead of
+# two plus a comparison, and whole batches run about 40% faster with it.
+LOOKUP_MAX = 1 << 16
+
+
+def _move_table(moves: List[Dict[str, Any]]):
+    """Return a sampling table for one animal's move list.
+
+    With integer probabilities (what the model is asked for) the table has
+    one entry per percentage point, so a draw is a single lookup; other
+    weights go through an `AliasSampler`, which is O(1) per draw as well.
+    See `LOOKUP_MAX` for why integer weights do not use the sampler.
+    """
+    sampler = AliasSampler.from_moves(moves)  # also validates the move list
+    steps = np.array(sampler.values, dtype=np.int32)
+    weights = np.array(sampler.weights)
+    if (weights == np.round(weights)).all() and weights.sum() <= LOOKUP_MAX:
+        return steps, None, np.repeat(steps, weights.astype(np.intp))
+    return steps, sampler, None
+
+
+def _draw(rng, table, shape):
+    """Draw a block of moves with shape `shape` from a `_move_table`."""
+    steps, sampler, lookup = table
+    if lookup is None:
+        return sampler.draw_array(rng, shape, np.int32)
+    u = rng.random(shape)
+    u *= len(lookup)
+    return lookup[u.astype(np.intp)]
+
+
+def _walk(pos, moves):
+    """Positions after each move of a block, clamped at 0 like `simulate_race`.
+
+    max(0, p + m) applied turn by turn is the walk reflected at 0: the
+    running sum minus its running minimum whenever that dips below 0.
+    `pos` (>= 0) holds the starting position of each row.
+    """
+    s = np.cumsum(moves, axis=1, dtype=np.int32)
+    s += pos[:, None]
+    low = np.minimum.accumulate(s, axis=1)
+    np.minimum(low, 0, out=low)
+    s -= low
+    return s
+
+
+def _first_hit(pos, finish):
+    """Index of the first turn in each row at or past `finish` (block width if none)."""
+    hit = pos >= finish
+    first = hit.argmax(axis=1)
+    first[~hit.any(axis=1)] = pos.shape[1]
+    return first
+
+
+def _add_counts(acc, values):
+    """Add np.bincount(values) into the growing count array `acc`."""
+    if values.size == 0:
+        return acc
+    counts = np.bincount(values)
+    if len(counts) > len(acc):
+        acc = np.concatenate([acc, np.zeros(len(counts) - len(acc), dtype=np.int64)])
+    acc[:len(counts)] += counts
+    return acc
+
+
+def simulate_races(values: Dict[str, Any], race_len: int, races: int,
+                   seed=None, max_turns: int | None = None) -> Dict[str, Any]:
+    """Simulate `races` independent races at once and count the outcomes.
+
+    Same rules as `simulate_race`: both animals move every turn, positions
+    never go below 0, and the race ends on the first turn where either one
+    reaches `race_len` (a tie if both do). Moves are drawn as
+    (races x turns) blocks and the clamp at 0 is applied to a whole block
+    with cumulative sums, so there is no per-turn Python loop.
+
+    `seed` may be an int, a SeedSequence or a numpy Generator. Races still
+    running after `max_turns` turns are counted as unfinished.
+    Returns a dict with the counts `tortoise`, `hare`, `tie` and
+    `unfinished` (wins, losses and ties from the tortoise's side), the
+    `mean_turns` of finished races and `lengths`: for each outcome an
+    array whose item k is the number of races that ended on turn k.
+    """
+    if race_len < 1:
+        raise ValueError("race_len must be positive")
+    if races < 0:
+        raise ValueError("races must be non-negative")
+    tortoise = _move_table(values['tortoise_moves'])
+    hare = _move_table(values['hare_moves'])
+    if max_turns is None and tortoise[0].max() <= 0 and hare[0].max() <= 0:
+        raise ValueError("neither animal can move forward; pass max_turns")
+    rng = np.random.default_rng(seed)
+
+    outcomes = ("tortoise", "hare", "tie")
+    counts = dict.fromkeys(outcomes + ("unfinished",), 0)
+    lengths = {k: np.zeros(0, dtype=np.int64) for k in outcomes}
+    for start in range(0, races, CHUNK_RACES):
+        n = min(CHUNK_RACES, races - start)
+        t_pos = np.zeros(n, dtype=np.int32)
+        h_pos = np.zeros(n, dtype=np.int32)
+        turn = 0
+        while t_pos.size:
+            block = BLOCK_TURNS
+            if max_turns is not None:
+                if turn >= max_turns:
+                    break
+                block = min(block, max_turns - turn)
+            t_walk = _walk(t_pos, _draw(rng, tortoise, (t_pos.size, block)))
+            h_walk = _walk(h_pos, _draw(rng, hare, (h_pos.size, block)))
+            t_hit = _first_hit(t_walk, race_len)
+            h_hit = _first_hit(h_walk, race_len)
+            end = np.minimum(t_hit, h_hit)
+            done = end < block
+            ended = {
+                "tortoise": done & (t_hit < h_hit),
+                "hare": done & (h_hit < t_hit),
+                "tie": done & (t_hit == h_hit),
+            }
+            for k, mask in ended.items():
+                counts[k] += int(mask.sum())
+                lengths[k] = _add_counts(lengths[k], turn + 1 + end[mask])
+            keep = ~done
+            t_pos = t_walk[keep, -1]
+            h_pos = h_walk[keep, -1]
+            turn += block
+        counts["unfinished"] += int(t_pos.size)
+
+    finished = races - counts["unfinished"]
+    total_turns = sum(int(np.dot(np.arange(len(a)), a)) for a in lengths.values())
+    return {
+        "races": races,
+        **counts,
+        "mean_turns": total_turns / finished if finished else math.nan,
+        "lengths": lengths,
+    }
+
+
+def _python_races(values, race_len, races, seed=None):
+    """The per-turn `random.choices` loop of `simulate_race`, without output."""
+    import random
+
+    rnd = random.Random(seed)
+    t_steps = [m['move'] for m in values['tortoise_moves']]
+    t_weights = [m['prob'] for m in values['tortoise_moves']]
+    h_steps = [m['move'] for m in values['hare_moves']]
+    h_weights = [m['prob'] for m in values['hare_moves']]
+    counts = {"tortoise": 0, "hare": 0, "tie": 0}
+    for _ in range(races):
+        t_pos = h_pos = 0
+        while t_pos < race_len and h_pos < race_len:
+            t_pos = max(0, t_pos + rnd.choices(t_steps, weights=t_weights, k=1)[0])
+            h_pos = max(0, h_pos + rnd.choices(h_steps, weights=h_weights, k=1)[0])
+        if t_pos >= race_len and h_pos >= race_len:
+            counts["tie"] += 1
+        elif t_pos >= race_len:
+            counts["tortoise"] += 1
+        else:
+            counts["hare"] += 1
+    return counts
+
+
+def check(values=None, draws=2_000_000, seed=0, z=5.0):
+    """Check that the lookup table and the `AliasSampler` draw each move with its weight.
+
+    Both samplers draw `draws` moves per animal; every move's share must be
+    within `z` standard errors of its exact probability for both.
+    """
+    values = values or DEFAULT_VALUES
+    rng = np.random.default_rng(seed)
+    for animal in ("tortoise_moves", "hare_moves"):
+        steps, _, lookup = _move_table(values[animal])
+        if lookup is None:
+            raise ValueError(f"{animal}: the lookup table needs integer weights")
+        sampler = AliasSampler.from_moves(values[animal])
+        by_lookup = _draw(rng, (steps, None, lookup), (draws,))
+        by_alias = _draw(rng, (steps, sampler, None), (draws,))
+        total = sum(sampler.weights)
+        for step in np.unique(steps):
+            p = sum(w for s, w in zip(sampler.values, sampler.weights) if s == step) / total
+            err = z * math.sqrt(p * (1 - p) / draws)
+            for name, drawn in (("lookup", by_lookup), ("alias", by_alias)):
+                share = np.count_nonzero(drawn == step) / draws
+                assert abs(share - p) <= err, \
+                    f"{animal} move {step}: {name} share {share:.5f}, expected {p:.5f}"
+    print(f"lookup and alias draws match the move weights ({draws:,} draws per animal)")
+
+
+def benchmark(races=10_000_000, race_len=20, reference_races=20_000, seed=0, values=None):
+    """Time `simulate_races` against the plain per-turn Python loop.
+
+    Prints races/second for both and the win/tie shares, which should
+    agree within the reference's sampling error.
+    """
+    values = values or DEFAULT_VALUES
+    t0 = time.perf_counter()
+    ref = _python_races(values, race_len, reference_races, seed)
+    t_ref = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    res = simulate_races(values, race_len, races, seed)
+    t_np = time.perf_counter() - t0
+
+    print(f"race length {race_len}")
+    print(f"  python loop : {reference_races / t_ref:12,.0f} races/s  ({reference_races} races)")
+    print(f"  numpy batch : {races / t_np:12,.0f} races/s  ({races} races in {t_np:.2f} s)")
+    for k in ("tortoise", "hare", "tie"):
+        print(f"  {k:<8}: {ref[k] / reference_races:.4f} (loop)  {res[k] / races:.4f} (batch)")
+    print(f"  mean turns: {res['mean_turns']:.2f}")
+    return {"python_races_per_s": reference_races / t_ref, "numpy_races_per_s": races / t_np}
+
+
+if __name__ == "__main__":
+    check()
+    benchmark()
@@ -0,0 +1,231 @@
+# Elias Daniel Macero Gutierrez
+# Parameter sweeps over race move tables
+# Date 10/18/2026
+# Version 1.0.0
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+from typing import Dict, Any, List, Tuple
+
+try:
+    import numpy as np
+except Exception as exc:
+    raise RuntimeError("race_sweep requires numpy") from exc
+
+from rab_hare import DEFAULT_VALUES
+from parallel import imap_unordered
+from race_sim import simulate_races
+
+COUNTS = ("races", "tortoise", "hare", "tie", "unfinished")
+
+
+def config_key(values: Dict[str, Any], race_len: int) -> str:
+    """A stable text key for one (move tables, race length) configuration."""
+    def table(moves):
+        return [[m['move'], m['prob']] for m in moves]
+    return json.dumps([int(race_len), table(values['tortoise_moves']), table(values['hare_moves'])],
+                      separators=(",", ":"))
+
+
+class SweepCache:
+    """Accumulated race counts per `config_key`, optionally kept in a JSON file.
+
+    Counts only ever grow: a configuration evaluated with 1,000 races and
+    later asked for 4,000 only runs the missing 3,000. Keys do not include
+    `max_turns`, so reuse a cache file only with the same `max_turns`.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.counts: Dict[str, Dict[str, int]] = {}
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.counts = json.load(f)
+
+    def get(self, key: str) -> Dict[str, int]:
+        return self.counts.get(key) or dict.fromkeys(COUNTS, 0)
+
+    def add(self, key: str, result: Dict[str, Any]) -> Dict[str, int]:
+        counts = self.get(key)
+        self.counts[key] = {k: counts[k] + int(result[k]) for k in COUNTS}
+        return self.counts[key]
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.counts, f)
+        os.replace(tmp, self.path)
+
+
+def _seed_for(seed: int, key: str, done: int):
+    """Seed for the races of `key` after the first `done`, so no stretch is drawn twice."""
+    digest = int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "little")
+    return np.random.SeedSequence(seed, spawn_key=(digest, done))
+
+
+def _run_config(key, values, race_len, races, seed_seq, max_turns):
+    """Worker entry: simulate `races` races of one configuration."""
+    result = simulate_races(values, race_len, races, seed=seed_seq, max_turns=max_turns)
+    return key, {k: result[k] for k in COUNTS}
+
+
+def balance(counts: Dict[str, int], target: float = 0.0, z: float = 3.0) -> Tuple[float, float, float]:
+    """Score a configuration by how far its win margin is from `target`.
+
+    The margin is P(tortoise wins) - P(hare wins), so the default target
+    of 0 asks for a 50/50 split. The share of unfinished races is added as
+    a penalty, so races that stall do not pass for balanced ones. Returns
+    (score, low, high), where low and high bound the score at `z`
+    standard errors; lower scores are better.
+    """
+    n = counts["races"]
+    if n == 0:
+        return math.inf, 0.0, math.inf
+    pt = counts["tortoise"] / n
+    ph = counts["hare"] / n
+    margin = pt - ph
+    # each race adds +1 (tortoise), -1 (hare) or 0; never trust a variance of 0
+    var = max(pt + ph - margin * margin, 1.0 / n)
+    half = z * math.sqrt(var / n)
+    lo, hi = margin - half - target, margin + half - target
+    stalled = counts["unfinished"] / n
+    low = 0.0 if lo <= 0 <= hi else min(abs(lo), abs(hi))
+    return abs(margin - target) + stalled, low + stalled, max(abs(lo), abs(hi)) + stalled
+
+
+def grid(tortoise_tables: List[List[Dict[str, Any]]], hare_tables: List[List[Dict[str, Any]]],
+         race_lens: List[int]) -> List[Tuple[Dict[str, Any], int]]:
+    """Every combination of the given move tables and race lengths."""
+    return [({"tortoise_moves": t, "hare_moves": h}, n)
+            for t in tortoise_tables for h in hare_tables for n in race_lens]
+
+
+def _random_percents(rng, n: int) -> List[int]:
+    """n non-negative integer percentages summing to 100, uniform over the simplex."""
+    raw = rng.dirichlet(np.ones(n)) * 100
+    whole = np.floor(raw).astype(int)
+    # hand the leftover points to the largest remainders
+    for i in np.argsort(whole - raw)[:100 - whole.sum()]:
+        whole[i] += 1
+    return [int(p) for p in whole]
+
+
+def random_configs(count: int, base: Dict[str, Any] | None = None, race_lens=(10, 60),
+                   seed=0) -> List[Tuple[Dict[str, Any], int]]:
+    """`count` random configurations for random search.
+
+    Each keeps the move sizes of `base` (DEFAULT_VALUES by default) and
+    draws fresh integer percentages for them; the race length is drawn
+    uniformly from the inclusive range `race_lens`.
+    """
+    base = base or DEFAULT_VALUES
+    rng = np.random.default_rng(seed)
+    configs = []
+    for _ in range(count):
+        values = {}
+        for animal in ("tortoise_moves", "hare_moves"):
+            steps = [m['move'] for m in base[animal]]
+            values[animal] = [{"prob": p, "move": s} for p, s in zip(_random_percents(rng, len(steps)), steps)]
+        configs.append((values, int(rng.integers(race_lens[0], race_lens[1] + 1))))
+    return configs
+
+
+def evaluate(configs: List[Tuple[Dict[str, Any], int]], races: int, seed=0, cache: SweepCache | None = None,
+             max_workers: int | None = 1, max_turns: int | None = 1000) -> List[Dict[str, int]]:
+    """Bring every configuration up to at least `races` simulated races.
+
+    Only the races missing from `cache` are run, each configuration as one
+    `simulate_races` batch, across a process pool unless `max_workers` is
+    1. Results do not depend on `max_workers` or on the order of
+    `configs`. Races still running after `max_turns` turns count as
+    unfinished, so random tables that barely move cannot stall a sweep.
+    Returns the accumulated counts of each configuration.
+    """
+    cache = cache if cache is not None else SweepCache()
+    keys = [config_key(values, n) for values, n in configs]
+    tasks = {}
+    for key, (values, n) in zip(keys, configs):
+        done = cache.get(key)["races"]
+        if done < races and key not in tasks:
+            tasks[key] = (key, values, n, races - done, _seed_for(seed, key, done), max_turns)
+
+    if tasks:
+        for key, counts in imap_unordered(_run_config, tasks.values(), max_workers):
+            cache.add(key, counts)
+    return [cache.get(key) for key in keys]
+
+
+def successive_halving(configs: List[Tuple[Dict[str, Any], int]], min_races: int = 1000,
+                       max_races: int = 64_000, eta: int = 4, target: float = 0.0, z: float = 3.0,
+                       seed=0, cache: SweepCache | None = None, max_workers: int | None = 1,
+                       max_turns: int | None = 1000, progress: bool = True) -> List[Dict[str, Any]]:
+    """Find the configurations whose win margin is closest to `target`.
+
+    Every configuration starts with `min_races` races. After each round,
+    any configuration whose score is surely worse than the best one (its
+    lower bound is above the smallest upper bound, see `balance`) is
+    dropped, and of the rest only the best 1/`eta` go on, with `eta` times
+    as many races, until they reach `max_races`. Returns one entry per
+    configuration, best first: `values`, `race_len`, the counts,
+    `score`, `low`, `high` and `round` (the last round it took part in).
+    """
+    if min_races < 1 or max_races < min_races:
+        raise ValueError("need 1 <= min_races <= max_races")
+    if eta < 2:
+        raise ValueError("eta must be at least 2")
+    cache = cache if cache is not None else SweepCache()
+    results = [None] * len(configs)
+    alive = list(range(len(configs)))
+    races = min_races
+    rnd = 0
+    t0 = time.perf_counter()
+    while alive:
+        counts = evaluate([configs[i] for i in alive], races, seed, cache, max_workers, max_turns)
+        for i, c in zip(alive, counts):
+            score, lo, hi = balance(c, target, z)
+            results[i] = {"values": configs[i][0], "race_len": configs[i][1], **c,
+                          "score": score, "low": lo, "high": hi, "round": rnd}
+        if progress:
+            best = min(results[i]["score"] for i in alive)
+            print(f"round {rnd}: {len(alive)} configs x {races:,} races, best score {best:.4f} "
+                  f"({time.perf_counter() - t0:.1f} s)", flush=True)
+        if races >= max_races or len(alive) == 1:
+            break
+        bound = min(results[i]["high"] for i in alive)
+        alive = [i for i in alive if results[i]["low"] <= bound]
+        alive.sort(key=lambda i: results[i]["score"])
+        alive = alive[:max(1, math.ceil(len(alive) / eta))]
+        races = min(races * eta, max_races)
+        rnd += 1
+    cache.save()
+    # configurations that got further were measured more precisely, so they rank first
+    return sorted(results, key=lambda r: (-r["round"], r["score"]))
+
+
+def print_ranking(results: List[Dict[str, Any]], top: int = 10) -> None:
+    """Print the best `top` configurations of a sweep."""
+    print(f"\n{'rank':>4} {'len':>4} {'races':>8} {'tortoise':>9} {'hare':>7} {'tie':>7} {'score':>7}  "
+          f"{'tortoise %':<22} hare %")
+    for rank, r in enumerate(results[:top], 1):
+        n = r["races"]
+        t = " ".join(f"{m['prob']}@{m['move']}" for m in r["values"]["tortoise_moves"])
+        h = " ".join(f"{m['prob']}@{m['move']}" for m in r["values"]["hare_moves"])
+        print(f"{rank:>4} {r['race_len']:>4} {n:>8,} {r['tortoise'] / n:9.4f} {r['hare'] / n:7.4f} "
+              f"{r['tie'] / n:7.4f} {r['score']:7.4f}  {t:<22} {h}")
+
+
+if __name__ == "__main__":
+    # python race_sweep.py [CONFIGS] [WORKERS] [SEED] [CACHE_FILE]
+    args = sys.argv[1:]
+    count, workers, seed = ([int(a) for a in args[:3]] + [1000, 1, 0][len(args[:3]):])[:3]
+    cache = SweepCache(args[3] if len(args) > 3 else None)
+    t0 = time.perf_counter()
+    ranking = successive_halving(random_configs(count, seed=seed), seed=seed, cache=cache,
+                                 max_workers=workers or None)
+    print(f"\n{count} configurations in {time.perf_counter() - t0:.1f} s")
+    print_ranking(ranking)
@@ -0,0 +1,110 @@
+# Elias Daniel Macero Gutierrez
+# Parallel race tournaments with reproducible seeding
+# Date 10/18/2026
+# Version 1.0.0
+import math
+import os
+import sys
+import time
+from typing import Dict, Any
+
+try:
+    import numpy as np
+except Exception as exc:
+    raise RuntimeError("race_tournament requires numpy") from exc
+
+from rab_hare import DEFAULT_VALUES
+from parallel import imap_unordered
+from race_sim import simulate_races
+
+OUTCOMES = ("tortoise", "hare", "tie", "unfinished")
+
+
+def _run_shard(index, values, race_len, races, seed_seq, max_turns):
+    """Worker entry: simulate one shard with its own Generator."""
+    t0 = time.perf_counter()
+    result = simulate_races(values, race_len, races, seed=np.random.default_rng(seed_seq),
+                            max_turns=max_turns)
+    return index, result, time.perf_counter() - t0, os.getpid()
+
+
+def _merge(total, result):
+    """Add one shard's `simulate_races` result into the running `total`."""
+    for k in OUTCOMES:
+        total[k] += result[k]
+    total["races"] += result["races"]
+    for k, counts in result["lengths"].items():
+        acc = total["lengths"][k]
+        if len(counts) > len(acc):
+            acc = np.concatenate([acc, np.zeros(len(counts) - len(acc), dtype=np.int64)])
+        acc[:len(counts)] += counts
+        total["lengths"][k] = acc
+
+
+def run_tournament(values: Dict[str, Any], race_len: int, races: int, seed=0,
+                   shard_size: int = 1_000_000, max_workers: int | None = None,
+                   max_turns: int | None = None, progress: bool = True) -> Dict[str, Any]:
+    """Run `races` races split into shards across a process pool.
+
+    Shard i always covers the same races and draws from child i of
+    `SeedSequence(seed).spawn(...)`, so the totals are identical whatever
+    `max_workers` is (1 runs everything in this process). Shard results
+    are merged as they arrive, with a progress line per shard if
+    `progress` is set. Returns the merged `simulate_races`-style dict plus
+    `seconds` and `shards`: per-shard races, seconds, races/s and worker pid.
+    """
+    if races < 0:
+        raise ValueError("races must be non-negative")
+    if shard_size < 1:
+        raise ValueError("shard_size must be positive")
+    n_shards = math.ceil(races / shard_size)
+    seeds = np.random.SeedSequence(seed).spawn(n_shards)
+    sizes = [min(shard_size, races - i * shard_size) for i in range(n_shards)]
+    tasks = [(i, values, race_len, sizes[i], seeds[i], max_turns) for i in range(n_shards)]
+
+    total = {"races": 0, **dict.fromkeys(OUTCOMES, 0),
+             "lengths": {k: np.zeros(0, dtype=np.int64) for k in OUTCOMES[:3]}}
+    shards = [None] * n_shards
+    t0 = time.perf_counter()
+
+    def _collect(index, result, seconds, pid):
+        _merge(total, result)
+        shards[index] = {"shard": index, "races": result["races"], "seconds": seconds,
+                         "races_per_s": result["races"] / seconds if seconds else math.inf, "pid": pid}
+        if progress:
+            elapsed = time.perf_counter() - t0
+            print(f"[{sum(s is not None for s in shards)}/{n_shards}] shard {index}: "
+                  f"{result['races']:,} races in {seconds:.2f} s ({shards[index]['races_per_s']:,.0f}/s); "
+                  f"{total['races']:,}/{races:,} done, {total['races'] / elapsed:,.0f} races/s overall",
+                  flush=True)
+
+    for shard in imap_unordered(_run_shard, tasks, max_workers):
+        _collect(*shard)
+
+    finished = total["races"] - total["unfinished"]
+    turns = sum(int(np.dot(np.arange(len(a)), a)) for a in total["lengths"].values())
+    total["mean_turns"] = turns / finished if finished else math.nan
+    total["seconds"] = time.perf_counter() - t0
+    total["shards"] = shards
+    return total
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    """Print the outcome shares and the per-shard throughput table."""
+    races = result["races"] or 1
+    print(f"\n{result['races']:,} races in {result['seconds']:.2f} s "
+          f"({result['races'] / result['seconds']:,.0f} races/s)")
+    for k in OUTCOMES:
+        print(f"  {k:<10} {result[k]:>12,}  {result[k] / races:.6f}")
+    print(f"  mean turns {result['mean_turns']:.4f}")
+    print(f"\n{'shard':>6} {'races':>10} {'seconds':>8} {'races/s':>12} {'pid':>7}")
+    for s in result["shards"]:
+        print(f"{s['shard']:>6} {s['races']:>10,} {s['seconds']:8.2f} {s['races_per_s']:>12,.0f} {s['pid']:>7}")
+
+
+if __name__ == "__main__":
+    # python race_tournament.py [RACES] [RACE_LEN] [WORKERS] [SEED]
+    args = [int(a) for a in sys.argv[1:]]
+    races, race_len, workers, seed = (args + [10_000_000, 20, 0, 0][len(args):])[:4]
+    print_report(run_tournament(DEFAULT_VALUES, race_len, races, seed=seed,
+                                max_workers=workers or None))
@@ -0,0 +1,110 @@
+# Elias Daniel Macero Gutierrez
+# On-disk cache for model responses
+# Date 10/18/2026
+# Version 1.0.0
+import hashlib
+import json
+import os
+import time
+from typing import Optional
+
+DEFAULT_TTL = 7 * 24 * 3600      # seconds a cached response stays valid
+DEFAULT_MAX_BYTES = 1 << 20      # total size of all cached responses
+SUFFIX = ".resp.json"            # entry files are <sha256 hex><SUFFIX>
+
+
+def _is_entry(name: str) -> bool:
+    """True for the file names of cache entries; other files in the directory are left alone."""
+    key = name[:-len(SUFFIX)]
+    return (name.endswith(SUFFIX) and len(key) == 64
+            and all(c in "0123456789abcdef" for c in key))
+
+
+def default_cache_dir() -> str:
+    """`$RAB_HARE_CACHE_DIR`, or `rab_hare` under the user's cache directory."""
+    path = os.getenv("RAB_HARE_CACHE_DIR")
+    if path:
+        return path
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "rab_hare")
+
+
+class ResponseCache:
+    """Model responses stored as one JSON file per (backend, model, prompt).
+
+    Files are named after the SHA-256 of the backend name, model name and
+    prompt plus `SUFFIX`, so replies from a stub or test backend never
+    stand in for the real model's. An entry older than `ttl` seconds is
+    treated as missing and removed. After each write the least recently
+    used entries (by file mtime, refreshed on every hit) are evicted until
+    the entries total at most `max_bytes`. Eviction and `clear()` only
+    touch entry files, so the directory may hold other files too.
+    Unreadable or corrupt files count as misses.
+    """
+
+    def __init__(self, directory: Optional[str] = None, ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or default_cache_dir()
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(model: str, prompt: str, backend: str = "") -> str:
+        return hashlib.sha256(f"{backend}\0{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def _path(self, model: str, prompt: str, backend: str) -> str:
+        return os.path.join(self.directory, self.key(model, prompt, backend) + SUFFIX)
+
+    def get(self, model: str, prompt: str, backend: str = "") -> Optional[str]:
+        """Return the cached response text, or None if missing or expired."""
+        path = self._path(model, prompt, backend)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if (entry.get("model") != model or entry.get("backend", "") != backend
+                    or time.time() - entry["created"] > self.ttl):
+                os.remove(path)
+                return None
+            os.utime(path)  # mark as recently used
+            return entry["content"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, model: str, prompt: str, content: str, backend: str = "") -> None:
+        """Store a response, then evict old entries beyond `max_bytes`."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(model, prompt, backend)
+        entry = {"backend": backend, "model": model,
+                 "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+                 "created": time.time(), "content": content}
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)  # readers never see a half-written file
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if _is_entry(e.name) and e.is_file():
+                    st = e.stat()
+                    entries.append((st.st_mtime, st.st_size, e.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every cached response; other files in the directory are kept."""
+        if not os.path.isdir(self.directory):
+            return
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if _is_entry(e.name) and e.is_file():
+                    os.remove(e.path)
@@ -0,0 +1,256 @@
+# Elias Daniel Macero Gutierrez
+# Bit-packed coin toss files
+# Date 10/18/2026
+# Version 1.0.0
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Dict, Any, Iterator, Tuple
+
+from coin_walk import WalkStats, toss_blocks, CHUNK_TOSSES
+
+# File layout, all little-endian:
+#   header  magic "TOSS", version u16, flags u16, block size in tosses u32,
+#           toss count u64, index offset u64, 4 reserved bytes (32 bytes)
+#   data    ceil(count / 8) bytes; bit j of byte k is toss 8k + j, 1 = heads
+#   index   one i64 per block plus one: the counter before each block and
+#           the final counter
+MAGIC = b"TOSS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIQQ4x")
+DEFAULT_BLOCK = 1 << 16
+
+
+def _counter_delta(data, nbits: int) -> int:
+    """Heads minus tails over the first `nbits` tosses in `data`."""
+    if nbits == 0:
+        return 0
+    heads = (int.from_bytes(data[:(nbits + 7) // 8], "little") & ((1 << nbits) - 1)).bit_count()
+    return 2 * heads - nbits
+
+
+class TossWriter:
+    """Write tosses to a new toss file, building the block index on the way.
+
+    Use as a context manager, or call `close()`; the header is completed
+    and the index appended only then. Every write except the last must
+    hold a whole number of bytes of tosses.
+    """
+
+    def __init__(self, path: str, block: int = DEFAULT_BLOCK):
+        if block < 8 or block % 8:
+            raise ValueError("block must be a positive multiple of 8")
+        self.path = path
+        self.block = block
+        self.count = 0
+        self.counter = 0
+        self._index = [0]
+        self._in_block = 0  # tosses written into the current block
+        self._f = open(path, "wb")
+        self._f.write(HEADER.pack(MAGIC, VERSION, 0, block, 0, 0))
+
+    def write(self, data: bytes, nbits: int | None = None) -> None:
+        """Append the first `nbits` tosses packed in `data` (all of them by default)."""
+        nbits = len(data) * 8 if nbits is None else nbits
+        if not 0 <= nbits <= len(data) * 8:
+            raise ValueError("nbits does not fit in data")
+        if self.count % 8:
+            raise ValueError("only the last write may end in the middle of a byte")
+        data = memoryview(data)[:(nbits + 7) // 8]
+        if nbits % 8:
+            # clear the unused high bits of the last byte so the file is canonical
+            data = bytearray(data)
+            data[-1] &= (1 << (nbits % 8)) - 1
+        self._f.write(data)
+        pos = 0
+        while pos < nbits:
+            take = min(self.block - self._in_block, nbits - pos)
+            self.counter += _counter_delta(data[pos // 8:], take)
+            pos += take
+            self._in_block += take
+            if self._in_block == self.block:
+                self._index.append(self.counter)
+                self._in_block = 0
+        self.count += nbits
+
+    def close(self) -> None:
+        if self._f.closed:
+            return
+        if self._in_block:
+            self._index.append(self.counter)
+        index_offset = self._f.tell()
+        self._f.write(struct.pack(f"<{len(self._index)}q", *self._index))
+        self._f.seek(0)
+        self._f.write(HEADER.pack(MAGIC, VERSION, 0, self.block, self.count, index_offset))
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TossFile:
+    """A toss file opened read-only through `mmap`.
+
+    Nothing is read up front: `counter_at(i)` takes the counter stored for
+    the block holding toss i and counts the heads of at most one block
+    from there, and `blocks()` streams the tosses for replay.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._f.close()
+            raise ValueError(f"{path}: not a toss file")
+        try:
+            self._read_header()
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_header(self):
+        if len(self._mm) < HEADER.size:
+            raise ValueError(f"{self.path}: not a toss file")
+        magic, version, _flags, self.block, self.count, self._index_offset = HEADER.unpack_from(self._mm)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path}: not a toss file")
+        if version != VERSION:
+            raise ValueError(f"{self.path}: unsupported toss file version {version}")
+        if self.block < 8 or self.block % 8:
+            raise ValueError(f"{self.path}: bad block size {self.block}")
+        n_index = -(-self.count // self.block) + 1
+        if (self._index_offset != HEADER.size + (self.count + 7) // 8
+                or len(self._mm) != self._index_offset + 8 * n_index):
+            raise ValueError(f"{self.path}: truncated or incomplete toss file")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _index(self, block: int) -> int:
+        return struct.unpack_from("<q", self._mm, self._index_offset + 8 * block)[0]
+
+    def toss(self, i: int) -> int:
+        """Toss i (0-based): 1 for heads, 0 for tails."""
+        if not 0 <= i < self.count:
+            raise IndexError("toss index out of range")
+        return self._mm[HEADER.size + (i >> 3)] >> (i & 7) & 1
+
+    def counter_at(self, i: int) -> int:
+        """The counter after the first `i` tosses (0 <= i <= len)."""
+        if not 0 <= i <= self.count:
+            raise IndexError("toss index out of range")
+        block, offset = divmod(i, self.block)
+        start = HEADER.size + block * self.block // 8
+        return self._index(block) + _counter_delta(self._mm[start:start + (offset + 7) // 8], offset)
+
+    def blocks(self, start: int = 0, stop: int | None = None, chunk: int = CHUNK_TOSSES
+               ) -> Iterator[Tuple[bytes, int]]:
+        """Yield (packed bytes, number of tosses) for tosses start..stop; start must be a multiple of 8."""
+        stop = self.count if stop is None else min(stop, self.count)
+        if start % 8 or start < 0:
+            raise ValueError("start must be a non-negative multiple of 8")
+        if chunk < 8 or chunk % 8:
+            raise ValueError("chunk must be a positive multiple of 8")
+        for pos in range(start, stop, chunk):
+            n = min(chunk, stop - pos)
+            first = HEADER.size + pos // 8
+            yield self._mm[first:first + (n + 7) // 8], n
+
+    def stats(self, start: int = 0, stop: int | None = None) -> Dict[str, Any]:
+        """Replay tosses start..stop through `WalkStats`, counting from the stored counter at `start`."""
+        counter = self.counter_at(start)
+        prev = counter - (1 if self.toss(start - 1) else -1) if start else counter
+        stats = WalkStats(counter, prev)
+        for data, n in self.blocks(start, stop):
+            stats.update(data, n)
+        return stats.summary()
+
+    def verify(self) -> bool:
+        """Rescan the whole file and check every index entry against the data."""
+        counter = self._index(0)
+        if counter != 0:
+            return False
+        for block, (data, n) in enumerate(self.blocks(0, None, self.block), 1):
+            counter += _counter_delta(data, n)
+            if counter != self._index(block):
+                return False
+        return True
+
+    def close(self) -> None:
+        if not self._mm.closed:
+            self._mm.close()
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def record(path: str, flips: int, seed=None, engine: str | None = None, block: int = DEFAULT_BLOCK) -> Dict[str, Any]:
+    """Toss `flips` coins into a new toss file; returns their `WalkStats` summary."""
+    stats = WalkStats()
+    with TossWriter(path, block) as w:
+        for data, n in toss_blocks(flips, seed, engine=engine):
+            w.write(data, n)
+            stats.update(data, n)
+    return stats.summary()
+
+
+def benchmark(path: str = "tosses.bin", flips: int = 100_000_000, seed=0, lookups=100_000):
+    """Record `flips` tosses, then time random `counter_at` lookups against a replay."""
+    import random
+
+    t0 = time.perf_counter()
+    summary = record(path, flips, seed)
+    print(f"recorded {flips:,} tosses in {time.perf_counter() - t0:.2f} s "
+          f"({os.path.getsize(path):,} bytes)")
+    with TossFile(path) as tf:
+        rnd = random.Random(seed)
+        points = [rnd.randrange(flips + 1) for _ in range(lookups)]
+        t0 = time.perf_counter()
+        for i in points:
+            tf.counter_at(i)
+        elapsed = time.perf_counter() - t0
+        print(f"{lookups:,} counter_at lookups in {elapsed:.2f} s ({elapsed / lookups * 1e6:.1f} us each)")
+        t0 = time.perf_counter()
+        replay = tf.stats()
+        print(f"full replay in {time.perf_counter() - t0:.2f} s; matches recording: {replay == summary}")
+        assert tf.counter_at(flips) == summary["counter"]
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    # python toss_file.py record PATH FLIPS [SEED]
+    # python toss_file.py counter PATH INDEX [INDEX ...]
+    # python toss_file.py stats|verify PATH
+    if len(sys.argv) < 3:
+        benchmark()
+        sys.exit(0)
+    command, path = sys.argv[1], sys.argv[2]
+    if command == "record":
+        summary = record(path, int(sys.argv[3]), int(sys.argv[4]) if len(sys.argv) > 4 else None)
+        for k, v in summary.items():
+            print(f"{k}: {v}")
+    else:
+        with TossFile(path) as tf:
+            if command == "counter":
+                for arg in sys.argv[3:]:
+                    print(f"{arg}\t{tf.counter_at(int(arg))}")
+            elif command == "stats":
+                for k, v in tf.stats().items():
+                    print(f"{k}: {v}")
+            elif command == "verify":
+                ok = tf.verify()
+                print("ok" if ok else "index does not match the data")
+                sys.exit(0 if ok else 1)
+            else:
+                sys.exit(f"Unknown command {command!r}; use record, counter, stats or verify")